@@ -0,0 +1,37 @@
+"""
+Measures UnitDTO.to_dict through the precomputed field tables against the previous implementation, which collected
+the attributes with fields() and camelCased every name on every call, for bulk Address, FullName and Counterparty
+payloads, and the encoding of a list of them by the default JSON backend.
+
+    python -m benchmarks.camel_case_encoding
+"""
+import timeit
+from unit.models import Address, FullName, Counterparty, fields, to_camel_case
+from unit.utils import json_backend
+
+
+def previous_to_dict(obj):
+    return dict((to_camel_case(k), val) for k, val in fields(obj).items() if val is not None)
+
+
+def per_call(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def main():
+    models = [Address("1600 Pennsylvania Avenue Northwest", "Washington", "CA", "20500", "US"),
+              FullName("Peter", "Parker"),
+              Counterparty("812345678", "1000", "Checking", "Jane Doe")]
+    for model in models:
+        assert model.to_dict() == previous_to_dict(model)
+        previous = per_call(lambda: previous_to_dict(model), 50000)
+        current = per_call(model.to_dict, 50000)
+        print(f"{type(model).__name__}: to_dict {previous * 1e6:.2f} us -> {current * 1e6:.2f} us")
+
+    payload = models * 1000
+    encode = per_call(lambda: json_backend.dumps(payload), 20)
+    print(f"{json_backend.backend}: encode {len(payload)} models {encode * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
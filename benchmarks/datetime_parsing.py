@@ -0,0 +1,50 @@
+"""
+Compares the strptime based to_datetime with the ISO-8601 fast path, on raw timestamps and on decoding
+100k transactions.
+
+    python -m benchmarks.datetime_parsing
+"""
+import time
+from datetime import datetime
+from unit.utils import date_utils
+from unit.models.codecs import DtoDecoder
+from e2e_tests.helpers.fixtures import transactions
+
+
+def strptime_to_datetime(dt: str):
+    # the previous implementation, extended to timestamps without a fraction so it can decode every fixture
+    if dt is None:
+        return None
+
+    return datetime.strptime(dt, "%Y-%m-%dT%H:%M:%S.%f%z" if "." in dt else "%Y-%m-%dT%H:%M:%S%z")
+
+
+def measure(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(count: int = 100000):
+    payload = transactions(count)
+    timestamps = [t["attributes"]["createdAt"] for t in payload]
+    fast_to_datetime = date_utils.to_datetime
+
+    before = measure(lambda: [strptime_to_datetime(t) for t in timestamps])
+    after = measure(lambda: [fast_to_datetime(t) for t in timestamps])
+    hand_written = measure(lambda: [date_utils.parse_iso_datetime(t) for t in timestamps])
+    print(f"parse {count} timestamps: strptime {before:.3f}s, fast path {after:.3f}s ({before / after:.1f}x), "
+          f"hand-written parser {hand_written:.3f}s ({before / hand_written:.1f}x)")
+
+    date_utils.to_datetime = strptime_to_datetime
+    try:
+        before = measure(DtoDecoder.decode, payload)
+    finally:
+        date_utils.to_datetime = fast_to_datetime
+    after = measure(DtoDecoder.decode, payload)
+    print(f"decode {count} transactions: strptime {count / before:,.0f}/s, fast path {count / after:,.0f}/s "
+          f"({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Measures the per-object cost of DtoDecoder.decode on large arrays: transactions, and objects of an unregistered
+type, which decode to a bare RawUnitObject so nearly all of their cost is decoder overhead.
+
+    python -m benchmarks.decoding_overhead
+"""
+import timeit
+from unit.models.codecs import DtoDecoder
+from e2e_tests.helpers.fixtures import transactions
+
+
+def raw_objects(count: int):
+    return [{"type": "customObject", "id": str(i), "attributes": {"name": f"Object {i}"},
+             "relationships": {"account": {"data": {"type": "account", "id": "10001"}}}} for i in range(count)]
+
+
+def main():
+    count = 10000
+    for name, payload in (("transactions", transactions(count)), ("raw objects", raw_objects(count))):
+        seconds = min(timeit.repeat(lambda: DtoDecoder.decode(payload), number=5, repeat=5)) / 5
+        print(f"{count} {name}: {seconds / count * 1e6:.2f} us per object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Measures the speedup of get_many over serial gets against a slow local API, which waits 20 ms before answering,
+for concurrency levels up to the connection pool size.
+
+    python -m benchmarks.get_many
+"""
+import time
+from unit import Unit
+from unit.api.transport import RequestsTransport
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+
+def main():
+    count = 64
+    numbers = [f"{i:09d}" for i in range(count)]
+    with LocalApi() as api:
+        for number in numbers:
+            api.route("GET", f"/institutions/{number}", payload=institution_api_response, delay=0.02)
+        with Unit(api.url, "token", transport=RequestsTransport(pool_maxsize=16)) as client:
+            serial = None
+            for concurrency in (1, 2, 4, 8, 16):
+                start = time.perf_counter()
+                client.institutions.get_many(numbers, concurrency=concurrency)
+                seconds = time.perf_counter() - start
+                serial = serial or seconds
+                print(f"concurrency {concurrency:2d}: {seconds * 1000:.0f} ms, {serial / seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Measures the cold start of a client in fresh interpreters: importing unit, building a Unit and first touching one
+of its resources. e2e_tests/import_time_test.py guards the import time.
+
+    python -m benchmarks.import_time
+"""
+import json
+import subprocess
+import sys
+
+CODE = """
+import json, time
+start = time.perf_counter()
+import unit
+imported = time.perf_counter()
+client = unit.Unit("http://localhost", "token")
+built = time.perf_counter()
+client.payments
+print(json.dumps([imported - start, built - imported, time.perf_counter() - built]))
+"""
+
+
+def main():
+    runs = [json.loads(subprocess.run([sys.executable, "-c", CODE], check=True, capture_output=True,
+                                      text=True).stdout) for _ in range(5)]
+    imported, built, resource = (min(column) for column in zip(*runs))
+    print(f"import unit {imported * 1000:.1f} ms, Unit() {built * 1000:.1f} ms, "
+          f"first resource {resource * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
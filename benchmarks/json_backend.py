@@ -0,0 +1,42 @@
+"""
+Compares the JSON backends installed: encoding a CreateBookPaymentRequest the way BaseResource.post does, and
+decoding transaction pages from bytes, both the bare parse and the whole to_unit_response pipeline.
+The previous stdlib path, json.dumps with UnitEncoder, is included for reference.
+
+    python -m benchmarks.json_backend
+"""
+import json
+import timeit
+from unit.api.base_resource import to_unit_response
+from unit.models import Relationship
+from unit.models.codecs import UnitEncoder
+from unit.models.payment import CreateBookPaymentRequest
+from unit.utils import json_backend
+from benchmarks.response_parsing import build_response
+
+
+def per_call(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def main():
+    request = CreateBookPaymentRequest(1000, "Rent", {"account": Relationship("depositAccount", "10001"),
+                                                      "counterpartyAccount": Relationship("depositAccount", "10002")},
+                                       idempotency_key="rent-2022-10", tags={"purpose": "rent"})
+    response = build_response(1000)
+    encode = per_call(lambda: json.dumps(request.to_json_api(), cls=UnitEncoder), 20000)
+    print(f"UnitEncoder: encode payment {encode * 1e6:.1f} us")
+
+    default = json_backend.backend
+    for name in json_backend.backends:
+        json_backend.use(name)
+        encode = per_call(lambda: json_backend.dumps(request.to_json_api()), 20000)
+        parse = per_call(lambda: json_backend.loads(response.content), 20)
+        decode = per_call(lambda: to_unit_response(response), 5)
+        print(f"{name}: encode payment {encode * 1e6:.1f} us, parse 1000 transactions {parse * 1000:.1f} ms, "
+              f"to_unit_response {decode * 1000:.1f} ms")
+    json_backend.use(default)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Compares eager DTO decoding of a transaction page with lazy decoding, when only id and amount are read.
+
+    python -m benchmarks.lazy_decoding
+"""
+import timeit
+from unit.models.codecs import DtoDecoder
+from e2e_tests.helpers.fixtures import transactions
+
+
+def read_amounts(payload, lazy: bool):
+    return [(t.id, t.attributes["amount"]) for t in DtoDecoder.decode(payload, lazy)]
+
+
+def main():
+    for count in (100, 1000):
+        payload = transactions(count)
+        number = max(1, 5000 // count)
+        eager = timeit.timeit(lambda: read_amounts(payload, False), number=number) / number
+        lazy = timeit.timeit(lambda: read_amounts(payload, True), number=number) / number
+        print(f"{count} transactions: eager {eager * 1000:.2f} ms, lazy {lazy * 1000:.2f} ms "
+              f"({eager / lazy:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
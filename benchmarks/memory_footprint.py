@@ -0,0 +1,43 @@
+"""
+Measures the bytes held per decoded transaction, the DTO with its attributes, relationships, dates and nested
+objects, excluding the raw JSON payload it was decoded from.
+
+__slots__ only remove the instance __dict__ of the DTOs: every decoded DTO still holds its own attributes dict,
+the largest part of what is left, which is reported separately. Lazy decoding is the way to avoid it for large
+lists whose attributes are mostly not read.
+
+    python -m benchmarks.memory_footprint
+"""
+import gc
+import sys
+import tracemalloc
+from unit.models.codecs import DtoDecoder
+from e2e_tests.helpers.fixtures import transactions
+
+
+def bytes_per_transaction(payload, lazy: bool = False) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    decoded = DtoDecoder.decode(payload, lazy)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(decoded) == len(payload)
+    return (after - before) / len(payload)
+
+
+def attributes_bytes_per_transaction(payload) -> float:
+    decoded = DtoDecoder.decode(payload)
+    return sum(sys.getsizeof(t.attributes) for t in decoded) / len(decoded)
+
+
+def main():
+    for count in (1000, 10000):
+        payload = transactions(count)
+        print(f"{count} transactions: {bytes_per_transaction(payload):.0f} bytes per decoded transaction "
+              f"({attributes_bytes_per_transaction(payload):.0f} for its attributes dict alone), "
+              f"{bytes_per_transaction(payload, lazy=True):.0f} bytes per lazily decoded transaction")
+
+
+if __name__ == "__main__":
+    main()
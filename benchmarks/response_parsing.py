@@ -0,0 +1,49 @@
+"""
+Compares decoding a large list response the old way, calling response.json() for data and again for included,
+with BaseResource's single-parse pipeline.
+
+    python -m benchmarks.response_parsing
+"""
+import json
+import timeit
+import requests
+from unit.api.base_resource import to_unit_response
+from unit.models import UnitResponse
+from unit.models.codecs import DtoDecoder
+from e2e_tests.helpers.fixtures import transaction_page
+
+
+def build_response(count: int) -> requests.Response:
+    page = transaction_page(count)
+    page["included"] = [{"type": "depositAccount", "id": str(10000 + i),
+                         "attributes": {"createdAt": "2022-10-13T16:01:19.346Z", "name": f"Account {i}",
+                                        "depositProduct": "checking", "routingNumber": "812345678",
+                                        "accountNumber": "1000000001", "currency": "USD", "balance": 10000,
+                                        "hold": 0, "available": 10000, "status": "Open"},
+                         "relationships": {"customer": {"data": {"type": "customer", "id": "20001"}}}}
+                        for i in range(count // 10)]
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(page).encode()
+    return response
+
+
+def parse_repeatedly(response):
+    data = response.json().get("data")
+    included = response.json().get("included")
+    return UnitResponse(DtoDecoder.decode(data), DtoDecoder.decode(included), response.json().get("meta"))
+
+
+def main():
+    for count in (100, 1000):
+        response = build_response(count)
+        number = max(1, 2000 // count)
+        before = timeit.timeit(lambda: parse_repeatedly(response), number=number) / number
+        after = timeit.timeit(lambda: to_unit_response(response), number=number) / number
+        print(f"{count} transactions, {len(response.content) / 1024:.0f} KiB: "
+              f"repeated parsing {before * 1000:.2f} ms, single parse {after * 1000:.2f} ms "
+              f"({(1 - after / before) * 100:.0f}% faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Measures routing number lookups in an offline RoutingIndex of 30000 institutions, about the size of the ABA
+routing number directory, and the ABA checksum that rejects invalid numbers without a lookup.
+
+    python -m benchmarks.routing_index
+"""
+import os
+import tempfile
+import timeit
+from unit.api.routing_index import RoutingIndex, is_valid_routing_number
+from unit.models.institution import InstitutionDTO
+
+
+def routing_number(i: int) -> str:
+    digits = f"{i * 7919 % 10 ** 8:08d}"
+    d = [int(c) for c in digits]
+    check = -(3 * (d[0] + d[3] + d[6]) + 7 * (d[1] + d[4] + d[7]) + d[2] + d[5]) % 10
+    return digits + str(check)
+
+
+def main():
+    count = 30000
+    numbers = [routing_number(i) for i in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        index = RoutingIndex(os.path.join(directory, "routing.idx"))
+        index.update(InstitutionDTO(n, f"Bank {n}", True, i % 2 == 0, {"city": "Fargo", "state": "ND"})
+                     for i, n in enumerate(numbers))
+        print(f"{count} institutions: {os.path.getsize(index.path) / count:.1f} bytes each")
+
+        for name, call in (("checksum", lambda: is_valid_routing_number(numbers[1234])),
+                           ("hit", lambda: index.lookup(numbers[1234])),
+                           ("miss", lambda: index.lookup("000000000"))):
+            seconds = min(timeit.repeat(call, number=10000, repeat=5)) / 10000
+            print(f"{name}: {seconds * 1e6:.2f} us")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Compares the from_json_api and to_json_api generated from the field schemas of unit.models.schema with the
+hand-written versions they replaced: decoding the transactions of benchmarks.response_parsing through their
+constructors, as the previous decoders did, and encoding an inline ACH payment request.
+
+    python -m benchmarks.schema_codegen
+"""
+import timeit
+from unit.models import Counterparty, Merchant, Coordinates, Relationship
+from unit.models.payment import CreateInlinePaymentRequest
+from unit.models.transaction import BookTransactionDTO, PurchaseTransactionDTO, FeeTransactionDTO
+from unit.utils import date_utils, json_backend
+from e2e_tests.helpers.fixtures import transactions
+
+
+def hand_written_book(_id, _type, attributes, relationships):
+    return BookTransactionDTO(
+        _id, date_utils.to_datetime(attributes["createdAt"]), attributes["direction"],
+        attributes["amount"], attributes["balance"], attributes["summary"],
+        Counterparty.from_json_api(attributes["counterparty"]), attributes.get("tags"), relationships)
+
+
+def hand_written_purchase(_id, _type, attributes, relationships):
+    return PurchaseTransactionDTO(
+        _id, date_utils.to_datetime(attributes["createdAt"]), attributes["direction"],
+        attributes["amount"], attributes["balance"], attributes["summary"], attributes["cardLast4Digits"],
+        Merchant.from_json_api(attributes["merchant"]), Coordinates.from_json_api(attributes.get("coordinates")),
+        attributes["recurring"], attributes.get("interchange"), attributes.get("ecommerce"),
+        attributes.get("cardPresent"), attributes.get("paymentMethod"), attributes.get("digitalWallet"),
+        attributes.get("cardVerificationData"), attributes.get("cardNetwork"), attributes.get("tags"),
+        relationships)
+
+
+def hand_written_fee(_id, _type, attributes, relationships):
+    return FeeTransactionDTO(_id, date_utils.to_datetime(attributes["createdAt"]), attributes["direction"],
+                             attributes["amount"], attributes["balance"], attributes["summary"],
+                             attributes.get("tags"), relationships)
+
+
+def hand_written_inline_payment(request: CreateInlinePaymentRequest):
+    payload = {
+        "data": {
+            "type": request.type,
+            "attributes": {
+                "amount": request.amount,
+                "direction": request.direction,
+                "description": request.description
+            },
+            "relationships": request.relationships
+        }
+    }
+    if request.idempotency_key:
+        payload["data"]["attributes"]["idempotencyKey"] = request.idempotency_key
+    if request.tags:
+        payload["data"]["attributes"]["tags"] = request.tags
+    payload["data"]["attributes"]["counterparty"] = request.counterparty
+    payload["data"]["attributes"]["sameDay"] = request.same_day
+    if request.addenda:
+        payload["data"]["attributes"]["addenda"] = request.addenda
+
+    return payload
+
+
+def per_call(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def decode_all(payloads, decoders):
+    return [decoders[p["type"]](p["id"], p["type"], p["attributes"], None) for p in payloads]
+
+
+def main():
+    payloads = transactions(3000)
+    generated = {"bookTransaction": BookTransactionDTO.from_json_api,
+                 "purchaseTransaction": PurchaseTransactionDTO.from_json_api,
+                 "feeTransaction": FeeTransactionDTO.from_json_api}
+    hand_written = {"bookTransaction": hand_written_book, "purchaseTransaction": hand_written_purchase,
+                    "feeTransaction": hand_written_fee}
+    for _type, decoder in generated.items():
+        sample = next(p for p in payloads if p["type"] == _type)
+        assert json_backend.dumps(decoder("1", _type, sample["attributes"], None).attributes) == \
+            json_backend.dumps(hand_written[_type]("1", _type, sample["attributes"], None).attributes)
+
+    previous = per_call(lambda: decode_all(payloads, hand_written), 5)
+    current = per_call(lambda: decode_all(payloads, generated), 5)
+    print(f"decode {len(payloads)} transactions: hand-written {previous * 1000:.1f} ms, "
+          f"generated {current * 1000:.1f} ms")
+
+    request = CreateInlinePaymentRequest(1000, "Rent", Counterparty("812345678", "1000", "Checking", "Jane Doe"),
+                                         {"account": Relationship("depositAccount", "10001")}, addenda="April",
+                                         idempotency_key="rent-2022-04", tags={"purpose": "rent"})
+    assert json_backend.dumps(request.to_json_api()) == json_backend.dumps(hand_written_inline_payment(request))
+    previous = per_call(lambda: hand_written_inline_payment(request), 100000)
+    current = per_call(request.to_json_api, 100000)
+    print(f"encode inline payment: hand-written {previous * 1e6:.2f} us, generated {current * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Measures the peak memory and time of fetching a 16 MiB PDF statement from a local server: as text by
+statements.get, or streamed to a file with a sha256 checksum by statements.download.
+
+    python -m benchmarks.statement_download
+"""
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from unit import Unit
+from unit.models.statement import GetStatementParams
+from e2e_tests.helpers.local_server import LocalApi
+
+SIZE = 16 * 1024 * 1024
+
+
+def measure(fetch):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    fetch()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, seconds
+
+
+def main():
+    pdf = b"%PDF-1.7\n" + bytes(range(256)) * (SIZE // 256)
+    with LocalApi() as api, tempfile.TemporaryDirectory() as directory, Unit(api.url, "token") as client:
+        api.route("GET", "/statements/1/pdf", payload=pdf, headers={"Content-Type": "application/pdf"})
+        params = GetStatementParams("1", "pdf")
+        path = os.path.join(directory, "statement.pdf")
+        for name, fetch in (("get", lambda: client.statements.get(params)),
+                            ("download", lambda: client.statements.download(params, path, "sha256"))):
+            peak, seconds = measure(fetch)
+            print(f"{name:>8}: peak {peak / 2 ** 20:6.1f} MiB, {seconds * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Measures the peak memory of decoding a 1000 transaction page with its included accounts and customers, from
+a body received in 64 KiB chunks: buffered and parsed as a whole by to_unit_response, or parsed incrementally by
+ListStream while the DTOs are consumed one by one.
+
+    python -m benchmarks.streaming_decode
+"""
+import gc
+import json
+import time
+import tracemalloc
+from unit.api.base_resource import ListStream, to_unit_response
+from e2e_tests.helpers.fixtures import transaction_page
+
+
+class ChunkedResponse(object):
+    """
+    A received body, handed out in chunks the way a streamed response is.
+    """
+    status_code = 200
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def iter_content(self, chunk_size: int):
+        return (self.body[i:i + chunk_size] for i in range(0, len(self.body), chunk_size))
+
+    @property
+    def content(self):
+        return b"".join(self.iter_content(64 * 1024))
+
+    def close(self):
+        pass
+
+
+def buffered(response):
+    return len(to_unit_response(response).data)
+
+
+def streamed(response):
+    return sum(1 for _ in ListStream(lambda: response))
+
+
+def measure(decode, body: bytes):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = decode(ChunkedResponse(body))
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert count == 1000
+    return peak, seconds
+
+
+def main():
+    payload = transaction_page(1000)
+    payload["included"] = [{"type": "customer", "id": str(20000 + i),
+                            "attributes": {"fullName": {"first": "Peter", "last": "Parker"}}} for i in range(100)]
+    body = json.dumps(payload).encode()
+    print(f"body: {len(body) / 1024:.0f} KiB")
+    for name, decode in (("buffered", buffered), ("streamed", streamed)):
+        peak, seconds = measure(decode, body)
+        print(f"{name}: peak {peak / 1024:.0f} KiB, {seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import asyncio
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.models import UnitError
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+
+def test_async_client_mirrors_every_resource():
+    sync_client = Unit("https://api.s.unit.sh", "token")
+    async_client = AsyncUnit("https://api.s.unit.sh", "token")
+
+    for name, resource in vars(sync_client).items():
+        if hasattr(resource, "resource"):
+            async_resource = getattr(async_client, name)
+            assert async_resource.resource == resource.resource
+            assert async_resource.transport is async_client.transport
+            for method in [m for m in vars(type(resource)) if not m.startswith("_")]:
+                assert hasattr(async_resource, method)
+
+    asyncio.run(async_client.close())
+
+
+def test_concurrent_calls_share_connection_pool():
+    async def fan_out(url):
+        async with AsyncUnit(url, "token", transport=HttpxTransport(max_connections=4)) as client:
+            return await asyncio.gather(*[client.institutions.get("053285241") for _ in range(40)])
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response, delay=0.01)
+        responses = asyncio.run(fan_out(api.url))
+
+        assert len(api.requests) == 40
+        assert len(api.connections) <= 4
+
+    for response in responses:
+        assert response.data.attributes["routingNumber"] == "053285241"
+
+
+def test_async_error_response_and_query_params():
+    async def get_bank_verification(url):
+        async with AsyncUnit(url, "token") as client:
+            return await client.statements.get_bank_verification("10001", True)
+
+    with LocalApi() as api:
+        api.route("GET", "/statements/10001/bank/pdf", status=404,
+                  payload={"errors": [{"title": "Not Found", "status": "404", "detail": "no account"}]})
+        response = asyncio.run(get_bank_verification(api.url))
+
+        assert isinstance(response, UnitError)
+        assert response.errors[0].detail == "no account"
+        assert api.requests[0]["params"] == {"includeProofOfFunds": "True"}
@@ -0,0 +1,51 @@
+import json
+import requests
+from unit.api.base_resource import to_unit_response
+from unit.models import UnitResponse, UnitError
+from e2e_tests.helpers.fixtures import transaction_page
+
+
+class CountingResponse(requests.Response):
+    def __init__(self, status_code: int, body):
+        super().__init__()
+        self.status_code = status_code
+        self._content = json.dumps(body).encode()
+        self.parsed = 0
+
+    @property
+    def content(self):
+        self.parsed += 1
+        return self._content
+
+
+def test_response_is_parsed_once():
+    page = transaction_page(30, total=90)
+    page["included"] = [{"type": "depositAccount", "id": "10001", "attributes": {
+        "createdAt": "2022-10-13T16:01:19.346Z", "name": "Checking", "depositProduct": "checking",
+        "routingNumber": "812345678", "accountNumber": "1000000001", "currency": "USD", "balance": 10000,
+        "hold": 0, "available": 10000, "status": "Open"}}]
+    response = CountingResponse(200, page)
+
+    unit_response = to_unit_response(response)
+
+    assert response.parsed == 1
+    assert len(unit_response.data) == 30
+    assert unit_response.included[0].id == "10001"
+    assert unit_response.meta["pagination"]["total"] == 90
+
+
+def test_error_response_is_parsed_once():
+    response = CountingResponse(429, {"errors": [{"title": "Too Many Requests", "status": "429"}]})
+
+    error = to_unit_response(response)
+
+    assert response.parsed == 1
+    assert isinstance(error, UnitError)
+    assert error.errors[0].title == "Too Many Requests"
+
+
+def test_success_statuses():
+    body = {"data": None, "errors": []}
+
+    assert isinstance(to_unit_response(CountingResponse(202, body)), UnitError)
+    assert isinstance(to_unit_response(CountingResponse(202, body), success_statuses=range(200, 400)), UnitResponse)
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.api.exceptions import UnitTimeoutException
+from unit.api.rate_limit import RateLimiter
+from unit.api.timeout import Timeout
+from unit.api.transport import RequestsTransport
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.get_many_test import route_institutions, routing_numbers
+
+
+def test_batch_collects_successes_errors_and_exceptions():
+    progress = []
+
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers[:2])
+        route_institutions(api, routing_numbers[2:3], delay=0.5)
+        with Unit(api.url, "token") as client:
+            with client.batch(concurrency=4, on_progress=lambda done, total, result: progress.append(done)) as batch:
+                batch.add(client.institutions.get, routing_numbers[0])
+                batch.add(client.institutions.get, "000000000")
+                batch.add(client.institutions.with_timeout(Timeout(read=0.1)).get, routing_numbers[2])
+                batch.add(client.institutions.get, routing_numbers[1])
+
+            results = batch.results
+            assert len(results) == 4
+            assert [r.index for r in results.successes] == [0, 3]
+            assert results[3].value.data.attributes["routingNumber"] == routing_numbers[1]
+            assert [r.index for r in results.errors] == [1]
+            assert [r.index for r in results.exceptions] == [2]
+            assert isinstance(results[2].value, UnitTimeoutException)
+            assert progress == [1, 2, 3, 4]
+
+
+def test_batch_runs_calls_concurrently():
+    def run(client, concurrency: int):
+        batch = client.batch(concurrency=concurrency)
+        for number in routing_numbers:
+            batch.add(client.institutions.get, number)
+
+        start = time.monotonic()
+        results = batch.run()
+        assert not batch.queue
+        return time.monotonic() - start, results
+
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers, delay=0.2)
+        with Unit(api.url, "token", transport=RequestsTransport(pool_maxsize=8)) as client:
+            sequential, _ = run(client, 1)
+            concurrent, results = run(client, 8)
+
+            # relative to a sequential run on the same machine, so that a loaded one doesn't fail it
+            assert concurrent < sequential / 2
+            assert len(results.successes) == len(routing_numbers)
+
+
+def test_batch_respects_the_rate_limit():
+    limiter = RateLimiter(rate=20, burst=1)
+
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers)
+        with Unit(api.url, "token", transport=RequestsTransport(rate_limiter=limiter)) as client:
+            batch = client.batch(concurrency=8)
+            for number in routing_numbers:
+                batch.add(client.institutions.get, number)
+
+            start = time.monotonic()
+            batch.run()
+
+            assert time.monotonic() - start >= (len(routing_numbers) - 1) / 20 * 0.9
+
+
+def test_async_batch():
+    progress = []
+
+    async def run(url):
+        async with AsyncUnit(url, "token") as client:
+            async with client.batch(on_progress=lambda done, total, result: progress.append(total)) as batch:
+                for number in routing_numbers[:3]:
+                    batch.add(client.institutions.get, number)
+            return batch.results
+
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers[:2], delay=0.1)
+        results = asyncio.run(run(api.url))
+
+        assert [r.index for r in results.successes] == [0, 1]
+        assert [r.index for r in results.errors] == [2]
+        assert progress == [3, 3, 3]
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.cache import ResponseCache, MemoryCache, SqliteCache
+from unit.api.transport import RequestsTransport
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+
+def test_institution_is_cached():
+    cache = ResponseCache()
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with Unit(api.url, "token", transport=RequestsTransport(cache=cache)) as client:
+            first = client.institutions.get("053285241")
+            second = client.institutions.get("053285241")
+
+            assert len(api.requests) == 1
+            assert second.data.attributes == first.data.attributes
+            assert cache.stats("institutions").hits == 1
+            assert cache.stats().misses == 1
+
+            cache.invalidate("institutions/053285241")
+            client.institutions.get("053285241")
+            assert len(api.requests) == 2
+
+
+def test_clients_with_different_tokens_dont_share_responses():
+    cache = ResponseCache()
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with RequestsTransport(cache=cache) as transport:
+            Unit(api.url, "org token", transport=transport).institutions.get("053285241")
+            Unit(api.url, "customer token", transport=transport).institutions.get("053285241")
+            Unit(api.url, "org token", transport=transport).institutions.get("053285241")
+
+            assert [r["headers"]["authorization"] for r in api.requests] == ["Bearer org token",
+                                                                             "Bearer customer token"]
+            assert not any("token" in key for key in cache.backend.entries)
+
+
+def test_cached_response_expires():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        cache = ResponseCache(ttls={"institutions": 0.1})
+        with Unit(api.url, "token", transport=RequestsTransport(cache=cache)) as client:
+            client.institutions.get("053285241")
+            client.institutions.get("053285241")
+            time.sleep(0.15)
+            client.institutions.get("053285241")
+
+            assert len(api.requests) == 2
+
+
+def test_errors_are_not_cached():
+    with LocalApi() as api:
+        with Unit(api.url, "token", transport=RequestsTransport(cache=ResponseCache())) as client:
+            client.institutions.get("053285241")
+            client.institutions.get("053285241")
+
+            assert len(api.requests) == 2
+
+
+def test_memory_cache_is_bounded():
+    cache = MemoryCache(max_entries=2, max_bytes=10)
+    cache.set("institutions/1?", b"1", 60)
+    cache.set("institutions/2?", b"2", 60)
+    cache.get("institutions/1?")
+    cache.set("institutions/3?", b"3", 60)
+
+    assert cache.get("institutions/2?") is None
+    assert cache.get("institutions/1?") == b"1"
+
+    cache.set("institutions/4?", b"0123456789", 60)
+    assert list(cache.entries) == ["institutions/4?"]
+
+
+def test_invalidation_by_prefix():
+    cache = MemoryCache()
+    for key in ["cards/1/secure-data/pin/status?", "cards/12/secure-data/pin/status?", "institutions/1?"]:
+        cache.set(key, b"{}", 60)
+
+    cache.delete("cards/1")
+    assert sorted(cache.entries) == ["cards/12/secure-data/pin/status?", "institutions/1?"]
+
+
+def test_sqlite_cache_is_shared_between_processes(tmp_path):
+    path = os.path.join(tmp_path, "cache.db")
+    code = f"from unit.api.cache import SqliteCache; SqliteCache({path!r}).set('institutions/1?', b'shared', 60)"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+    cache = SqliteCache(path, max_entries=2)
+    assert cache.get("institutions/1?") == b"shared"
+
+    cache.set("institutions/2?", b"2", 60)
+    cache.set("institutions/3?", b"3", 60)
+    assert cache.get("institutions/1?") is None
+
+    cache.delete("institutions")
+    assert cache.get("institutions/3?") is None
+    cache.close()
+
+
+def test_async_institution_is_cached():
+    cache = ResponseCache()
+
+    async def get_twice(url):
+        async with AsyncUnit(url, "token", transport=HttpxTransport(cache=cache)) as client:
+            await client.institutions.get("053285241")
+            return await client.institutions.get("053285241")
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        response = asyncio.run(get_twice(api.url))
+
+        assert len(api.requests) == 1
+        assert response.data.attributes["routingNumber"] == "053285241"
@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+import time
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from unit.api.exceptions import UnitCircuitOpenException, UnitTimeoutException
+from unit.api.timeout import Timeout
+from unit.api.transport import RequestsTransport
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+unavailable = {"errors": [{"title": "Service Unavailable", "status": "503"}]}
+
+
+class StubResponse(object):
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+def test_circuit_opens_and_recovers():
+    transitions = []
+    breaker = CircuitBreaker(failure_threshold=3, cool_down=0.1, on_state_change=lambda *t: transitions.append(t))
+
+    for _ in range(3):
+        breaker.before_call("payments")
+        breaker.record("payments", StubResponse(503))
+    assert breaker.state("payments") == OPEN
+    with pytest.raises(UnitCircuitOpenException) as e:
+        breaker.before_call("payments")
+    assert e.value.family == "payments" and 0 < e.value.retry_in <= 0.1
+    breaker.before_call("transactions")
+
+    time.sleep(0.1)
+    breaker.before_call("payments")
+    assert breaker.state("payments") == HALF_OPEN
+    with pytest.raises(UnitCircuitOpenException):
+        breaker.before_call("payments")
+    breaker.record("payments", StubResponse(201))
+
+    assert breaker.state("payments") == CLOSED
+    assert transitions == [("payments", CLOSED, OPEN), ("payments", OPEN, HALF_OPEN), ("payments", HALF_OPEN, CLOSED)]
+
+
+def test_failed_trial_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, cool_down=0.05)
+    breaker.record("payments", error=UnitTimeoutException())
+    time.sleep(0.05)
+
+    breaker.before_call("payments")
+    breaker.record("payments", StubResponse(500))
+
+    assert breaker.state("payments") == OPEN
+    with pytest.raises(UnitCircuitOpenException):
+        breaker.before_call("payments")
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2)
+    for status in (503, 200, 503, 429, 404):
+        breaker.record("payments", StubResponse(status))
+
+    assert breaker.state("payments") == CLOSED
+
+
+def test_open_circuit_sheds_calls():
+    breaker = CircuitBreaker(failure_threshold=2, cool_down=60)
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", status=503, payload=unavailable)
+        api.route("GET", "/institutions/812345678", payload=institution_api_response, delay=0.5)
+        transport = RequestsTransport(circuit_breaker=breaker, timeout=Timeout(read=0.1))
+        client = Unit(api.url, "token", transport=transport)
+
+        client.institutions.get("053285241")
+        with pytest.raises(UnitTimeoutException):
+            client.institutions.get("812345678")
+        with pytest.raises(UnitCircuitOpenException):
+            client.institutions.get("053285241")
+
+        assert len(api.requests) == 2
+        assert breaker.circuit("institutions").rejected == 1
+
+
+def test_async_open_circuit_sheds_calls():
+    async def get_all(url):
+        transport = HttpxTransport(circuit_breaker=CircuitBreaker(failure_threshold=1, cool_down=60))
+        async with AsyncUnit(url, "token", transport=transport) as client:
+            await client.institutions.get("053285241")
+            await client.institutions.get("053285241")
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", status=503, payload=unavailable)
+
+        with pytest.raises(UnitCircuitOpenException):
+            asyncio.run(get_all(api.url))
+        assert len(api.requests) == 1
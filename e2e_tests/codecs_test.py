@@ -0,0 +1,51 @@
+from unit.models import RawUnitObject, Relationship
+from unit.models.codecs import DtoDecoder, mappings, decoders, register_decoder, without_relationships
+from unit.models.transaction import BookTransactionDTO
+from e2e_tests.helpers.fixtures import transactions
+
+
+class BudgetDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
+    def __init__(self, _id, _type, attributes, relationships):
+        self.id = _id
+        self.type = _type
+        self.attributes = attributes
+        self.relationships = relationships
+
+
+def test_every_mapping_has_a_decoder():
+    assert decoders.keys() == mappings.keys()
+
+
+def test_decode_array():
+    decoded = DtoDecoder.decode(transactions(30))
+
+    assert [d.id for d in decoded] == [t["id"] for t in transactions(30)]
+    assert isinstance(decoded[0], BookTransactionDTO)
+    assert decoded[0].relationships["payment"].id == "300000"
+
+
+def test_unregistered_type_decodes_to_raw_object():
+    budget = {"type": "budget", "id": "1", "attributes": {"amount": 100},
+              "relationships": {"account": {"data": {"type": "account", "id": "10001"}}}}
+
+    decoded = DtoDecoder.decode(budget)
+
+    assert isinstance(decoded, RawUnitObject)
+    assert isinstance(decoded.relationships["account"], Relationship)
+
+
+def test_register_decoder():
+    budget = {"type": "budgetTest", "id": "1", "attributes": {"amount": 100},
+              "relationships": {"account": {"data": {"type": "account", "id": "10001"}}}}
+
+    register_decoder("budgetTest", BudgetDTO)
+    decoded = DtoDecoder.decode([budget])[0]
+    assert isinstance(decoded, BudgetDTO)
+    assert decoded.relationships["account"].id == "10001"
+    assert isinstance(DtoDecoder.decode(budget, lazy=True).materialize(), BudgetDTO)
+
+    register_decoder("budgetTest", BudgetDTO, relationships=False)
+    assert DtoDecoder.decode(budget).relationships is None
+    assert "budgetTest" in without_relationships
@@ -0,0 +1,40 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unit.utils.date_utils import to_datetime, parse_iso_datetime
+
+timestamps = [
+    ("2022-10-13T16:01:19.346Z", datetime(2022, 10, 13, 16, 1, 19, 346000, timezone.utc)),
+    ("2022-10-13T16:01:19Z", datetime(2022, 10, 13, 16, 1, 19, 0, timezone.utc)),
+    ("2022-10-13T16:01:19.3Z", datetime(2022, 10, 13, 16, 1, 19, 300000, timezone.utc)),
+    ("2022-10-13T16:01:19.34612Z", datetime(2022, 10, 13, 16, 1, 19, 346120, timezone.utc)),
+    ("2022-10-13T16:01:19.346123789Z", datetime(2022, 10, 13, 16, 1, 19, 346123, timezone.utc)),
+    ("2022-10-13T16:01:19.346+00:00", datetime(2022, 10, 13, 16, 1, 19, 346000, timezone.utc)),
+    ("2022-10-13T16:01:19.346-05:00", datetime(2022, 10, 13, 16, 1, 19, 346000, timezone(timedelta(hours=-5)))),
+    ("2022-10-13T16:01:19.346+0530", datetime(2022, 10, 13, 16, 1, 19, 346000,
+                                              timezone(timedelta(hours=5, minutes=30)))),
+    ("2022-10-13t16:01:19.346z", datetime(2022, 10, 13, 16, 1, 19, 346000, timezone.utc)),
+]
+
+
+@pytest.mark.parametrize("timestamp, expected", timestamps)
+def test_to_datetime(timestamp, expected):
+    assert to_datetime(timestamp) == expected
+    assert to_datetime(timestamp).utcoffset() == expected.utcoffset()
+    assert parse_iso_datetime(timestamp) == expected
+
+
+def test_to_datetime_matches_strptime():
+    timestamp = "2022-02-10T17:56:49.235Z"
+    assert to_datetime(timestamp) == datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
+    assert to_datetime(None) is None
+
+
+@pytest.mark.parametrize("timestamp", ["2022-10-13", "2022-10-13T16:01:19", "2022-10-13T16:01:19.Z",
+                                       "2022-10-13T16:01:19.346", "2022-1a-13T16:01:19.346Z",
+                                       "2022-10-13T16:01:19.346+5", "2022-10-13T16:01Z", "2022-10-13T16:01:19,346Z",
+                                       "20221013T160119Z", "2022-W41-4T16:01:19Z", "2022-10-13T16:01:19.346+05"])
+def test_invalid_timestamps(timestamp):
+    with pytest.raises(ValueError):
+        parse_iso_datetime(timestamp)
+    with pytest.raises(ValueError):
+        to_datetime(timestamp)
@@ -0,0 +1,88 @@
+import asyncio
+import copy
+import time
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.api.exceptions import UnitTimeoutException
+from unit.api.timeout import Timeout
+from unit.api.transport import RequestsTransport
+from unit.models import UnitResponse, UnitError
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+routing_numbers = ["053285241", "091311229", "021000021", "011000015", "026009593", "121000358", "322271627",
+                   "111000025"]
+
+
+def route_institutions(api: LocalApi, numbers, delay: float = 0):
+    for number in numbers:
+        payload = copy.deepcopy(institution_api_response)
+        payload["data"]["attributes"]["routingNumber"] = number
+        api.route("GET", f"/institutions/{number}", payload=payload, delay=delay)
+
+
+def test_results_keep_the_order_of_ids():
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers[1:])
+        with Unit(api.url, "token") as client:
+            responses = client.institutions.get_many(routing_numbers, concurrency=4)
+
+            assert len(responses) == len(routing_numbers)
+            assert isinstance(responses[0], UnitError)
+            assert responses[0].errors[0].status == "404"
+            for number, response in zip(routing_numbers[1:], responses[1:]):
+                assert isinstance(response, UnitResponse)
+                assert response.data.attributes["routingNumber"] == number
+
+
+def test_calls_run_concurrently():
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers, delay=0.2)
+        with Unit(api.url, "token", transport=RequestsTransport(pool_maxsize=8)) as client:
+            start = time.monotonic()
+            client.institutions.get_many(routing_numbers, concurrency=1)
+            sequential = time.monotonic() - start
+
+            start = time.monotonic()
+            responses = client.institutions.get_many(routing_numbers, concurrency=8)
+
+            # relative to a sequential run on the same machine, so that a loaded one doesn't fail it
+            assert time.monotonic() - start < sequential / 2
+            assert all(isinstance(response, UnitResponse) for response in responses)
+
+
+def test_exceptions_are_returned_per_id():
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers[:1])
+        route_institutions(api, routing_numbers[1:2], delay=0.5)
+        with Unit(api.url, "token") as client:
+            responses = client.institutions.with_timeout(Timeout(read=0.1)).get_many(routing_numbers[:2])
+
+            assert isinstance(responses[0], UnitResponse)
+            assert isinstance(responses[1], UnitTimeoutException)
+
+
+def test_only_resources_getting_an_id_have_get_many():
+    for client in (Unit("https://api.s.unit.sh", "token"), AsyncUnit("https://api.s.unit.sh", "token")):
+        assert hasattr(client.accounts, "get_many") and hasattr(client.institutions, "get_many")
+        assert not hasattr(client.fees, "get_many") and not hasattr(client.statements, "get_many")
+
+
+def test_async_results_keep_the_order_of_ids():
+    async def get_many(url):
+        async with AsyncUnit(url, "token") as client:
+            start = time.monotonic()
+            await client.institutions.get_many(routing_numbers, concurrency=1)
+            sequential = time.monotonic() - start
+
+            start = time.monotonic()
+            responses = await client.institutions.get_many(routing_numbers, concurrency=8)
+            return responses, time.monotonic() - start, sequential
+
+    with LocalApi() as api:
+        route_institutions(api, routing_numbers[1:], delay=0.2)
+        responses, seconds, sequential = asyncio.run(get_many(api.url))
+
+        assert seconds < sequential / 2
+        assert isinstance(responses[0], UnitError)
+        assert [r.data.attributes["routingNumber"] for r in responses[1:]] == routing_numbers[1:]
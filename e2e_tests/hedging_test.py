@@ -0,0 +1,191 @@
+import asyncio
+import itertools
+import threading
+import time
+import pytest
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.hedging import Hedging
+from unit.api.rate_limit import RateLimiter
+from unit.api.transport import RequestsTransport
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+
+def slow_first_call(delay: float):
+    calls = itertools.count()
+
+    def handler(request):
+        if next(calls) == 0:
+            time.sleep(delay)
+        return 200, institution_api_response, {}
+
+    return handler
+
+
+def test_slow_get_is_hedged():
+    hedging = Hedging(delay=0.05)
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", slow_first_call(0.5))
+        with Unit(api.url, "token", transport=RequestsTransport(hedging=hedging)) as client:
+            start = time.monotonic()
+            response = client.institutions.get("053285241")
+
+            assert time.monotonic() - start < 0.3
+            assert response.data.attributes["routingNumber"] == "053285241"
+            assert len(api.requests) == 2
+            assert hedging.hedged == 1
+
+
+def test_fast_get_is_not_hedged():
+    hedging = Hedging(delay=0.2)
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with Unit(api.url, "token", transport=RequestsTransport(hedging=hedging)) as client:
+            for _ in range(5):
+                client.institutions.get("053285241")
+
+            assert len(api.requests) == 5
+            assert hedging.hedged == 0
+
+
+def test_hedges_are_capped_by_the_budget():
+    hedging = Hedging(delay=0.001, max_extra_load=0.1)
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response, delay=0.01)
+        with Unit(api.url, "token", transport=RequestsTransport(hedging=hedging)) as client:
+            for _ in range(20):
+                client.institutions.get("053285241")
+
+            assert 1 <= hedging.hedged <= 3
+            assert len(api.requests) == 20 + hedging.hedged
+
+
+def test_delay_follows_observed_latency():
+    hedging = Hedging(quantile=0.95, min_samples=20)
+    for _ in range(19):
+        hedging.observe("accounts", 0.1)
+    assert hedging.delay_for("accounts") is None
+
+    hedging.observe("accounts", 0.1)
+    assert hedging.delay_for("accounts") == 0.1
+
+    for _ in range(30):
+        hedging.observe("accounts", 0.5)
+    assert hedging.delay_for("accounts") == 0.5
+    assert hedging.delay_for("cards") is None
+
+def test_async_slow_get_is_hedged():
+    async def get(url):
+        async with AsyncUnit(url, "token", transport=HttpxTransport(hedging=Hedging(delay=0.05))) as client:
+            start = time.monotonic()
+            await client.institutions.get("053285241")
+            return time.monotonic() - start
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", slow_first_call(0.5))
+
+        assert asyncio.run(get(api.url)) < 0.3
+        assert len(api.requests) == 2
+
+
+def test_gets_are_not_capped_by_the_hedging_workers():
+    hedging = Hedging(delay=1, max_workers=2)
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def handler(request):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.2)
+        with lock:
+            running[0] -= 1
+        return 200, institution_api_response, {}
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", handler)
+        with Unit(api.url, "token", transport=RequestsTransport(hedging=hedging)) as client:
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                list(executor.map(lambda _: client.institutions.get("053285241"), range(6)))
+
+            assert running[1] == 6
+            assert hedging.busy == 0
+
+
+def test_hedges_take_a_rate_limiter_token():
+    hedging = Hedging(delay=0.05)
+    limiter = RateLimiter(rate=0.1, burst=1)
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", slow_first_call(0.3))
+        with Unit(api.url, "token", transport=RequestsTransport(hedging=hedging, rate_limiter=limiter)) as client:
+            response = client.institutions.get("053285241")
+
+            assert response.data.attributes["routingNumber"] == "053285241"
+            assert len(api.requests) == 1
+            assert hedging.hedged == 0
+            assert hedging.credits == 1.0 + hedging.max_extra_load
+
+
+class QueuingExecutor(ThreadPoolExecutor):
+    """
+    Runs the first call it's given and leaves the others queued, as when every thread is between tasks.
+    """
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers)
+        self.submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        if self.submitted == 1:
+            return super().submit(fn, *args, **kwargs)
+        return Future()
+
+
+def test_queued_hedge_that_loses_gives_its_worker_back():
+    hedging = Hedging(delay=0.05)
+    hedging.executor = QueuingExecutor(hedging.max_workers)
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", slow_first_call(0.2))
+        with Unit(api.url, "token", transport=RequestsTransport(hedging=hedging)) as client:
+            response = client.institutions.get("053285241")
+
+            assert response.data.attributes["routingNumber"] == "053285241"
+            assert hedging.executor.submitted == 2
+            assert len(api.requests) == 1
+            assert hedging.busy == 0
+            assert hedging.hedged == 0
+            assert hedging.credits == 1.0 + hedging.max_extra_load
+
+
+def test_calls_queued_when_closed_are_not_sent():
+    hedging = Hedging(delay=0.05, max_workers=2)
+    assert hedging.reserve_worker() and hedging.reserve_worker()
+    hedging.executor = ThreadPoolExecutor(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    sent = []
+
+    def first():
+        started.set()
+        release.wait()
+
+    running = hedging.submit(first)
+    queued = hedging.submit(lambda: sent.append(True))
+    started.wait()
+    hedging.close()
+    release.set()
+
+    running.result()
+    with pytest.raises(CancelledError):
+        queued.result()
+    assert sent == []
+    assert hedging.busy == 0
+    assert not hedging.reserve_worker()
@@ -0,0 +1,87 @@
+from typing import Dict, List
+
+
+def book_transaction(i: int) -> Dict:
+    return {
+        "type": "bookTransaction",
+        "id": str(100000 + i),
+        "attributes": {
+            "createdAt": f"2022-10-{1 + i % 28:02d}T16:01:{i % 60:02d}.{i % 1000:03d}Z",
+            "amount": 1000 + i,
+            "direction": "Credit" if i % 2 else "Debit",
+            "balance": 500000 + i,
+            "summary": f"Book payment {i}",
+            "counterparty": {
+                "name": "April Oniel",
+                "routingNumber": "812345678",
+                "accountNumber": "1000000001",
+                "accountType": "Checking"
+            },
+            "tags": {"purpose": "test"}
+        },
+        "relationships": {
+            "account": {"data": {"type": "account", "id": "10001"}},
+            "customer": {"data": {"type": "customer", "id": "20001"}},
+            "payment": {"data": {"type": "payment", "id": str(300000 + i)}}
+        }
+    }
+
+
+def purchase_transaction(i: int) -> Dict:
+    return {
+        "type": "purchaseTransaction",
+        "id": str(200000 + i),
+        "attributes": {
+            "createdAt": f"2022-11-{1 + i % 28:02d}T08:15:{i % 60:02d}.{i % 1000:06d}+00:00",
+            "amount": 2500 + i,
+            "direction": "Debit",
+            "balance": 400000 - i,
+            "summary": "Apple Inc.",
+            "cardLast4Digits": "0019",
+            "merchant": {"name": "Apple Inc.", "type": 1000, "category": "Electronics", "location": "Cupertino, CA"},
+            "coordinates": {"longitude": -77.0364, "latitude": 38.8951},
+            "recurring": False,
+            "interchange": 12,
+            "ecommerce": True,
+            "cardPresent": False,
+            "paymentMethod": "Manual",
+            "digitalWallet": "Apple",
+            "cardNetwork": "Visa"
+        },
+        "relationships": {
+            "account": {"data": {"type": "account", "id": "10001"}},
+            "customer": {"data": {"type": "customer", "id": "20001"}},
+            "card": {"data": {"type": "card", "id": "30001"}},
+            "authorization": {"data": {"type": "authorization", "id": str(400000 + i)}}
+        }
+    }
+
+
+def fee_transaction(i: int) -> Dict:
+    return {
+        "type": "feeTransaction",
+        "id": str(300000 + i),
+        "attributes": {
+            "createdAt": f"2022-12-{1 + i % 28:02d}T23:59:{i % 60:02d}Z",
+            "amount": 100,
+            "direction": "Debit",
+            "balance": 100000 - i,
+            "summary": "Monthly fee"
+        },
+        "relationships": {
+            "account": {"data": {"type": "account", "id": "10001"}},
+            "customer": {"data": {"type": "customer", "id": "20001"}}
+        }
+    }
+
+
+def transactions(count: int, offset: int = 0) -> List[Dict]:
+    makers = [book_transaction, purchase_transaction, fee_transaction]
+    return [makers[i % len(makers)](i) for i in range(offset, offset + count)]
+
+
+def transaction_page(count: int, offset: int = 0, total: int = None) -> Dict:
+    return {
+        "data": transactions(count, offset),
+        "meta": {"pagination": {"total": total if total is not None else count, "limit": count, "offset": offset}}
+    }
@@ -0,0 +1,89 @@
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+
+class LocalApi(object):
+    """
+    In-process HTTP/1.1 server used to exercise the SDK's HTTP layer without the sandbox API.
+    Routes map (method, path) to a handler that receives the request and returns (status, body, headers).
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], Callable] = {}
+        self.requests = []
+        self.connections = set()
+        self.lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def handle_any(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                request = {"method": self.command, "path": url.path, "params": dict(parse_qsl(url.query)),
+                           "headers": dict(self.headers), "body": body}
+                with api.lock:
+                    api.requests.append(request)
+                    api.connections.add(self.client_address)
+
+                handler = api.routes.get((self.command, url.path))
+                if handler is None:
+                    status, payload, headers = 404, {"errors": [{"title": "Not Found", "status": "404"}]}, {}
+                else:
+                    status, payload, headers = handler(request)
+
+                if isinstance(payload, (bytes, bytearray)):
+                    raw = bytes(payload)
+                else:
+                    raw = json.dumps(payload).encode() if payload is not None else b""
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", headers.pop("Content-Type", "application/vnd.api+json"))
+                    self.send_header("Content-Length", str(len(raw)))
+                    for k, v in headers.items():
+                        self.send_header(k, v)
+                    self.end_headers()
+                    self.wfile.write(raw)
+                except (BrokenPipeError, ConnectionResetError):
+                    # the client gave up waiting, e.g. after a timeout
+                    self.close_connection = True
+
+            do_GET = do_POST = do_PATCH = do_DELETE = do_PUT = handle_any
+
+        class Server(ThreadingHTTPServer):
+            def handle_error(self, request, client_address):
+                # clients closing their connection, e.g. the loser of a hedged request, aren't errors
+                if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+                    super().handle_error(request, client_address)
+
+        self.server = Server(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def route(self, method: str, path: str, handler: Optional[Callable] = None, status: int = 200, payload=None,
+              headers: Optional[Dict[str, str]] = None, delay: float = 0):
+        def default_handler(request):
+            if delay:
+                time.sleep(delay)
+            return status, payload, dict(headers or {})
+
+        self.routes[(method, path)] = handler or default_handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
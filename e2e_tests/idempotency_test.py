@@ -0,0 +1,92 @@
+import asyncio
+import itertools
+import json
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.idempotency import new_idempotency_key, with_idempotency_key
+from unit.api.retry import RetryPolicy
+from unit.api.transport import RequestsTransport
+from unit.models import Relationship, UnitResponse, UnitError
+from unit.models.payment import CreateBookPaymentRequest
+from e2e_tests.helpers.local_server import LocalApi
+
+unavailable = {"errors": [{"title": "Service Unavailable", "status": "503"}]}
+created = {"data": {"type": "payment", "id": "1", "attributes": {"amount": 1000}}}
+
+
+def fails_twice():
+    attempts = itertools.count()
+
+    def handler(request):
+        if next(attempts) < 2:
+            return 503, unavailable, {}
+        return 201, created, {}
+
+    return handler
+
+
+def book_payment(idempotency_key=None) -> CreateBookPaymentRequest:
+    return CreateBookPaymentRequest(1000, "Rent", {"account": Relationship("depositAccount", "10001"),
+                                                   "counterpartyAccount": Relationship("depositAccount", "10002")},
+                                    idempotency_key=idempotency_key)
+
+
+def sent_keys(api: LocalApi):
+    return [json.loads(r["body"])["data"]["attributes"].get("idempotencyKey") for r in api.requests]
+
+
+def no_wait(max_tries: int) -> RetryPolicy:
+    return RetryPolicy(max_tries=max_tries, base=0, jitter=None)
+
+
+def test_with_idempotency_key():
+    payload = book_payment().to_json_api()
+    keyed, idempotent = with_idempotency_key(payload, lambda: "key-1")
+
+    assert idempotent and keyed["data"]["attributes"]["idempotencyKey"] == "key-1"
+    assert "idempotencyKey" not in payload["data"]["attributes"]
+    assert keyed["data"]["relationships"] is payload["data"]["relationships"]
+    assert with_idempotency_key(payload) == (payload, False)
+    assert with_idempotency_key(book_payment("own").to_json_api(), lambda: "key-1")[0]["data"]["attributes"][
+        "idempotencyKey"] == "own"
+    assert with_idempotency_key(None, new_idempotency_key) == (None, False)
+    assert new_idempotency_key() != new_idempotency_key()
+
+
+def test_creates_without_a_key_are_not_retried():
+    with LocalApi() as api:
+        api.route("POST", "/payments", fails_twice())
+        with Unit(api.url, "token", retries=no_wait(3)) as client:
+            assert isinstance(client.payments.create(book_payment()), UnitError)
+
+        assert sent_keys(api) == [None]
+
+
+def test_generated_key_is_kept_across_retries():
+    keys = (f"key-{i}" for i in itertools.count())
+    with LocalApi() as api:
+        api.route("POST", "/payments", fails_twice())
+        transport = RequestsTransport(idempotency_keys=lambda: next(keys))
+        with Unit(api.url, "token", retries=no_wait(3), transport=transport) as client:
+            assert isinstance(client.payments.create(book_payment()), UnitResponse)
+            client.payments.create(book_payment("own"))
+
+        transport.close()
+        assert sent_keys(api) == ["key-0", "key-0", "key-0", "own"]
+
+
+def test_async_generated_key_is_kept_across_retries():
+    async def create(url):
+        transport = HttpxTransport(idempotency_keys=new_idempotency_key)
+        async with AsyncUnit(url, "token", retries=no_wait(3), transport=transport) as client:
+            response = await client.payments.create(book_payment())
+        await transport.close()
+        return response
+
+    with LocalApi() as api:
+        api.route("POST", "/payments", fails_twice())
+
+        assert isinstance(asyncio.run(create(api.url)), UnitResponse)
+        keys = sent_keys(api)
+        assert len(keys) == 3 and keys[0] is not None and len(set(keys)) == 1
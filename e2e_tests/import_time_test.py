@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+
+# everything import unit may load: it took ~200 ms when it loaded every resource, model and requests, and
+# benchmarks/import_time.py measures it, this keeps the test independent of the speed of the machine
+IMPORTED_BY_UNIT = {"unit", "unit.api", "unit.api.exceptions", "unit.api.timeout", "unit.api.transport", "unit.models",
+                    "unit.utils", "unit.utils.lazy", "_datetime", "datetime", "_json", "json", "json.decoder",
+                    "json.encoder", "json.scanner"}
+
+
+def run(code: str):
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def loaded_after(statements: str):
+    return set(run(f"import sys, json\n{statements}\nprint(json.dumps(sorted(sys.modules)))"))
+
+
+def test_import_loads_no_resource_model_or_http_library():
+    modules = loaded_after("import unit, unit.aio")
+
+    assert not [m for m in modules if m.endswith("_resource")]
+    assert "unit.models.codecs" not in modules and "unit.models.transaction" not in modules
+    assert not {"requests", "httpx", "backoff", "asyncio", "sqlite3"} & modules
+
+
+def test_only_the_resources_used_are_imported():
+    modules = loaded_after("import unit\nclient = unit.Unit('http://localhost', 'token')\n"
+                           "assert client.payments is client.payments\nclient.institutions")
+
+    assert sorted(m for m in modules if m.endswith("_resource")) == ["unit.api.base_resource",
+                                                                     "unit.api.institution_resource",
+                                                                     "unit.api.payment_resource"]
+    assert "backoff" not in modules
+
+
+def test_resources_and_batch_are_importable_from_the_package():
+    from unit import PaymentResource, Batch
+    from unit.aio import AsyncPaymentResource, AsyncBatch
+    from unit.api.payment_resource import PaymentResource as Resource
+
+    assert PaymentResource is Resource
+    assert Batch.__name__ == "Batch" and AsyncBatch.__name__ == "AsyncBatch"
+    assert AsyncPaymentResource.__module__ == "unit.aio.payment_resource"
+
+
+def test_import_loads_only_the_client_core():
+    modules = run("import sys, json\nbefore = set(sys.modules)\nimport unit\n"
+                  "print(json.dumps(sorted(set(sys.modules) - before)))")
+
+    assert set(modules) <= IMPORTED_BY_UNIT
+    assert "unit" in modules
@@ -0,0 +1,77 @@
+import json
+from datetime import date, datetime, timezone
+import pytest
+from unit import Unit
+from unit.models import Address, Relationship
+from unit.models.codecs import UnitEncoder
+from unit.models.payment import CreateBookPaymentRequest
+from unit.utils import json_backend
+from e2e_tests.helpers.local_server import LocalApi
+
+
+@pytest.fixture(params=list(json_backend.backends))
+def backend(request):
+    previous = json_backend.backend
+    json_backend.use(request.param)
+    yield request.param
+    json_backend.use(previous)
+
+
+def test_dates_and_models_are_encoded(backend):
+    payload = {"createdAt": datetime(2022, 10, 13, 16, 1, 19, 346000, tzinfo=timezone.utc),
+               "dateOfBirth": date(2001, 8, 10),
+               "address": Address("5230 Newell Rd", "Palo Alto", "CA", "94303", "US"),
+               "customer": Relationship("customer", "10001"),
+               "note": "é/ü"}
+
+    assert json.loads(json_backend.dumps(payload)) == {
+        "createdAt": "2022-10-13T16:01:19.346000+00:00",
+        "dateOfBirth": "2001-08-10",
+        "address": {"street": "5230 Newell Rd", "city": "Palo Alto", "state": "CA", "postalCode": "94303",
+                    "country": "US"},
+        "customer": {"data": {"type": "customer", "id": "10001"}},
+        "note": "é/ü"}
+
+
+def test_unknown_objects_are_rejected(backend):
+    with pytest.raises(TypeError):
+        json_backend.dumps({"value": object()})
+
+
+def test_bytes_are_decoded(backend):
+    assert json_backend.loads('{"name": "Zoë", "amount": 1000}'.encode()) == {"name": "Zoë", "amount": 1000}
+
+
+def test_payment_request_body(backend):
+    request = CreateBookPaymentRequest(1000, "Rent", {"account": Relationship("depositAccount", "10001"),
+                                                      "counterpartyAccount": Relationship("depositAccount", "10002")},
+                                       idempotency_key="rent-2022-10")
+    response = {"data": {"type": "bookPayment", "id": "300001", "attributes": {
+        "createdAt": "2022-10-13T16:01:19.346Z", "amount": 1000, "direction": "Credit", "description": "Rent",
+        "status": "Sent"}, "relationships": {"account": {"data": {"type": "account", "id": "10001"}}}}}
+
+    with LocalApi() as api:
+        api.route("POST", "/payments", status=201, payload=response)
+        with Unit(api.url, "token") as client:
+            payment = client.payments.create(request)
+
+            assert payment.data.id == "300001"
+            expected = json.loads(json.dumps(request.to_json_api(), cls=UnitEncoder))
+            assert json.loads(api.requests[0]["body"]) == expected
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        json_backend.use("simplejson")
+
+
+def test_ujson_without_default_is_left_out():
+    class OldUjson(object):
+        @staticmethod
+        def dumps(obj, **kwargs):
+            if "default" in kwargs:
+                raise TypeError("'default' is an invalid keyword argument for this function")
+            return json.dumps(obj)
+
+    assert not json_backend.accepts_default(OldUjson)
+    assert json_backend.accepts_default(json)
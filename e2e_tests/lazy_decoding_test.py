@@ -0,0 +1,54 @@
+from unit import Unit
+from unit.models.codecs import DtoDecoder, LazyDTO
+from unit.models.transaction import ListTransactionParams
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.helpers.fixtures import transaction_page, transactions
+
+
+def test_lazy_dto_matches_eager_dto():
+    payload = transactions(30)
+
+    for lazy, eager in zip(DtoDecoder.decode(payload, lazy=True), DtoDecoder.decode(payload)):
+        assert isinstance(lazy, LazyDTO)
+        assert lazy.id == eager.id and lazy.type == eager.type
+        assert list(lazy.attributes) == list(eager.attributes)
+        assert lazy.attributes["amount"] == eager.attributes["amount"]
+        assert lazy.relationships.keys() == eager.relationships.keys()
+        assert lazy.relationships["account"].id == eager.relationships["account"].id
+        assert lazy.attributes["createdAt"] == eager.attributes["createdAt"]
+        assert type(lazy.materialize()) is type(eager)
+
+
+def test_lazy_dto_decodes_on_first_access():
+    dto = DtoDecoder.decode(transactions(1)[0], lazy=True)
+
+    assert dto.id == "100000"
+    assert dto.attributes["amount"] == 1000
+    assert dto.attributes["summary"] == "Book payment 0"
+    assert dto._dto is None
+
+    counterparty = dto.attributes["counterparty"]
+    assert counterparty.routing_number == "812345678"
+    assert dto.attributes["createdAt"].year == 2022
+    assert dto.attributes["counterparty"] is counterparty
+    assert dto.materialize() is dto.materialize()
+    assert dto.relationships is dto.materialize().relationships
+
+
+def test_lazy_list_and_iter_all():
+    def handler(request):
+        offset = int(request["params"]["page[offset]"])
+        return 200, transaction_page(max(0, min(10, 15 - offset)), offset, 15), {}
+
+    with LocalApi() as api:
+        api.route("GET", "/transactions", handler)
+        client = Unit(api.url, "token")
+
+        response = client.transactions.list(ListTransactionParams(limit=10), lazy=True)
+        assert all(isinstance(t, LazyDTO) for t in response.data)
+        assert [t.attributes["amount"] for t in response.data] == [t.attributes["amount"] for t in
+                                                                    client.transactions.list().data]
+
+        lazy = list(client.transactions.iter_all(ListTransactionParams(limit=10), lazy=True))
+        assert len(lazy) == 15
+        assert all(isinstance(t, LazyDTO) for t in lazy)
@@ -0,0 +1,63 @@
+import inspect
+import importlib
+import pkgutil
+import unit.models
+from unit.models import Address, FullName, Relationship, Counterparty, RawUnitObject, field_table
+from unit.models.codecs import DtoDecoder
+from e2e_tests.helpers.fixtures import transactions
+
+
+def test_every_model_is_slotted():
+    for module in pkgutil.iter_modules(unit.models.__path__):
+        if module.name == "codecs":
+            continue
+
+        module = importlib.import_module(f"unit.models.{module.name}")
+        for name, cls in vars(module).items():
+            if inspect.isclass(cls) and cls.__module__ == module.__name__:
+                assert "__slots__" in vars(cls), name
+
+
+def test_decoded_transactions_have_no_instance_dict():
+    for transaction in DtoDecoder.decode(transactions(30)):
+        assert not hasattr(transaction, "__dict__")
+        for relationship in transaction.relationships.values():
+            assert not hasattr(relationship, "__dict__")
+
+
+def test_to_dict_of_slotted_dto():
+    address = Address("1600 Pennsylvania Avenue Northwest", "Washington", "CA", "20500", "US")
+
+    assert address.to_dict() == {"street": "1600 Pennsylvania Avenue Northwest", "city": "Washington",
+                                 "state": "CA", "postalCode": "20500", "country": "US"}
+    assert FullName("Peter", "Parker").to_dict() == {"first": "Peter", "last": "Parker"}
+    assert Relationship("account", "10001").to_dict() == {"data": {"type": "account", "id": "10001"}}
+
+
+def test_to_dict_skips_none_and_keeps_instance_attributes():
+    class Extended(Address):
+        def __init__(self, *args, apartment_number=None):
+            super().__init__(*args)
+            self.apartment_number = apartment_number
+
+    assert Counterparty("812345678", "1000", "Checking", "Jane Doe").to_dict() == {
+        "routingNumber": "812345678", "accountNumber": "1000", "accountType": "Checking", "name": "Jane Doe"}
+    assert Address("1 Main St", "Austin", "TX", "73301", "US", street2=None).to_dict() == {
+        "street": "1 Main St", "city": "Austin", "state": "TX", "postalCode": "73301", "country": "US"}
+    assert Extended("1 Main St", "Austin", "TX", "73301", "US", apartment_number="4B").to_dict() == {
+        "apartmentNumber": "4B", "street": "1 Main St", "city": "Austin", "state": "TX", "postalCode": "73301",
+        "country": "US"}
+
+
+def test_field_table_is_computed_once_per_class():
+    table = field_table(Counterparty)
+
+    assert table is field_table(Counterparty)
+    assert table == (("routing_number", "routingNumber"), ("account_number", "accountNumber"),
+                     ("account_type", "accountType"), ("name", "name"))
+
+
+def test_to_dict_of_raw_unit_object():
+    raw = RawUnitObject("1", "achPayment", {"routing_number": "812345678", "description": None}, {})
+
+    assert raw.to_dict() == {"routingNumber": "812345678"}
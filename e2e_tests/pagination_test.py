@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.api.exceptions import UnitErrorException
+from unit.models.transaction import ListTransactionParams
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.helpers.fixtures import transaction_page
+
+
+def serve_transactions(api: LocalApi, total: int, report_total: bool = True):
+    def handler(request):
+        offset = int(request["params"]["page[offset]"])
+        limit = int(request["params"]["page[limit]"])
+        page = transaction_page(max(0, min(limit, total - offset)), offset, total)
+        if not report_total:
+            del page["meta"]
+        return 200, page, {}
+
+    api.route("GET", "/transactions", handler)
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_all_transactions(prefetch):
+    with LocalApi() as api:
+        serve_transactions(api, 25)
+        client = Unit(api.url, "token")
+        transactions = list(client.transactions.iter_all(ListTransactionParams(limit=10), prefetch=prefetch))
+
+        assert [t.id for t in transactions] == [t["id"] for t in transaction_page(25)["data"]]
+        assert [r["params"]["page[offset]"] for r in api.requests] == ["0", "10", "20"]
+
+
+def test_stopping_early_drops_the_prefetched_page():
+    with LocalApi() as api:
+        serve_transactions(api, 50)
+        client = Unit(api.url, "token")
+        transactions = client.transactions.iter_all(ListTransactionParams(limit=10), prefetch=True)
+        first = [next(transactions) for _ in range(5)]
+        transactions.close()
+
+        assert [t.id for t in first] == [t["id"] for t in transaction_page(5)["data"]]
+        assert len(api.requests) <= 2
+
+
+def test_iter_all_without_pagination_meta():
+    with LocalApi() as api:
+        serve_transactions(api, 20, report_total=False)
+        client = Unit(api.url, "token")
+        transactions = list(client.transactions.iter_all(ListTransactionParams(limit=10)))
+
+        assert len(transactions) == 20
+        assert len(api.requests) == 3
+
+
+def test_iter_all_is_lazy():
+    with LocalApi() as api:
+        serve_transactions(api, 1000)
+        client = Unit(api.url, "token")
+        transactions = client.transactions.iter_all(ListTransactionParams(limit=10, offset=100))
+
+        assert len(api.requests) == 0
+        assert next(transactions).id == transaction_page(1, 100)["data"][0]["id"]
+        assert len(api.requests) == 1
+        transactions.close()
+
+
+def test_iter_all_raises_on_error():
+    with LocalApi() as api:
+        client = Unit(api.url, "token")
+
+        with pytest.raises(UnitErrorException) as e:
+            list(client.transactions.iter_all())
+
+        assert e.value.error.errors[0].status == "404"
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_async_iter_all_transactions(prefetch):
+    async def iter_all(url):
+        async with AsyncUnit(url, "token") as client:
+            return [t async for t in client.transactions.iter_all(ListTransactionParams(limit=10), prefetch)]
+
+    with LocalApi() as api:
+        serve_transactions(api, 25)
+        transactions = asyncio.run(iter_all(api.url))
+
+        assert len(transactions) == 25
+        assert len(api.requests) == 3
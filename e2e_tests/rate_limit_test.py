@@ -0,0 +1,87 @@
+import asyncio
+from time import monotonic
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.rate_limit import RateLimiter
+from unit.api.transport import RequestsTransport
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+
+class StubResponse(object):
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_token_bucket():
+    limiter = RateLimiter(rate=10, burst=2)
+
+    assert limiter.reserve("payments") == 0
+    assert limiter.reserve("payments") == 0
+    assert 0.09 < limiter.reserve("payments") <= 0.1
+    assert 0.19 < limiter.reserve("payments") <= 0.2
+    assert limiter.reserve("transactions") == 0
+
+
+def test_family_rates():
+    limiter = RateLimiter(rate=10, families={"payments": 2})
+    limiter.reserve("payments")
+    limiter.reserve("payments")
+
+    assert 0.49 < limiter.reserve("payments") <= 0.5
+    assert limiter.bucket("transactions").rate == 10
+
+
+def test_rate_adapts_to_rate_limit_responses():
+    limiter = RateLimiter(rate=8, increase=1, decrease=0.5, min_rate=1)
+
+    limiter.update("payments", StubResponse(429))
+    assert limiter.bucket("payments").rate == 4
+    for _ in range(3):
+        limiter.update("payments", StubResponse(201))
+    assert limiter.bucket("payments").rate == 7
+    for _ in range(3):
+        limiter.update("payments", StubResponse(201))
+    assert limiter.bucket("payments").rate == 8
+
+    for _ in range(5):
+        limiter.update("payments", StubResponse(429))
+    assert limiter.bucket("payments").rate == 1
+
+
+def test_retry_after_pauses_the_family():
+    limiter = RateLimiter(rate=100)
+    limiter.update("payments", StubResponse(429, {"Retry-After": "2"}))
+
+    assert 1.9 < limiter.reserve("payments") <= 2
+    assert limiter.reserve("transactions") == 0
+
+
+def test_client_requests_are_throttled():
+    limiter = RateLimiter(rate=20, burst=1)
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with Unit(api.url, "token", transport=RequestsTransport(rate_limiter=limiter)) as client:
+            start = monotonic()
+            for _ in range(6):
+                client.institutions.get("053285241")
+
+            assert monotonic() - start >= 0.25
+            assert len(api.requests) == 6
+
+
+def test_async_client_requests_are_throttled():
+    async def fan_out(url):
+        transport = HttpxTransport(rate_limiter=RateLimiter(rate=20, burst=1))
+        async with AsyncUnit(url, "token", transport=transport) as client:
+            start = monotonic()
+            await asyncio.gather(*[client.institutions.get("053285241") for _ in range(6)])
+            return monotonic() - start
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+
+        assert asyncio.run(fan_out(api.url)) >= 0.25
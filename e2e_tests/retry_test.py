@@ -0,0 +1,153 @@
+import asyncio
+import itertools
+from email.utils import formatdate
+from time import time
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.retry import RetryPolicy, retry_after
+from unit.api.transport import RequestsTransport
+from unit.models import UnitError
+from e2e_tests.helpers.fixtures import transaction_page
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+unavailable = {"errors": [{"title": "Service Unavailable", "status": "503"}]}
+
+
+class StubResponse(object):
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def no_wait(max_tries: int) -> RetryPolicy:
+    return RetryPolicy(max_tries=max_tries, base=0, jitter=None)
+
+
+def test_clients_keep_their_own_retry_policy():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", status=503, payload=unavailable)
+        batch = Unit(api.url, "token", retries=no_wait(4))
+        latency_sensitive = Unit(api.url, "token", retries=1)
+
+        assert isinstance(latency_sensitive.institutions.get("053285241"), UnitError)
+        assert len(api.requests) == 1
+        assert isinstance(batch.institutions.get("053285241"), UnitError)
+        assert len(api.requests) == 5
+
+
+def test_with_retry_overrides_a_single_call():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", status=503, payload=unavailable)
+        client = Unit(api.url, "token", retries=no_wait(3))
+
+        client.institutions.with_retry(max_tries=1).get("053285241")
+        assert len(api.requests) == 1
+        assert client.institutions.retry_policy.max_tries == 3
+
+        client.institutions.get("053285241")
+        assert len(api.requests) == 4
+
+
+def test_retry_after_is_honored():
+    attempts = []
+
+    def handler(request):
+        attempts.append(time())
+        if len(attempts) == 1:
+            return 429, {"errors": [{"title": "Too Many Requests", "status": "429"}]}, {"Retry-After": "0.3"}
+        return 200, institution_api_response, {}
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", handler)
+        response = Unit(api.url, "token", retries=no_wait(2)).institutions.get("053285241")
+
+        assert response.data.attributes["routingNumber"] == "053285241"
+        assert attempts[1] - attempts[0] >= 0.3
+
+
+def test_wait_schedule():
+    wait = RetryPolicy(max_tries=5, base=1, cap=3, jitter=None).wait()
+    wait.send(None)
+
+    assert [wait.send(StubResponse(503)) for _ in range(4)] == [1, 2, 3, 3]
+    assert wait.send(StubResponse(429, {"Retry-After": "7"})) == 7
+
+
+def test_retry_after():
+    assert retry_after(StubResponse(429, {"Retry-After": "12"})) == 12
+    assert 8 <= retry_after(StubResponse(429, {"Retry-After": formatdate(time() + 10, usegmt=True)})) <= 10
+    assert retry_after(StubResponse(429, {"Retry-After": "soon"})) is None
+    assert retry_after(StubResponse(429)) is None
+
+
+def test_async_retries():
+    async def get(url):
+        async with AsyncUnit(url, "token", retries=no_wait(3)) as client:
+            return await client.institutions.get("053285241")
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", status=503, payload=unavailable)
+
+        assert isinstance(asyncio.run(get(api.url)), UnitError)
+        assert len(api.requests) == 3
+
+
+class RecordingTransport(RequestsTransport):
+    def __init__(self):
+        super().__init__()
+        self.responses = []
+
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        self.responses.append(response)
+        return response
+
+
+class AsyncRecordingTransport(HttpxTransport):
+    def __init__(self):
+        super().__init__()
+        self.responses = []
+
+    async def request(self, *args, **kwargs):
+        response = await super().request(*args, **kwargs)
+        self.responses.append(response)
+        return response
+
+
+def unavailable_twice():
+    calls = itertools.count()
+
+    def handler(request):
+        if next(calls) < 2:
+            return 503, unavailable, {}
+        return 200, transaction_page(3), {}
+
+    return handler
+
+
+def test_retried_streams_are_closed():
+    transport = RecordingTransport()
+
+    with LocalApi() as api:
+        api.route("GET", "/transactions", unavailable_twice())
+        with Unit(api.url, "token", retries=no_wait(3), transport=transport) as client:
+            assert len(list(client.transactions.stream())) == 3
+
+            assert len(transport.responses) == 3
+            assert all(response.raw.closed for response in transport.responses)
+
+
+def test_async_retried_streams_are_closed():
+    async def stream(url, transport):
+        async with AsyncUnit(url, "token", retries=no_wait(3), transport=transport) as client:
+            transactions = [t async for t in client.transactions.stream()]
+            return transactions, [response.is_closed for response in transport.responses]
+
+    with LocalApi() as api:
+        api.route("GET", "/transactions", unavailable_twice())
+        transactions, closed = asyncio.run(stream(api.url, AsyncRecordingTransport()))
+
+        assert len(transactions) == 3
+        assert closed == [True, True, True]
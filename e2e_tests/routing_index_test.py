@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import struct
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.api.routing_index import RoutingIndex, is_valid_routing_number, HEADER, KEY
+from unit.models import UnitError
+from unit.models.institution import InstitutionDTO
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+
+def institutions():
+    return [InstitutionDTO("091311229", "Choice Financial Group", True, True, {"city": "Fargo", "state": "ND"}),
+            InstitutionDTO("021000021", "JPMorgan Chase", True, False),
+            InstitutionDTO("011000015", "Federal Reserve Bank", False, True)]
+
+
+def test_aba_checksum():
+    assert is_valid_routing_number("091311229")
+    assert is_valid_routing_number("053285241")
+    assert not is_valid_routing_number("091311228")
+    assert not is_valid_routing_number("09131122")
+    assert not is_valid_routing_number("09131122a")
+
+
+def test_lookup(tmp_path):
+    index = RoutingIndex(os.path.join(tmp_path, "routing.idx"))
+    assert len(index) == 0
+    assert index.lookup("091311229") is None
+
+    index.update(institutions())
+
+    assert len(index) == 3
+    institution = index.lookup("091311229")
+    assert institution.attributes == {"routingNumber": "091311229", "name": "Choice Financial Group",
+                                      "address": {"city": "Fargo", "state": "ND"}, "isACHSupported": True,
+                                      "isWireSupported": True}
+    assert index.lookup("011000015").attributes["isACHSupported"] is False
+    assert index.lookup("053285241") is None
+    assert "021000021" in index
+
+    reopened = RoutingIndex(index.path)
+    assert reopened.lookup("021000021").attributes["name"] == "JPMorgan Chase"
+    index.close()
+    reopened.close()
+
+
+def test_invalid_routing_numbers_are_rejected_offline(tmp_path):
+    with LocalApi() as api:
+        with Unit(api.url, "token") as client:
+            index = RoutingIndex(os.path.join(tmp_path, "routing.idx"), client.institutions)
+            response = index.get("053285242")
+
+            assert isinstance(response, UnitError)
+            assert response.errors[0].status == "400"
+            assert len(api.requests) == 0
+
+
+def test_misses_fall_back_to_the_api(tmp_path):
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with Unit(api.url, "token") as client:
+            index = RoutingIndex(os.path.join(tmp_path, "routing.idx"), client.institutions)
+            index.update(institutions())
+
+            assert index.get("091311229").data.attributes["name"] == "Choice Financial Group"
+            assert index.get("053285241").data.attributes["name"] == "Unit Bank"
+            assert index.get("053285241").data.attributes["name"] == "Unit Bank"
+            assert len(api.requests) == 1
+
+            index.update(())
+            assert len(index) == 4
+            assert not index.pending
+            assert RoutingIndex(index.path).lookup("053285241").attributes["name"] == "Unit Bank"
+
+
+def test_refresh(tmp_path):
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with Unit(api.url, "token") as client:
+            index = RoutingIndex(os.path.join(tmp_path, "routing.idx"), client.institutions)
+            index.refresh(["053285241", "091311229"])
+
+            assert len(api.requests) == 2
+            assert len(index) == 1
+            assert index.lookup("053285241").attributes["routingNumber"] == "053285241"
+
+
+def test_async_misses_fall_back_to_the_api(tmp_path):
+    async def get(url):
+        async with AsyncUnit(url, "token") as client:
+            index = RoutingIndex(os.path.join(tmp_path, "routing.idx"), client.institutions)
+            await index.get_async("053285241")
+            return await index.get_async("053285241")
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        response = asyncio.run(get(api.url))
+
+        assert response.data.attributes["name"] == "Unit Bank"
+        assert len(api.requests) == 1
+
+
+def test_misses_without_institutions_are_not_found(tmp_path):
+    index = RoutingIndex(os.path.join(tmp_path, "routing.idx"))
+    response = index.get("053285241")
+
+    assert isinstance(response, UnitError)
+    assert response.errors[0].status == "404"
+    assert isinstance(asyncio.run(index.get_async("053285241")), UnitError)
+
+
+def test_large_entries(tmp_path):
+    index = RoutingIndex(os.path.join(tmp_path, "routing.idx"))
+    address = {"street": "x" * 70000}
+    index.update([InstitutionDTO("091311229", "Choice Financial Group", True, True, address)])
+
+    assert index.lookup("091311229").attributes["address"] == address
+    index.close()
+
+
+def test_version_1_index_is_read(tmp_path):
+    path = os.path.join(tmp_path, "routing.idx")
+    value = json.dumps(["JPMorgan Chase", None]).encode()
+    start = HEADER.size + KEY.size + 7
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(b"UNITRTN\x01", 1) + KEY.pack(21000021) + struct.pack("<BIH", 1, start, len(value)) + value)
+
+    index = RoutingIndex(path)
+    assert index.lookup("021000021").attributes["name"] == "JPMorgan Chase"
+    index.update(institutions())
+    assert index.lookup("021000021").attributes["name"] == "JPMorgan Chase"
+    assert len(index) == 3
+    index.close()
@@ -0,0 +1,117 @@
+import json
+import traceback
+import pytest
+from datetime import datetime
+from unit.models import Counterparty, Relationship, UnitDTO
+from unit.models.codecs import DtoDecoder, UnitEncoder
+from unit.models.payment import CreateInlinePaymentRequest, CreateLinkedPaymentRequest, PatchAchPaymentRequest
+from unit.models.schema import json_api_dto, json_api_request, required, optional
+from unit.models.transaction import BookTransactionDTO, DisputeTransactionDTO, FeeTransactionDTO, \
+    RepaidPaymentAdvanceTransactionDTO, RewardTransactionDTO, PatchTransactionRequest
+from e2e_tests.helpers.fixtures import book_transaction
+
+counterparty = {"name": "April Oniel", "routingNumber": "812345678", "accountNumber": "1000000001",
+                "accountType": "Checking"}
+
+
+def test_generated_decoder_matches_constructor():
+    payload = book_transaction(7)
+    decoded = DtoDecoder.decode(payload)
+    attributes = payload["attributes"]
+    constructed = BookTransactionDTO(payload["id"], decoded.attributes["createdAt"], attributes["direction"],
+                                     attributes["amount"], attributes["balance"], attributes["summary"],
+                                     Counterparty.from_json_api(attributes["counterparty"]), attributes["tags"],
+                                     decoded.relationships)
+
+    assert isinstance(decoded, BookTransactionDTO)
+    assert isinstance(decoded.attributes["createdAt"], datetime)
+    assert (decoded.id, decoded.type) == (constructed.id, constructed.type)
+    assert json.dumps(decoded.attributes, cls=UnitEncoder) == json.dumps(constructed.attributes, cls=UnitEncoder)
+    assert list(constructed.attributes) == [field.key for field in BookTransactionDTO.json_api_fields]
+
+
+def test_optional_fields_may_be_missing():
+    attributes = {"createdAt": "2022-10-01T16:01:02Z", "direction": "Credit", "amount": 100, "balance": 200,
+                  "summary": "Reward"}
+    reward = RewardTransactionDTO.from_json_api("1", "rewardTransaction", attributes, None)
+    repaid = RepaidPaymentAdvanceTransactionDTO.from_json_api("2", "repaidPaymentAdvanceTransaction",
+                                                              dict(attributes, reason="Repaid"), None)
+
+    assert reward.attributes["receiverCounterparty"] is None and reward.attributes["tags"] is None
+    assert repaid.attributes["reason"] == "Repaid"
+
+
+def test_missing_required_field_raises_key_error_in_generated_source():
+    payload = book_transaction(1)
+    del payload["attributes"]["summary"]
+
+    try:
+        DtoDecoder.decode(payload)
+        assert False
+    except KeyError as e:
+        assert e.args == ("summary",)
+        assert "attributes['summary']" in "".join(traceback.format_exc())
+
+
+def test_generated_encoder_emits_required_and_truthy_optional_fields():
+    relationships = {"account": Relationship("depositAccount", "10001")}
+    inline = CreateInlinePaymentRequest(1000, "Rent", Counterparty("812345678", "1", "Checking", "Jane"),
+                                        relationships, idempotency_key="rent", tags={})
+    linked = CreateLinkedPaymentRequest(1000, "Rent", relationships, addenda="April",
+                                        verify_counterparty_balance=True, same_day=True)
+
+    assert list(inline.to_json_api()["data"]["attributes"]) == ["amount", "direction", "description",
+                                                                "idempotencyKey", "counterparty", "sameDay"]
+    assert linked.to_json_api() == {"data": {"type": "achPayment", "attributes": {
+        "amount": 1000, "direction": "Credit", "description": "Rent", "sameDay": True, "addenda": "April",
+        "verifyCounterpartyBalance": True}, "relationships": relationships}}
+    assert PatchAchPaymentRequest("1", {"a": "b"}).to_json_api() == \
+        {"data": {"type": "achPayment", "attributes": {"tags": {"a": "b"}}}}
+    assert PatchTransactionRequest("1", "2").to_json_api() == {"data": {"type": "transaction", "attributes": {}}}
+
+
+def test_custom_schema():
+    @json_api_dto("note", required("created_at", datetime.fromisoformat), optional("text"),
+                  optional("author", Counterparty.from_json_api))
+    class NoteDTO(UnitDTO):
+        __slots__ = ("id", "type", "attributes", "relationships")
+
+    @json_api_request(required("text"), optional("pinned"), _type="note", relationships=None)
+    class CreateNoteRequest(object):
+        __slots__ = ("text", "pinned")
+
+        def __init__(self, text: str, pinned: bool = False):
+            self.text = text
+            self.pinned = pinned
+
+    note = NoteDTO.from_json_api("1", "note", {"createdAt": "2022-10-01T16:01:02", "author": counterparty}, None)
+
+    assert note.type == "note" and note.attributes["text"] is None
+    assert note.attributes["author"].routing_number == "812345678"
+    assert CreateNoteRequest("Hi").to_json_api() == {"data": {"type": "note", "attributes": {"text": "Hi"}}}
+    assert CreateNoteRequest("Hi", True).to_json_api()["data"]["attributes"] == {"text": "Hi", "pinned": True}
+
+
+def test_constructor_is_generated_from_the_fields():
+    fee = FeeTransactionDTO("1", datetime(2022, 10, 1), "Debit", 100, 200, "Fee", None, None)
+    dispute = DisputeTransactionDTO("2", datetime(2022, 10, 1), "Credit", 100, 200, "3", "Dispute", "Fraud",
+                                    {"k": "v"}, None)
+
+    assert (fee.id, fee.type, fee.relationships) == ("1", "feeTransaction", None)
+    assert fee.attributes == {"createdAt": datetime(2022, 10, 1), "direction": "Debit", "amount": 100,
+                              "balance": 200, "summary": "Fee", "tags": None}
+    assert dispute.type == "disputeTransaction"
+    assert dispute.attributes == {"createdAt": datetime(2022, 10, 1), "direction": "Credit", "amount": 100,
+                                  "balance": 200, "disputeId": "3", "summary": "Dispute", "reason": "Fraud",
+                                  "tags": {"k": "v"}}
+    with pytest.raises(TypeError, match="amount"):
+        @json_api_dto("budget", required("created_at"), required("amount"), init_order=("created_at",))
+        class BudgetDTO(object):
+            __slots__ = ("id", "type", "attributes", "relationships")
+
+
+def test_request_fields_must_be_slots():
+    with pytest.raises(TypeError, match="amount"):
+        @json_api_request(required("amount"), _type="budget")
+        class BudgetRequest(object):
+            __slots__ = ("relationships",)
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.exceptions import UnitTimeoutException
+from unit.api.single_flight import SingleFlight
+from unit.api.transport import RequestsTransport
+from unit.models.account import ListAccountParams
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+
+def test_concurrent_identical_gets_share_a_request():
+    single_flight = SingleFlight()
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response, delay=0.3)
+        with Unit(api.url, "token", transport=RequestsTransport(single_flight=single_flight)) as client:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(executor.map(lambda _: client.institutions.get("053285241"), range(8)))
+
+            assert len(api.requests) == 1
+            assert single_flight.coalesced == 7
+            assert all(response is responses[0] for response in responses)
+            assert responses[0].data.attributes["routingNumber"] == "053285241"
+
+
+def test_different_gets_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    with LocalApi() as api:
+        api.route("GET", "/accounts", payload={"data": []}, delay=0.2)
+        with Unit(api.url, "token", transport=RequestsTransport(single_flight=single_flight)) as client:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(lambda limit: client.accounts.list(ListAccountParams(limit=limit)), [10, 20, 10]))
+
+            assert len(api.requests) == 2
+            assert single_flight.coalesced == 1
+
+
+def test_sequential_gets_are_sent():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with Unit(api.url, "token", transport=RequestsTransport(single_flight=SingleFlight())) as client:
+            first = client.institutions.get("053285241")
+            second = client.institutions.get("053285241")
+
+            assert len(api.requests) == 2
+            assert first is not second
+
+
+def test_errors_are_shared():
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.2)
+        raise UnitTimeoutException("GET https://api.s.unit.sh/accounts/1 timed out")
+
+    single_flight = SingleFlight()
+    key = single_flight.key("GET", "https://api.s.unit.sh/accounts/1")
+
+    def send(_):
+        try:
+            single_flight.send(key, fail)
+        except UnitTimeoutException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        errors = list(executor.map(send, range(4)))
+
+    assert len(calls) == 1
+    assert isinstance(errors[0], UnitTimeoutException)
+    assert all(error is errors[0] for error in errors)
+    assert not single_flight.flights
+
+
+def test_async_concurrent_identical_gets_share_a_request():
+    single_flight = SingleFlight()
+
+    async def get_all(url):
+        async with AsyncUnit(url, "token", transport=HttpxTransport(single_flight=single_flight)) as client:
+            return await asyncio.gather(*[client.institutions.get("053285241") for _ in range(8)])
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response, delay=0.2)
+        responses = asyncio.run(get_all(api.url))
+
+        assert len(api.requests) == 1
+        assert single_flight.coalesced == 7
+        assert all(response is responses[0] for response in responses)
+        assert not single_flight.tasks
@@ -0,0 +1,99 @@
+import asyncio
+import hashlib
+import io
+import os
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.models import UnitError
+from unit.models.statement import GetStatementParams
+from e2e_tests.helpers.local_server import LocalApi
+
+pdf = b"%PDF-1.7\n" + bytes(range(256)) * 1024
+
+
+def test_download_to_path(tmp_path):
+    path = tmp_path / "statement.pdf"
+    with LocalApi() as api:
+        api.route("GET", "/statements/1/pdf", payload=pdf, headers={"Content-Type": "application/pdf"})
+        with Unit(api.url, "token") as client:
+            download = client.statements.download(GetStatementParams("1", "pdf", customer_id="2"), str(path),
+                                                  "sha256", chunk_size=4096).data
+
+        assert path.read_bytes() == pdf
+        assert download.path == str(path)
+        assert download.size == len(pdf)
+        assert download.checksum == hashlib.sha256(pdf).hexdigest()
+        assert download.content_type == "application/pdf"
+        assert download.content is None
+        assert api.requests[0]["params"] == {"language": "en", "filter[customerId]": "2"}
+        assert os.listdir(tmp_path) == ["statement.pdf"]
+
+
+def test_download_to_file_object():
+    file = io.BytesIO()
+    with LocalApi() as api:
+        api.route("GET", "/statements/1/html", payload=b"<!DOCTYPE html>\xe2\x82\xac",
+                  headers={"Content-Type": "text/html"})
+        with Unit(api.url, "token") as client:
+            download = client.statements.download(GetStatementParams("1"), file).data
+
+        assert file.getvalue() == b"<!DOCTYPE html>\xe2\x82\xac"
+        assert download.path is None and download.checksum is None
+
+
+def test_download_to_memory():
+    with LocalApi() as api:
+        api.route("GET", "/statements/10001/bank/pdf", payload=pdf, headers={"Content-Type": "application/pdf"})
+        with Unit(api.url, "token") as client:
+            download = client.statements.download_bank_verification("10001", True, checksum="md5").data
+
+        assert isinstance(download.content, memoryview)
+        assert download.content == pdf
+        assert download.checksum == hashlib.md5(pdf).hexdigest()
+        assert api.requests[0]["params"] == {"includeProofOfFunds": "True"}
+
+
+def test_get_returns_the_statement_bytes():
+    async def get(url):
+        async with AsyncUnit(url, "token") as client:
+            return await client.statements.get_bank_verification("10001")
+
+    with LocalApi() as api:
+        api.route("GET", "/statements/1/pdf", payload=pdf, headers={"Content-Type": "application/pdf"})
+        api.route("GET", "/statements/10001/bank/pdf", payload=pdf, headers={"Content-Type": "application/pdf"})
+        with Unit(api.url, "token") as client:
+            statement = client.statements.get(GetStatementParams("1", "pdf")).data
+
+        assert statement == pdf
+        assert asyncio.run(get(api.url)).data == pdf
+
+
+def test_download_error_leaves_no_file(tmp_path):
+    path = tmp_path / "statement.pdf"
+    with LocalApi() as api:
+        api.route("GET", "/statements/1/pdf", status=404,
+                  payload={"errors": [{"title": "Statement not found", "status": "404"}]})
+        with Unit(api.url, "token") as client:
+            response = client.statements.download(GetStatementParams("1", "pdf"), path)
+
+        assert isinstance(response, UnitError)
+        assert response.errors[0].title == "Statement not found"
+        assert os.listdir(tmp_path) == []
+
+
+def test_async_download(tmp_path):
+    async def download(url):
+        async with AsyncUnit(url, "token") as client:
+            return await client.statements.download(GetStatementParams("1", "pdf"), tmp_path / "statement.pdf",
+                                                    "sha256", chunk_size=4096), \
+                   await client.statements.download(GetStatementParams("2", "pdf"))
+
+    with LocalApi() as api:
+        api.route("GET", "/statements/1/pdf", payload=pdf, headers={"Content-Type": "application/pdf"})
+        api.route("GET", "/statements/2/pdf", status=403, payload={"errors": [{"title": "Forbidden", "status": "403"}]})
+        to_path, error = asyncio.run(download(api.url))
+
+        assert (tmp_path / "statement.pdf").read_bytes() == pdf
+        assert to_path.data.checksum == hashlib.sha256(pdf).hexdigest()
+        assert to_path.data.size == len(pdf)
+        assert isinstance(error, UnitError)
@@ -13,16 +13,16 @@ def test_list_and_get_statements():
 
         params = GetStatementParams(s.id)
         html_statement = client.statements.get(params).data
-        assert "<!DOCTYPE html>" in html_statement
+        assert b"<!DOCTYPE html>" in html_statement
 
         params = GetStatementParams(s.id, customer_id=s.relationships["customer"].id)
         html_statement = client.statements.get(params).data
-        assert "<!DOCTYPE html>" in html_statement
+        assert b"<!DOCTYPE html>" in html_statement
 
         account_id = s.relationships["account"].id
         pdf_response = client.statements.get_bank_verification(account_id).data
-        assert "PDF" in pdf_response
+        assert b"PDF" in pdf_response
 
         params = GetStatementParams(s.id, "pdf")
         pdf_statement = client.statements.get(params).data
-        assert "PDF" in pdf_statement
+        assert b"PDF" in pdf_statement
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import pytest
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.api.exceptions import UnitErrorException
+from unit.models.transaction import ListTransactionParams
+from unit.utils.json_stream import JsonStreamParser, iter_json_members
+from e2e_tests.helpers.fixtures import transaction_page
+from e2e_tests.helpers.local_server import LocalApi
+
+included = [{"type": "account", "id": "10001", "attributes": {"name": "Peter Parker"}}]
+
+
+def page(count: int):
+    payload = transaction_page(count)
+    payload["included"] = included
+    return payload
+
+
+def split(raw: bytes, size: int):
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+def test_members_are_parsed_across_chunks():
+    payload = page(20)
+    raw = json.dumps(payload, indent=2).encode()
+
+    for size in (1, 7, 1024):
+        events = list(iter_json_members(split(raw, size), ("data", "included")))
+        assert [v for k, v in events if k == "data"] == payload["data"]
+        assert [v for k, v in events if k == "included"] == included
+        assert dict(e for e in events if e[0] == "meta") == {"meta": payload["meta"]}
+
+
+def test_elements_are_emitted_as_they_arrive():
+    parser = JsonStreamParser(("data", "included"))
+    raw = json.dumps(page(3)).encode()
+    second = raw.index(b'{"type": "purchaseTransaction"')
+
+    events = parser.feed(raw[:second + 10])
+    assert [e[1]["type"] for e in events] == ["bookTransaction"]
+    events = parser.feed(raw[second + 10:]) + parser.close()
+    assert [(k, v["type"]) for k, v in events if k != "meta"] == \
+           [("data", "purchaseTransaction"), ("data", "feeTransaction"), ("included", "account")]
+
+
+def test_numbers_split_across_chunks():
+    assert list(iter_json_members([b'{"data": [12', b'34], "meta": 5', b'6}'])) == \
+           [("data", 1234), ("meta", 56)]
+
+
+def test_truncated_document_raises():
+    with pytest.raises(ValueError):
+        list(iter_json_members([b'{"data": [{"type": "fee"}']))
+
+
+def test_stream_transactions():
+    payload = page(100)
+
+    with LocalApi() as api:
+        api.route("GET", "/transactions", payload=payload)
+        with Unit(api.url, "token") as client:
+            stream = client.transactions.stream(ListTransactionParams(limit=100))
+            streamed = list(stream)
+            listed = client.transactions.list(ListTransactionParams(limit=100)).data
+
+            assert [(t.id, t.type, t.attributes["amount"]) for t in streamed] == \
+                   [(t.id, t.type, t.attributes["amount"]) for t in listed]
+            assert [a.id for a in stream.included] == ["10001"]
+            assert stream.meta == payload["meta"]
+            assert api.requests[0]["params"]["page[limit]"] == "100"
+
+
+def test_stream_error_raises():
+    with LocalApi() as api:
+        api.route("GET", "/transactions", status=403, payload={"errors": [{"title": "Forbidden", "status": "403"}]})
+        with Unit(api.url, "token") as client:
+            with pytest.raises(UnitErrorException):
+                next(client.transactions.stream())
+
+
+def test_async_stream_transactions():
+    async def stream(url):
+        async with AsyncUnit(url, "token") as client:
+            transactions = client.transactions.stream(ListTransactionParams(limit=100), lazy=True)
+            return [t async for t in transactions], transactions
+
+    with LocalApi() as api:
+        api.route("GET", "/transactions", payload=page(100))
+        streamed, transactions = asyncio.run(stream(api.url))
+
+        assert [t.id for t in streamed] == [t["id"] for t in page(100)["data"]]
+        assert [a.id for a in transactions.included] == ["10001"]
+        assert transactions.meta["pagination"]["total"] == 100
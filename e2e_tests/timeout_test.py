@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from time import monotonic
+from unit import Unit
+from unit.aio import AsyncUnit
+from unit.aio.transport import HttpxTransport
+from unit.api.exceptions import UnitTimeoutException
+from unit.api.retry import RetryPolicy
+from unit.api.timeout import Timeout
+from unit.api.transport import RequestsTransport
+from e2e_tests.helpers.local_server import LocalApi
+from e2e_tests.transport_test import institution_api_response
+
+unavailable = {"errors": [{"title": "Service Unavailable", "status": "503"}]}
+
+
+def test_bounded_timeout():
+    timeout = Timeout(connect=1, read=5, total=10).bounded(2)
+
+    assert (timeout.connect, timeout.read, timeout.total) == (1, 2, 10)
+    assert Timeout(total=3).bounded(0.5).read == 0.5
+
+
+def test_read_timeout():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response, delay=0.5)
+        client = Unit(api.url, "token", transport=RequestsTransport(timeout=Timeout(connect=1, read=0.1)))
+
+        start = monotonic()
+        with pytest.raises(UnitTimeoutException):
+            client.institutions.get("053285241")
+        assert monotonic() - start < 0.4
+
+
+def test_deadline_bounds_retries():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", status=503, payload=unavailable)
+        client = Unit(api.url, "token", retries=RetryPolicy(max_tries=100, base=0.05, jitter=None))
+
+        start = monotonic()
+        with pytest.raises(UnitTimeoutException):
+            client.institutions.with_timeout(total=0.3).get("053285241")
+        assert 0.3 <= monotonic() - start < 0.6
+        assert client.institutions.timeout is None
+
+
+def test_deadline_bounds_a_slow_attempt():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response, delay=0.5)
+        client = Unit(api.url, "token", transport=RequestsTransport(timeout=Timeout(read=5)))
+
+        start = monotonic()
+        with pytest.raises(UnitTimeoutException):
+            client.institutions.with_timeout(total=0.1).get("053285241")
+        assert monotonic() - start < 0.4
+        assert client.institutions.with_timeout(total=1).get("053285241").data.type == "institution"
+
+
+def test_async_deadline():
+    async def get(url):
+        async with AsyncUnit(url, "token", transport=HttpxTransport(timeout=Timeout(total=0.1))) as client:
+            return await client.institutions.get("053285241")
+
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response, delay=0.5)
+
+        with pytest.raises(UnitTimeoutException):
+            asyncio.run(get(api.url))
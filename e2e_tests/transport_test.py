@@ -0,0 +1,58 @@
+from unit import Unit
+from unit.api.transport import RequestsTransport
+from unit.utils.lazy import LazyResource
+from e2e_tests.helpers.local_server import LocalApi
+
+institution_api_response = {
+    "data": {
+        "type": "institution",
+        "attributes": {
+            "routingNumber": "053285241",
+            "name": "Unit Bank",
+            "isACHSupported": True,
+            "isWireSupported": False
+        }
+    }
+}
+
+
+def test_resources_share_client_transport():
+    client = Unit("https://api.s.unit.sh", "token")
+    resources = [getattr(client, name) for name, v in vars(Unit).items() if isinstance(v, LazyResource)]
+
+    assert len(resources) == 25
+    for r in resources:
+        assert r.transport is client.transport
+
+
+def test_connections_are_reused():
+    with LocalApi() as api:
+        api.route("GET", "/institutions/053285241", payload=institution_api_response)
+        with Unit(api.url, "token", transport=RequestsTransport(pool_maxsize=2)) as client:
+            for _ in range(5):
+                response = client.institutions.get("053285241")
+                assert response.data.type == "institution"
+                assert response.data.attributes["name"] == "Unit Bank"
+
+        assert len(api.requests) == 5
+        assert len(api.connections) == 1
+
+
+def test_client_does_not_close_caller_transport():
+    class TrackingTransport(RequestsTransport):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    owned = Unit("https://api.s.unit.sh", "token")
+    owned.close()
+
+    transport = TrackingTransport()
+    with Unit("https://api.s.unit.sh", "token", transport=transport):
+        pass
+
+    assert not transport.closed
+    transport.close()
+    assert transport.closed
@@ -3,7 +3,7 @@ from unit.app_config import sdk_version
 
 setup(
     name='unit-python-sdk',
-    packages=['unit', 'unit.api', 'unit.models', 'unit.utils'],
+    packages=['unit', 'unit.api', 'unit.aio', 'unit.models', 'unit.utils'],
     version=sdk_version,
     license='Mozilla Public License 2.0',
     description='This library provides a python wrapper to http://unit.co API. See https://docs.unit.co/',
@@ -14,7 +14,7 @@ setup(
     keywords=['unit', 'finance', 'banking',
               'banking-as-a-service', 'API', 'SDK'],
     install_requires=[
-        'requests', 'backoff'
+        'requests', 'backoff>=2,<3'
     ],
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -1,56 +1,68 @@
-from unit.api.application_resource import ApplicationResource
-from unit.api.customer_resource import CustomerResource
-from unit.api.account_resource import AccountResource
-from unit.api.card_resource import CardResource
-from unit.api.transaction_resource import TransactionResource
-from unit.api.payment_resource import PaymentResource
-from unit.api.received_payment_resource import ReceivedPaymentResource
-from unit.api.statement_resource import StatementResource
-from unit.api.customerToken_resource import CustomerTokenResource
-from unit.api.counterparty_resource import CounterpartyResource
-from unit.api.returnAch_resource import ReturnAchResource
-from unit.api.applicationForm_resource import ApplicationFormResource
-from unit.api.fee_resource import FeeResource
-from unit.api.event_resource import EventResource
-from unit.api.webhook_resource import WebhookResource
-from unit.api.institution_resource import InstitutionResource
-from unit.api.atmLocation_resource import AtmLocationResource
-from unit.api.bill_pay_resource import BillPayResource
-from unit.api.api_token_resource import APITokenResource
-from unit.api.authorization_resource import AuthorizationResource
-from unit.api.authorization_request_resource import AuthorizationRequestResource
-from unit.api.account_end_of_day_resource import AccountEndOfDayResource
-from unit.api.checkDeposit_resource import CheckDepositResource
-from unit.api.dispute_resource import DisputeResource
-from unit.api.reward_resource import RewardResource
+from typing import Optional
+from unit.api.transport import Transport, RequestsTransport
+from unit.utils.lazy import LazyResource, lazy_attributes
 
 __all__ = ["api", "models", "utils"]
 
 
 class Unit(object):
-    def __init__(self, api_url, token, retries=1):
-        self.applications = ApplicationResource(api_url, token, retries)
-        self.customers = CustomerResource(api_url, token, retries)
-        self.accounts = AccountResource(api_url, token, retries)
-        self.cards = CardResource(api_url, token, retries)
-        self.transactions = TransactionResource(api_url, token, retries)
-        self.payments = PaymentResource(api_url, token, retries)
-        self.statements = StatementResource(api_url, token, retries)
-        self.customerTokens = CustomerTokenResource(api_url, token, retries)
-        self.counterparty = CounterpartyResource(api_url, token, retries)
-        self.returnAch = ReturnAchResource(api_url, token, retries)
-        self.applicationForms = ApplicationFormResource(api_url, token, retries)
-        self.fees = FeeResource(api_url, token, retries)
-        self.events = EventResource(api_url, token, retries)
-        self.webhooks = WebhookResource(api_url, token, retries)
-        self.institutions = InstitutionResource(api_url, token, retries)
-        self.atmLocations = AtmLocationResource(api_url, token, retries)
-        self.billPays = BillPayResource(api_url, token, retries)
-        self.api_tokens = APITokenResource(api_url, token, retries)
-        self.authorizations = AuthorizationResource(api_url, token, retries)
-        self.authorization_requests = AuthorizationRequestResource(api_url, token, retries)
-        self.account_end_of_day = AccountEndOfDayResource(api_url, token, retries)
-        self.checkDeposits = CheckDepositResource(api_url, token, retries)
-        self.disputes = DisputeResource(api_url, token, retries)
-        self.rewards = RewardResource(api_url, token, retries)
-        self.received_payments = ReceivedPaymentResource(api_url, token, retries)
+    # resources are imported and built on first use, see LazyResource
+    applications = LazyResource("unit.api.application_resource", "ApplicationResource")
+    customers = LazyResource("unit.api.customer_resource", "CustomerResource")
+    accounts = LazyResource("unit.api.account_resource", "AccountResource")
+    cards = LazyResource("unit.api.card_resource", "CardResource")
+    transactions = LazyResource("unit.api.transaction_resource", "TransactionResource")
+    payments = LazyResource("unit.api.payment_resource", "PaymentResource")
+    statements = LazyResource("unit.api.statement_resource", "StatementResource")
+    customerTokens = LazyResource("unit.api.customerToken_resource", "CustomerTokenResource")
+    counterparty = LazyResource("unit.api.counterparty_resource", "CounterpartyResource")
+    returnAch = LazyResource("unit.api.returnAch_resource", "ReturnAchResource")
+    applicationForms = LazyResource("unit.api.applicationForm_resource", "ApplicationFormResource")
+    fees = LazyResource("unit.api.fee_resource", "FeeResource")
+    events = LazyResource("unit.api.event_resource", "EventResource")
+    webhooks = LazyResource("unit.api.webhook_resource", "WebhookResource")
+    institutions = LazyResource("unit.api.institution_resource", "InstitutionResource")
+    atmLocations = LazyResource("unit.api.atmLocation_resource", "AtmLocationResource")
+    billPays = LazyResource("unit.api.bill_pay_resource", "BillPayResource")
+    api_tokens = LazyResource("unit.api.api_token_resource", "APITokenResource")
+    authorizations = LazyResource("unit.api.authorization_resource", "AuthorizationResource")
+    authorization_requests = LazyResource("unit.api.authorization_request_resource", "AuthorizationRequestResource")
+    account_end_of_day = LazyResource("unit.api.account_end_of_day_resource", "AccountEndOfDayResource")
+    checkDeposits = LazyResource("unit.api.checkDeposit_resource", "CheckDepositResource")
+    disputes = LazyResource("unit.api.dispute_resource", "DisputeResource")
+    rewards = LazyResource("unit.api.reward_resource", "RewardResource")
+    received_payments = LazyResource("unit.api.received_payment_resource", "ReceivedPaymentResource")
+
+    def __init__(self, api_url, token, retries=1, transport: Optional[Transport] = None):
+        # resources share one pooled transport so connections are kept alive and reused across them
+        self._owns_transport = transport is None
+        self.transport = transport or RequestsTransport()
+        self.api_url = api_url
+        self.token = token
+        self.retries = retries
+
+    def batch(self, concurrency: int = 8, on_progress=None) -> "Batch":
+        """
+        Returns a Batch running the calls queued in it concurrently over this client's transport.
+        """
+        from unit.api.batch import Batch
+
+        return Batch(concurrency, on_progress)
+
+    def close(self):
+        """
+        Releases the pooled connections of the client. A transport passed in by the caller is left open.
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# the resource classes and Batch stay importable from unit, their modules are imported on first access
+__getattr__ = lazy_attributes(__name__, dict(
+    [(r.name, r.module) for r in vars(Unit).values() if isinstance(r, LazyResource)] + [("Batch", "unit.api.batch")]))
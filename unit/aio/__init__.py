@@ -0,0 +1,71 @@
+from typing import Optional
+from unit.aio.transport import AsyncTransport, HttpxTransport
+from unit.utils.lazy import LazyResource, lazy_attributes
+
+
+class AsyncUnit(object):
+    """
+    asyncio client mirroring Unit, every resource method is awaitable.
+    Requires httpx unless a custom AsyncTransport is passed in.
+    """
+    # resources are imported and built on first use, see LazyResource
+    applications = LazyResource("unit.aio.application_resource", "AsyncApplicationResource")
+    customers = LazyResource("unit.aio.customer_resource", "AsyncCustomerResource")
+    accounts = LazyResource("unit.aio.account_resource", "AsyncAccountResource")
+    cards = LazyResource("unit.aio.card_resource", "AsyncCardResource")
+    transactions = LazyResource("unit.aio.transaction_resource", "AsyncTransactionResource")
+    payments = LazyResource("unit.aio.payment_resource", "AsyncPaymentResource")
+    statements = LazyResource("unit.aio.statement_resource", "AsyncStatementResource")
+    customerTokens = LazyResource("unit.aio.customerToken_resource", "AsyncCustomerTokenResource")
+    counterparty = LazyResource("unit.aio.counterparty_resource", "AsyncCounterpartyResource")
+    returnAch = LazyResource("unit.aio.returnAch_resource", "AsyncReturnAchResource")
+    applicationForms = LazyResource("unit.aio.applicationForm_resource", "AsyncApplicationFormResource")
+    fees = LazyResource("unit.aio.fee_resource", "AsyncFeeResource")
+    events = LazyResource("unit.aio.event_resource", "AsyncEventResource")
+    webhooks = LazyResource("unit.aio.webhook_resource", "AsyncWebhookResource")
+    institutions = LazyResource("unit.aio.institution_resource", "AsyncInstitutionResource")
+    atmLocations = LazyResource("unit.aio.atmLocation_resource", "AsyncAtmLocationResource")
+    billPays = LazyResource("unit.aio.bill_pay_resource", "AsyncBillPayResource")
+    api_tokens = LazyResource("unit.aio.api_token_resource", "AsyncAPITokenResource")
+    authorizations = LazyResource("unit.aio.authorization_resource", "AsyncAuthorizationResource")
+    authorization_requests = LazyResource("unit.aio.authorization_request_resource",
+                                          "AsyncAuthorizationRequestResource")
+    account_end_of_day = LazyResource("unit.aio.account_end_of_day_resource", "AsyncAccountEndOfDayResource")
+    checkDeposits = LazyResource("unit.aio.checkDeposit_resource", "AsyncCheckDepositResource")
+    disputes = LazyResource("unit.aio.dispute_resource", "AsyncDisputeResource")
+    rewards = LazyResource("unit.aio.reward_resource", "AsyncRewardResource")
+    received_payments = LazyResource("unit.aio.received_payment_resource", "AsyncReceivedPaymentResource")
+
+    def __init__(self, api_url, token, retries=1, transport: Optional[AsyncTransport] = None):
+        self._owns_transport = transport is None
+        self.transport = transport or HttpxTransport()
+        self.api_url = api_url
+        self.token = token
+        self.retries = retries
+
+    def batch(self, concurrency: int = 8, on_progress=None) -> "AsyncBatch":
+        """
+        Returns an AsyncBatch running the calls queued in it concurrently over this client's transport.
+        """
+        from unit.aio.batch import AsyncBatch
+
+        return AsyncBatch(concurrency, on_progress)
+
+    async def close(self):
+        """
+        Releases the pooled connections of the client. A transport passed in by the caller is left open.
+        """
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+# the resource classes and AsyncBatch stay importable from unit.aio, their modules are imported on first access
+__getattr__ = lazy_attributes(__name__, dict(
+    [(r.name, r.module) for r in vars(AsyncUnit).values() if isinstance(r, LazyResource)] +
+    [("AsyncBatch", "unit.aio.batch")]))
@@ -0,0 +1,17 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource
+from unit.models.account_end_of_day import *
+
+
+class AsyncAccountEndOfDayResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "account-end-of-day"
+
+    async def list(self, params: ListAccountEndOfDayParams = None, lazy: bool = False) -> Union[UnitResponse[List[AccountEndOfDayDTO]], UnitError]:
+        params = params or ListAccountEndOfDayParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListAccountEndOfDayParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[AccountEndOfDayDTO]:
+        return super().paginate(self.list, params or ListAccountEndOfDayParams(), prefetch, lazy)
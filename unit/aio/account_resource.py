@@ -0,0 +1,78 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.account import *
+
+
+class AsyncAccountResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "accounts"
+
+    async def create(self, request: CreateAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def close_account(self, request: CloseAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.account_id}/close", payload)
+        return super().to_unit_response(response)
+
+    async def reopen_account(self, account_id: str, reason: str = "ByCustomer") -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/reopen", {'reason': reason})
+        return super().to_unit_response(response)
+
+    async def freeze_account(self, request: FreezeAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.account_id}/freeze", payload)
+        return super().to_unit_response(response)
+
+    async def unfreeze_account(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/unfreeze")
+        return super().to_unit_response(response)
+
+    async def enter_daca(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/enter-daca")
+        return super().to_unit_response(response)
+
+    async def activate_daca(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/activate-daca")
+        return super().to_unit_response(response)
+
+
+    async def get(self, account_id: str, include: Optional[str] = "") -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{account_id}", {"include": include})
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListAccountParams = None, lazy: bool = False) -> Union[UnitResponse[List[AccountDTO]], UnitError]:
+        params = params or ListAccountParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListAccountParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[AccountDTO]:
+        return super().paginate(self.list, params or ListAccountParams(), prefetch, lazy)
+
+    async def update(self, request: PatchAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.account_id}", payload)
+        return super().to_unit_response(response)
+
+    async def limits(self, account_id: str) -> Union[UnitResponse[AccountLimitsDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{account_id}/limits", None)
+        return super().to_unit_response(response)
+
+    async def get_deposit_products(self, account_id: str) -> Union[UnitResponse[List[AccountDepositProductDTO]], UnitError]:
+        response = await super().cached_get(f"{self.resource}/{account_id}/deposit-products")
+        return super().to_unit_response(response)
+
+    async def add_owners(self, request: AccountOwnersRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.account_id}/relationships/customers", payload)
+        return super().to_unit_response(response)
+
+    async def remove_owners(self, request: AccountOwnersRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().delete(f"{self.resource}/{request.account_id}/relationships/customers", payload)
+        return super().to_unit_response(response)
+
+
@@ -0,0 +1,25 @@
+from unit.aio.base_resource import AsyncBaseResource
+from unit.models.api_token import *
+
+
+class AsyncAPITokenResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "users"
+
+    async def create(self, request: CreateAPITokenRequest) -> Union[UnitResponse[APITokenDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.user_id}/api-tokens", payload)
+        return super().to_unit_response(response)
+
+    async def list(self, user_id: str) -> Union[UnitResponse[List[APITokenDTO]], UnitError]:
+        response = await super().get(f"{self.resource}/{user_id}/api-tokens")
+        return super().to_unit_response(response)
+
+    async def revoke(self, user_id: str, token_id: str) -> Union[UnitResponse, UnitError]:
+        response = await super().delete(f"{self.resource}/{user_id}/api-tokens/{token_id}")
+        if super().is_20x(response.status_code):
+            return UnitResponse([], None)
+        else:
+            return UnitError.from_json_api(response.json())
+
@@ -0,0 +1,26 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.applicationForm import *
+
+
+class AsyncApplicationFormResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "application-forms"
+
+    async def create(self, request: CreateApplicationFormRequest) -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def get(self, application_form_id: str, include: Optional[str] = "") -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{application_form_id}", {"include": include})
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListApplicationFormParams = None, lazy: bool = False) -> Union[UnitResponse[List[ApplicationFormDTO]], UnitError]:
+        params = params or ListApplicationFormParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListApplicationFormParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[ApplicationFormDTO]:
+        return super().paginate(self.list, params or ListApplicationFormParams(), prefetch, lazy)
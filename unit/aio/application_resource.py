@@ -0,0 +1,51 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.api.base_resource import to_unit_response
+from unit.models.application import *
+
+
+class AsyncApplicationResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "applications"
+
+    async def create(self, request: Union[CreateIndividualApplicationRequest, CreateBusinessApplicationRequest]) -> Union[UnitResponse[ApplicationDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        # every status below 400 counts as created, as requests' response.ok always did for applications
+        return to_unit_response(response, success_statuses=range(200, 400))
+
+    async def list(self, params: ListApplicationParams = None, lazy: bool = False) -> Union[UnitResponse[List[ApplicationDTO]], UnitError]:
+        params = params or ListApplicationParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListApplicationParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[ApplicationDTO]:
+        return super().paginate(self.list, params or ListApplicationParams(), prefetch, lazy)
+
+    async def get(self, application_id: str) -> Union[UnitResponse[ApplicationDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{application_id}")
+        return super().to_unit_response(response)
+
+    async def upload(self, request: UploadDocumentRequest):
+        url = f"{self.resource}/{request.application_id}/documents/{request.document_id}"
+        if request.is_back_side:
+            url += "/back"
+
+        headers = {}
+
+        if request.file_type == "jpeg":
+                headers = {"Content-Type": "image/jpeg"}
+        if request.file_type == "png":
+                headers = {"Content-Type": "image/png"}
+        if request.file_type == "pdf":
+                headers = {"Content-Type": "application/pdf"}
+
+        response = await super().put(url, request.file, headers)
+        return super().to_unit_response(response)
+
+    async def update(self, request: PatchApplicationRequest) -> Union[UnitResponse[ApplicationDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.application_id}", payload)
+        return super().to_unit_response(response)
+
@@ -0,0 +1,31 @@
+from unit.aio.base_resource import AsyncBaseResource
+from unit.models.atm_location import *
+from unit.models.codecs import UnitEncoder
+
+
+class AsyncAtmLocationResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "atm-locations"
+
+    """
+    UnitEncoder must be imported here and not in the model class to no cause circular importing.
+    """
+    async def get(self, request: GetAtmLocationParams) -> Union[UnitResponse[List[AtmLocationDTO]], UnitError]:
+        params = {}
+
+        if request.coordinates:
+            params["filter[coordinates]"] = json.dumps(request.coordinates, cls=UnitEncoder)
+
+        if request.address:
+            params["filter[address]"] = json.dumps(request.address, cls=UnitEncoder)
+
+        if request.postal_code:
+            params["filter[postalCode]"] = json.dumps(request.postal_code, cls=UnitEncoder)
+
+        if request.search_radius:
+            params["filter[searchRadius]"] = request.search_radius
+
+        response = await super().cached_get(self.resource, params)
+        return super().to_unit_response(response)
+
@@ -0,0 +1,34 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.authorization_request import *
+
+
+class AsyncAuthorizationRequestResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "authorization-requests"
+
+    async def get(self, authorization_id: str) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{authorization_id}")
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListPurchaseAuthorizationRequestParams = None, lazy: bool = False) \
+            -> Union[UnitResponse[List[PurchaseAuthorizationRequestDTO]], UnitError]:
+        params = params or ListPurchaseAuthorizationRequestParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListPurchaseAuthorizationRequestParams = None, prefetch: bool = False, lazy: bool = False) \
+            -> AsyncIterator[PurchaseAuthorizationRequestDTO]:
+        return super().paginate(self.list, params or ListPurchaseAuthorizationRequestParams(), prefetch, lazy)
+
+    async def approve(self, request: ApproveAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.authorization_id}/approve", payload)
+        return super().to_unit_response(response)
+
+    async def decline(self, request: DeclineAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.authorization_id}/decline", payload)
+        return super().to_unit_response(response)
+
@@ -0,0 +1,23 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.authorization import *
+
+
+class AsyncAuthorizationResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "authorizations"
+
+    async def get(self, authorization_id: str, include_non_authorized: Optional[bool] = False) -> Union[UnitResponse[AuthorizationDTO], UnitError]:
+        params = {"filter[includeNonAuthorized]": include_non_authorized}
+
+        response = await super().get(f"{self.resource}/{authorization_id}", params)
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListAuthorizationParams = None, lazy: bool = False) -> Union[UnitResponse[List[AuthorizationDTO]], UnitError]:
+        params = params or ListAuthorizationParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListAuthorizationParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[AuthorizationDTO]:
+        return super().paginate(self.list, params or ListAuthorizationParams(), prefetch, lazy)
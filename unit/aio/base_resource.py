@@ -0,0 +1,236 @@
+import asyncio
+import collections
+import copy
+import functools
+from typing import Optional, Dict, Union, Iterable, List, Callable
+from unit.api.base_resource import ResourcePipeline, backoff_handler, no_retry, get_next_offset, to_unit_response, \
+    decode
+from unit.api.idempotency import with_idempotency_key
+from unit.api.exceptions import UnitErrorException
+from unit.api.retry import RetryPolicy
+from unit.api.timeout import Timeout
+from unit.models import UnitError
+from unit.aio.transport import AsyncTransport, HttpxTransport
+from unit.utils import json_backend
+from unit.utils.json_stream import JsonStreamParser
+
+
+async def aclose_retried(details):
+    """
+    Async counterpart of unit.api.base_resource.close_retried.
+    """
+    if hasattr(details["value"], "aclose"):
+        await details["value"].aclose()
+
+
+class AsyncListStream(object):
+    """
+    Async counterpart of unit.api.base_resource.ListStream, to be iterated with async for.
+    """
+
+    def __init__(self, send: Callable, lazy: bool = False, chunk_size: int = 64 * 1024):
+        self.send = send
+        self.lazy = lazy
+        self.chunk_size = chunk_size
+        self.response = None
+        self.chunks = None
+        self.parser = JsonStreamParser(("data", "included"))
+        self.events = collections.deque()
+        self.included = []
+        self.meta = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.chunks is None:
+            await self.open()
+
+        try:
+            while True:
+                while self.events:
+                    key, value = self.events.popleft()
+                    if key == "data":
+                        return decode(value, self.lazy)
+                    elif key == "included":
+                        self.included.append(decode(value, self.lazy))
+                    elif key == "meta":
+                        self.meta = value
+
+                if self.parser is None:
+                    break
+
+                try:
+                    chunk = await self.chunks.__anext__()
+                except StopAsyncIteration:
+                    self.events.extend(self.parser.close())
+                    self.parser = None
+                else:
+                    self.events.extend(self.parser.feed(chunk))
+        except BaseException:
+            await self.aclose()
+            raise
+
+        await self.aclose()
+        raise StopAsyncIteration
+
+    async def open(self):
+        self.response = await self.send()
+        if self.response.status_code != 200:
+            try:
+                await self.response.aread()
+                raise UnitErrorException(to_unit_response(self.response))
+            finally:
+                await self.aclose()
+
+        self.chunks = self.response.aiter_bytes(self.chunk_size)
+
+    async def aclose(self):
+        if self.response is not None:
+            await self.response.aclose()
+        self.parser = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+class AsyncBaseResource(ResourcePipeline):
+    def __init__(self, api_url, token, retries_amount: Union[int, RetryPolicy],
+                 transport: Optional[AsyncTransport] = None):
+        super().__init__(api_url, token, retries_amount, transport or HttpxTransport())
+
+    async def get(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        url, headers = f"{self.api_url}/{resource}", self.merge_headers(headers)
+        single_flight = self.transport.single_flight
+        if single_flight is not None:
+            send = functools.partial(self.__send, backoff_handler, "GET", url, params=params, headers=headers)
+            return await single_flight.send_async(single_flight.key("GET", url, params, headers), send)
+
+        return await self.__send(backoff_handler, "GET", url, params=params, headers=headers)
+
+    async def get_stream(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        """
+        GET whose response body is read as it is consumed, see AsyncListStream. The caller closes the response.
+        """
+        return await self.__send(backoff_handler, "GET", f"{self.api_url}/{resource}", params=params,
+                                 headers=self.merge_headers(headers), stream=True)
+
+    async def cached_get(self, resource: str, params: Dict = None):
+        """
+        GET of a slow changing resource, served from the transport's ResponseCache when it holds a fresh response.
+        """
+        cache = self.transport.cache
+        if cache is None:
+            return await AsyncBaseResource.get(self, resource, params)
+
+        key = cache.key(self.api_url, resource, params, self.headers["authorization"])
+        response = cache.get(self.resource, key)
+        if response is None:
+            response = await AsyncBaseResource.get(self, resource, params)
+            cache.set(self.resource, key, response)
+
+        return response
+
+    async def post(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return await self.__send(backoff_handler, "POST", f"{self.api_url}/{resource}", data=data,
+                                 headers=self.merge_headers(headers))
+
+    async def post_create(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data, idempotent = with_idempotency_key(data, self.transport.idempotency_keys)
+        data = json_backend.dumps(data) if data is not None else None
+        return await self.__send(backoff_handler if idempotent else no_retry, "POST", f"{self.api_url}/{resource}",
+                                 data=data, headers=self.merge_headers(headers))
+
+    async def post_full_path(self, path: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return await self.__send(backoff_handler, "POST", path, data=data, headers=self.merge_headers(headers))
+
+    async def patch(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return await self.__send(backoff_handler, "PATCH", f"{self.api_url}/{resource}", data=data,
+                                 headers=self.merge_headers(headers))
+
+    async def delete(self, resource: str, data: Dict = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return await self.__send(backoff_handler, "DELETE", f"{self.api_url}/{resource}", data=data,
+                                 headers=self.merge_headers(headers))
+
+    async def put(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        return await self.__send(backoff_handler, "PUT", f"{self.api_url}/{resource}", data=data,
+                                 headers=self.merge_headers(headers))
+
+    async def paginate(self, list_page, params, prefetch: bool = False, lazy: bool = False):
+        """
+        Async counterpart of BaseResource.paginate, prefetching runs the next page request as a task.
+        """
+        params = copy.copy(params)
+        pending = None
+        try:
+            response = await list_page(params, lazy)
+            while True:
+                if isinstance(response, UnitError):
+                    raise UnitErrorException(response)
+
+                next_offset = get_next_offset(params.offset, params.limit, response)
+                if next_offset is not None:
+                    params = copy.copy(params)
+                    params.offset = next_offset
+                    if prefetch:
+                        pending = asyncio.ensure_future(list_page(params, lazy))
+
+                for dto in response.data:
+                    yield dto
+
+                if next_offset is None:
+                    return
+                response = await pending if pending else await list_page(params, lazy)
+                pending = None
+        finally:
+            if pending:
+                pending.cancel()
+
+    async def __send(self, predicate, method: str, url: str, **kwargs):
+        send, timeout, deadline = self.retrying(self.__request, predicate, aclose_retried)
+        return await send(method, url, timeout=timeout, deadline=deadline, **kwargs)
+
+    async def __request(self, method: str, url: str, timeout: Optional[Timeout] = None,
+                        deadline: Optional[float] = None, **kwargs):
+        wait = self.reserve_attempt(method, url, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        timeout = self.start_attempt(method, url, timeout, deadline)
+        try:
+            hedging = self.hedging_for(method)
+            if hedging is not None:
+                request = functools.partial(self.transport.request, method, url, timeout=timeout, **kwargs)
+                response = await hedging.send_async(self.resource, request, self.admit_hedge)
+            else:
+                response = await self.transport.request(method, url, timeout=timeout, **kwargs)
+        except Exception as e:
+            self.attempt_failed(e)
+            raise
+
+        return self.attempt_done(response)
+
+
+class AsyncGetManyMixin(object):
+    """
+    get_many of the async resources whose get takes an id.
+    """
+
+    async def get_many(self, ids: Iterable[str], concurrency: int = 8, **kwargs) -> List:
+        """
+        Async counterpart of GetManyMixin.get_many, at most concurrency calls are awaited at a time.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def get(_id):
+            async with semaphore:
+                return await self.get(_id, **kwargs)
+
+        return await asyncio.gather(*[get(_id) for _id in ids], return_exceptions=True)
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Callable, List, Optional
+from unit.api.batch import BatchResult, BatchResults
+
+
+class AsyncBatch(object):
+    """
+    Async counterpart of unit.api.batch.Batch, queuing calls of the coroutine methods of resources,
+    e.g. batch.add(unit.cards.freeze, card_id). Used as an async context manager, the queued calls run on exit.
+
+    :param concurrency: calls awaited at a time, keep it within the transport's connection limit.
+    :param on_progress: called with the number of finished calls, their total and the BatchResult of the last one.
+    """
+
+    def __init__(self, concurrency: int = 8,
+                 on_progress: Optional[Callable[[int, int, BatchResult], None]] = None):
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.queue: List[BatchResult] = []
+        self.results: Optional[BatchResults] = None
+
+    def add(self, call: Callable, *args, **kwargs) -> int:
+        """
+        Queues await call(*args, **kwargs) and returns the index of its result.
+        """
+        self.queue.append(BatchResult(len(self.queue), call, args, kwargs))
+        return len(self.queue) - 1
+
+    async def run(self) -> BatchResults:
+        queue, self.queue = self.queue, []
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def call(result: BatchResult) -> BatchResult:
+            async with semaphore:
+                try:
+                    result.value = await result.call(*result.args, **result.kwargs)
+                except Exception as e:
+                    result.value = e
+            return result
+
+        tasks = [asyncio.ensure_future(call(result)) for result in queue]
+        try:
+            for done, task in enumerate(asyncio.as_completed(tasks), 1):
+                result = await task
+                if self.on_progress is not None:
+                    self.on_progress(done, len(queue), result)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self.results = BatchResults(queue)
+        return self.results
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.run()
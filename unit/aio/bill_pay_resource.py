@@ -0,0 +1,17 @@
+from unit.aio.base_resource import AsyncBaseResource
+from unit.models.bill_pay import *
+
+
+class AsyncBillPayResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "payments/billpay/billers"
+
+    async def get(self, params: GetBillersParams) -> Union[UnitResponse[List[BillerDTO]], UnitError]:
+        parameters = {"name": params.name}
+        if params.page:
+            parameters["page"] = params.page
+
+        response = await super().cached_get(self.resource, parameters)
+        return super().to_unit_response(response)
+
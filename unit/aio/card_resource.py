@@ -0,0 +1,73 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.card import *
+
+
+class AsyncCardResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "cards"
+
+    async def create(self, request: CreateCardRequest) -> Union[UnitResponse[Card], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def report_stolen(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/report-stolen")
+        return super().to_unit_response(response)
+
+    async def report_lost(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/report-lost")
+        return super().to_unit_response(response)
+
+    async def close(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/close")
+        return super().to_unit_response(response)
+
+    async def freeze(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/freeze")
+        return super().to_unit_response(response)
+
+    async def unfreeze(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/unfreeze")
+        return super().to_unit_response(response)
+
+    async def replace(self, card_id: str, shipping_address: Optional[Address]) -> Union[UnitResponse[Card], UnitError]:
+        request = ReplaceCardRequest(shipping_address)
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{card_id}/replace", payload)
+        return super().to_unit_response(response)
+
+    async def update(self, request: PatchCardRequest) -> Union[UnitResponse[Card], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.card_id}", payload)
+        return super().to_unit_response(response)
+
+    async def get(self, card_id: str, include: Optional[str] = "") -> Union[UnitResponse[Card], UnitError]:
+        response = await super().get(f"{self.resource}/{card_id}", {"include": include})
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListCardParams = None, lazy: bool = False) -> Union[UnitResponse[List[Card]], UnitError]:
+        params = params or ListCardParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListCardParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[Card]:
+        return super().paginate(self.list, params or ListCardParams(), prefetch, lazy)
+
+    async def get_pin_status(self, card_id: str) -> Union[UnitResponse[PinStatusDTO], UnitError]:
+        response = await super().cached_get(f"{self.resource}/{card_id}/secure-data/pin/status")
+        return super().to_unit_response(response)
+
+    async def limits(self, card_id: str) -> Union[UnitResponse[CardLimitsDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{card_id}/limits")
+        return super().to_unit_response(response)
+
+    async def mobile_wallet_payload(self, request: GetMobileWalletPayloadRequest) -> \
+            Union[UnitResponse[MobileWalletPayloadDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_full_path(
+            f"{request.secure_path}/{self.resource}/{request.card_id}/mobile-wallet-payload", payload)
+        return super().to_unit_response(response)
+
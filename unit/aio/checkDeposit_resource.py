@@ -0,0 +1,45 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.check_deposit import *
+
+class AsyncCheckDepositResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "check-deposits"
+
+    async def create(self, request: CreateCheckDepositRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def get(self, check_deposit_id: str, include: Optional[str] = None) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        params = {}
+
+        if include:
+            params["include"] = include
+
+        response = await super().get(f"{self.resource}/{check_deposit_id}", params)
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListCheckDepositParams = None, lazy: bool = False) -> Union[UnitResponse[List[CheckDepositDTO]], UnitError]:
+        params = params or ListCheckDepositParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListCheckDepositParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[CheckDepositDTO]:
+        return super().paginate(self.list, params or ListCheckDepositParams(), prefetch, lazy)
+
+    async def update(self, request: PatchCheckDepositRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.check_deposit_id}", payload)
+        return super().to_unit_response(response)
+
+    async def upload(self, request: UploadCheckDepositDocumentRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        url = f"{self.resource}/{request.check_deposit_id}/{request.side}"
+
+        headers = {"Content-Type": "image/jpeg"}
+
+        response = await super().put(url, request.file, headers)
+        return super().to_unit_response(response)
+
+
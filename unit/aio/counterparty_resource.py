@@ -0,0 +1,42 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.counterparty import *
+
+
+class AsyncCounterpartyResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "counterparties"
+
+    async def create(self, request: Union[CreateCounterpartyRequest, CreateCounterpartyWithTokenRequest]) -> Union[UnitResponse[CounterpartyDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def update(self, request: PatchCounterpartyRequest) -> Union[UnitResponse[CounterpartyDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.counterparty_id}", payload)
+        return super().to_unit_response(response)
+
+    async def delete(self, counterparty_id: str) -> Union[UnitResponse, UnitError]:
+        response = await super().delete(f"{self.resource}/{counterparty_id}")
+        if super().is_20x(response.status_code):
+            return UnitResponse([], None)
+        else:
+            return UnitError.from_json_api(response.json())
+
+    async def get(self, counterparty_id: str) -> Union[UnitResponse[CounterpartyDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{counterparty_id}")
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListCounterpartyParams = None, lazy: bool = False) -> Union[UnitResponse[List[CounterpartyDTO]], UnitError]:
+        params = params or ListCounterpartyParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListCounterpartyParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[CounterpartyDTO]:
+        return super().paginate(self.list, params or ListCounterpartyParams(), prefetch, lazy)
+
+    async def get_balance(self, counterparty_id: str) -> Union[UnitResponse[CounterpartyBalanceDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{counterparty_id}/balance")
+        return super().to_unit_response(response)
@@ -0,0 +1,20 @@
+from unit.aio.base_resource import AsyncBaseResource
+from unit.models.customerToken import *
+
+
+class AsyncCustomerTokenResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "customers"
+
+    async def create_token(self, request: CreateCustomerToken) -> Union[UnitResponse[CustomerTokenDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/token", payload)
+
+        return super().to_unit_response(response)
+
+    async def create_token_verification(self, request: CreateCustomerTokenVerification) -> Union[UnitResponse[CustomerVerificationTokenDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/token/verification", payload)
+
+        return super().to_unit_response(response)
@@ -0,0 +1,43 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.customer import *
+
+
+class AsyncCustomerResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "customers"
+
+    async def update(self, request: PatchCustomerRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.customer_id}", payload)
+
+        return super().to_unit_response(response)
+
+    async def get(self, customer_id: str) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{customer_id}")
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListCustomerParams = None, lazy: bool = False) -> Union[UnitResponse[List[CustomerDTO]], UnitError]:
+        params = params or ListCustomerParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListCustomerParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[CustomerDTO]:
+        return super().paginate(self.list, params or ListCustomerParams(), prefetch, lazy)
+
+    async def archive(self, request: ArchiveCustomerRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/archive", payload)
+        return super().to_unit_response(response)
+
+    async def add_authorized_users(self, request: AddAuthorizedUsersRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/authorized-users", payload)
+        return super().to_unit_response(response)
+
+    async def remove_authorized_users(self, request: RemoveAuthorizedUsersRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().delete(f"{self.resource}/{request.customer_id}/authorized-users", payload)
+        return super().to_unit_response(response)
+
@@ -0,0 +1,21 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.dispute import *
+
+
+class AsyncDisputeResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "disputes"
+
+    async def get(self, dispute_id: str) -> Union[UnitResponse[DisputeDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{dispute_id}")
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListDisputeParams = None, lazy: bool = False) -> Union[UnitResponse[List[DisputeDTO]], UnitError]:
+        params = params or ListDisputeParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListDisputeParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[DisputeDTO]:
+        return super().paginate(self.list, params or ListDisputeParams(), prefetch, lazy)
@@ -0,0 +1,28 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.event import *
+
+
+class AsyncEventResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "events"
+
+    async def get(self, event_id: str) -> Union[UnitResponse[EventDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{event_id}")
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListEventParams = None, lazy: bool = False) -> Union[UnitResponse[List[EventDTO]], UnitError]:
+        params = params or ListEventParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListEventParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[EventDTO]:
+        return super().paginate(self.list, params or ListEventParams(), prefetch, lazy)
+
+    async def fire(self, event_id: str) -> Union[UnitResponse, UnitError]:
+        response = await super().post(f"{self.resource}/{event_id}")
+        if super().is_20x(response.status_code):
+            return UnitResponse([], None)
+        else:
+            return UnitError.from_json_api(response.json())
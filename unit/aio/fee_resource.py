@@ -0,0 +1,14 @@
+from unit.aio.base_resource import AsyncBaseResource
+from unit.models.fee import *
+
+
+class AsyncFeeResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "fees"
+
+    async def create(self, request: CreateFeeRequest) -> Union[UnitResponse[FeeDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().to_unit_response(response)
+
@@ -0,0 +1,12 @@
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.institution import *
+
+
+class AsyncInstitutionResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "institutions"
+
+    async def get(self, routing_number: str) -> Union[UnitResponse[InstitutionDTO], UnitError]:
+        response = await super().cached_get(f"{self.resource}/{routing_number}", None)
+        return super().to_unit_response(response)
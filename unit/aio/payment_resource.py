@@ -0,0 +1,31 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.payment import *
+
+
+class AsyncPaymentResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "payments"
+
+    async def create(self, request: CreatePaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def update(self, request: PatchPaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.payment_id}", payload)
+        return super().to_unit_response(response)
+
+    async def get(self, payment_id: str, include: Optional[str] = "") -> Union[UnitResponse[PaymentDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{payment_id}", {"include": include})
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListPaymentParams = None, lazy: bool = False) -> Union[UnitResponse[List[PaymentDTO]], UnitError]:
+        params = params or ListPaymentParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListPaymentParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[PaymentDTO]:
+        return super().paginate(self.list, params or ListPaymentParams(), prefetch, lazy)
@@ -0,0 +1,30 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.received_payment import *
+
+
+class AsyncReceivedPaymentResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "received-payments"
+
+    async def update(self, request: PatchReceivedPaymentRequest) -> Union[UnitResponse[AchReceivedPaymentDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.payment_id}", payload)
+        return super().to_unit_response(response)
+
+    async def get(self, payment_id: str, include: Optional[str] = "") -> Union[UnitResponse[AchReceivedPaymentDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{payment_id}", {"include": include})
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListReceivedPaymentParams = None, lazy: bool = False) -> Union[UnitResponse[List[AchReceivedPaymentDTO]], UnitError]:
+        params = params or ListReceivedPaymentParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListReceivedPaymentParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[AchReceivedPaymentDTO]:
+        return super().paginate(self.list, params or ListReceivedPaymentParams(), prefetch, lazy)
+
+    async def advance(self, payment_id: str) -> Union[UnitResponse[AchReceivedPaymentDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{payment_id}/advance")
+        return super().to_unit_response(response)
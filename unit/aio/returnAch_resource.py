@@ -0,0 +1,15 @@
+from unit.aio.base_resource import AsyncBaseResource
+from unit.models.transaction import ReturnedReceivedAchTransactionDTO
+from unit.models.returnAch import *
+
+
+class AsyncReturnAchResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "returns"
+
+    async def return_ach(self, request: ReturnReceivedAchTransactionRequest) -> Union[UnitResponse[ReturnedReceivedAchTransactionDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.transaction_id}", payload)
+        return super().to_unit_response(response)
+
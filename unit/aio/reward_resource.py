@@ -0,0 +1,27 @@
+from typing import Union, List, Optional, AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models import UnitResponse, UnitError
+from unit.models.reward import RewardDTO, ListRewardsParams, CreateRewardRequest
+
+
+class AsyncRewardResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "rewards"
+
+    async def create(self, request: CreateRewardRequest) -> Union[UnitResponse[RewardDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def get(self, reward_id: str, include: Optional[str] = "") -> Union[UnitResponse[RewardDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{reward_id}", {"include": include})
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListRewardsParams = None, lazy: bool = False) -> Union[UnitResponse[List[RewardDTO]], UnitError]:
+        params = params or ListRewardsParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListRewardsParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[RewardDTO]:
+        return super().paginate(self.list, params or ListRewardsParams(), prefetch, lazy)
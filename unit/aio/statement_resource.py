@@ -0,0 +1,70 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource
+from unit.api.statement_resource import StatementSink, Destination
+from unit.models.statement import *
+
+
+class AsyncStatementResource(AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "statements"
+
+    async def get(self, params: GetStatementParams) -> Union[UnitResponse[bytes], UnitError]:
+        response = await super().get(f"{self.resource}/{params.statement_id}/{params.output_type}", params.to_dict())
+        if response.status_code == 200:
+            return UnitResponse[bytes](response.content, None)
+        else:
+            return UnitError.from_json_api(response.json())
+
+    async def get_bank_verification(self, account_id: str, include_proof_of_funds: Optional[bool] = False) -> Union[UnitResponse[bytes], UnitError]:
+        response = await super().get(f"{self.resource}/{account_id}/bank/pdf",
+                                     {"includeProofOfFunds": include_proof_of_funds})
+        if response.status_code == 200:
+            return UnitResponse[bytes](response.content, None)
+        else:
+            return UnitError.from_json_api(response.json())
+
+    async def download(self, params: GetStatementParams, destination: Destination = None,
+                       checksum: Optional[str] = None,
+                       chunk_size: int = 64 * 1024) -> Union[UnitResponse[StatementDownload], UnitError]:
+        """
+        Same as StatementResource.download. A file destination is written to synchronously, chunk by chunk.
+        """
+        return await self.__download(f"{self.resource}/{params.statement_id}/{params.output_type}",
+                                     params.to_dict(), destination, checksum, chunk_size)
+
+    async def download_bank_verification(self, account_id: str, include_proof_of_funds: Optional[bool] = False,
+                                         destination: Destination = None, checksum: Optional[str] = None,
+                                         chunk_size: int = 64 * 1024) \
+            -> Union[UnitResponse[StatementDownload], UnitError]:
+        return await self.__download(f"{self.resource}/{account_id}/bank/pdf",
+                                     {"includeProofOfFunds": include_proof_of_funds}, destination, checksum,
+                                     chunk_size)
+
+    async def list(self, params: ListStatementParams = None, lazy: bool = False) -> Union[UnitResponse[List[StatementDTO]], UnitError]:
+        params = params or ListStatementParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListStatementParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[StatementDTO]:
+        return super().paginate(self.list, params or ListStatementParams(), prefetch, lazy)
+
+    async def __download(self, resource: str, parameters: Dict, destination: Destination, checksum: Optional[str],
+                         chunk_size: int):
+        response = await super().get_stream(resource, parameters)
+        try:
+            if response.status_code != 200:
+                await response.aread()
+                return UnitError.from_json_api(response.json())
+
+            sink = StatementSink(destination, checksum)
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    sink.write(chunk)
+            except BaseException:
+                sink.abort()
+                raise
+
+            return UnitResponse[StatementDownload](sink.finish(response.headers.get("content-type")), None)
+        finally:
+            await response.aclose()
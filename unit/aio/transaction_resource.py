@@ -0,0 +1,36 @@
+import functools
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin, AsyncListStream
+from unit.models.transaction import *
+
+
+class AsyncTransactionResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "transactions"
+
+    async def get(self, transaction_id: str, include: Optional[str] = "") -> Union[UnitResponse[TransactionDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{transaction_id}", {"include": include})
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListTransactionParams = None, lazy: bool = False) -> Union[UnitResponse[List[TransactionDTO]], UnitError]:
+        params = params or ListTransactionParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListTransactionParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[TransactionDTO]:
+        return super().paginate(self.list, params or ListTransactionParams(), prefetch, lazy)
+
+    def stream(self, params: ListTransactionParams = None, lazy: bool = False) -> AsyncListStream:
+        params = params or ListTransactionParams()
+        return AsyncListStream(functools.partial(super().get_stream, self.resource, params.to_dict()), lazy)
+
+    async def update(self, request: PatchTransactionRequest) -> Union[UnitResponse[TransactionDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"accounts/{request.account_id}/{self.resource}/{request.transaction_id}", payload)
+        return super().to_unit_response(response)
+
+    async def get_by_id_and_account(self, transaction_id: str, account_id: str, include: Optional[str] = "") ->\
+            Union[UnitResponse[TransactionDTO], UnitError]:
+        response = await super().get(f"accounts/{account_id}/{self.resource}/{transaction_id}", {"include": include})
+        return super().to_unit_response(response)
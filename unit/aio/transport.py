@@ -0,0 +1,114 @@
+from typing import Optional, Dict, Callable, TYPE_CHECKING
+from unit.api.exceptions import UnitTimeoutException
+from unit.api.timeout import Timeout
+
+if TYPE_CHECKING:
+    from unit.api.cache import ResponseCache
+    from unit.api.circuit_breaker import CircuitBreaker
+    from unit.api.hedging import Hedging
+    from unit.api.rate_limit import RateLimiter
+    from unit.api.single_flight import SingleFlight
+
+
+class AsyncTransport(object):
+    """
+    Non-blocking counterpart of unit.api.transport.Transport, shared by every resource of an AsyncUnit client.
+    With stream, the body of the response is only read as response.aiter_bytes is consumed, and the caller closes
+    the response with aclose.
+    """
+    rate_limiter: Optional["RateLimiter"] = None
+    circuit_breaker: Optional["CircuitBreaker"] = None
+    hedging: Optional["Hedging"] = None
+    single_flight: Optional["SingleFlight"] = None
+    cache: Optional["ResponseCache"] = None
+    timeout: Optional[Timeout] = None
+    idempotency_keys: Optional[Callable[[], str]] = None
+
+    async def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                      headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None,
+                      stream: bool = False):
+        raise NotImplementedError()
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class HttpxTransport(AsyncTransport):
+    """
+    Pooled keep-alive transport backed by httpx.AsyncClient.
+
+    :param max_connections: maximum number of concurrent connections the pool opens.
+    :param max_keepalive_connections: maximum number of idle connections kept alive for reuse.
+    :param keepalive_expiry: seconds an idle connection is kept before being closed.
+    :param rate_limiter: throttles the requests of every resource using this transport, see RateLimiter.
+    :param timeout: default time limits of the calls of every resource using this transport.
+    :param circuit_breaker: rejects the calls of endpoint families that keep failing, see CircuitBreaker.
+    :param hedging: hedges slow GETs with a second request, see Hedging.
+    :param single_flight: coalesces concurrent identical GETs into a single request, see SingleFlight.
+    :param cache: caches the responses of slow changing resources, see ResponseCache.
+    :param idempotency_keys: generates an idempotency key for every create request sent without one, e.g.
+    new_idempotency_key, so that creates are retried like any other request.
+    """
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 5.0, client=None, rate_limiter: Optional["RateLimiter"] = None,
+                 timeout: Optional[Timeout] = None, circuit_breaker: Optional["CircuitBreaker"] = None,
+                 hedging: Optional["Hedging"] = None, single_flight: Optional["SingleFlight"] = None,
+                 cache: Optional["ResponseCache"] = None, idempotency_keys: Optional[Callable[[], str]] = None):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("AsyncUnit requires httpx, install it with `pip install httpx`")
+
+        self.httpx = httpx
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.single_flight = single_flight
+        self.cache = cache
+        self.idempotency_keys = idempotency_keys
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections,
+                              keepalive_expiry=keepalive_expiry)
+        self.client = client or httpx.AsyncClient(limits=limits, timeout=None)
+
+    async def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                      headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None,
+                      stream: bool = False):
+        if hasattr(data, "read"):
+            data = data.read()
+
+        try:
+            request = self.client.build_request(method, url, params=to_query_params(params), content=data,
+                                                headers=headers, timeout=self.to_httpx_timeout(timeout))
+            return await self.client.send(request, stream=stream)
+        except self.httpx.TimeoutException as e:
+            raise UnitTimeoutException(f"{method} {url} timed out: {e!r}") from e
+
+    def to_httpx_timeout(self, timeout: Optional[Timeout]):
+        if timeout is None:
+            return self.httpx.USE_CLIENT_DEFAULT
+
+        return self.httpx.Timeout(timeout.read, connect=timeout.connect, pool=timeout.connect)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def to_query_params(params: Optional[Dict]):
+    """
+    Encodes query parameters the way requests does, so both clients send identical query strings:
+    None values are dropped and scalars are sent as their str() value (e.g. True, not true).
+    """
+    if not params:
+        return None
+
+    return dict((k, v if isinstance(v, (list, tuple)) else str(v)) for k, v in params.items() if v is not None)
@@ -0,0 +1,51 @@
+from typing import AsyncIterator
+from unit.aio.base_resource import AsyncBaseResource, AsyncGetManyMixin
+from unit.models.webhook import *
+import hmac
+from hashlib import sha1
+import base64
+
+
+class AsyncWebhookResource(AsyncGetManyMixin, AsyncBaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
+        self.resource = "webhooks"
+
+    async def create(self, request: CreateWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(self.resource, payload)
+        return super().to_unit_response(response)
+
+    async def get(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{webhook_id}")
+        return super().to_unit_response(response)
+
+    async def list(self, params: ListWebhookParams = None, lazy: bool = False) -> Union[UnitResponse[List[WebhookDTO]], UnitError]:
+        params = params or ListWebhookParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListWebhookParams = None, prefetch: bool = False, lazy: bool = False) -> AsyncIterator[WebhookDTO]:
+        return super().paginate(self.list, params or ListWebhookParams(), prefetch, lazy)
+
+    async def update(self, request: PatchWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.webhook_id}", payload)
+        return super().to_unit_response(response)
+
+    async def enable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{webhook_id}/enable")
+        return super().to_unit_response(response)
+
+    async def disable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{webhook_id}/disable")
+        return super().to_unit_response(response)
+
+    def verify(self, signature: str, secret: str, payload):
+        mac = hmac.new(
+            secret.encode(),
+            msg=json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8'),
+            digestmod=sha1,
+        )
+        res = base64.encodebytes(mac.digest()).decode().rstrip('\n')
+        return res == signature
@@ -1,37 +1,26 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.applicationForm import *
-from unit.models.codecs import DtoDecoder
 
 
-class ApplicationFormResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class ApplicationFormResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "application-forms"
 
     def create(self, request: CreateApplicationFormRequest) -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[ApplicationFormDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def get(self, application_form_id: str, include: Optional[str] = "") -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
         response = super().get(f"{self.resource}/{application_form_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[ApplicationFormDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListApplicationFormParams = None) -> Union[UnitResponse[List[ApplicationFormDTO]], UnitError]:
+    def list(self, params: ListApplicationFormParams = None, lazy: bool = False) -> Union[UnitResponse[List[ApplicationFormDTO]], UnitError]:
         params = params or ListApplicationFormParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[ApplicationFormDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
 
+    def iter_all(self, params: ListApplicationFormParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[ApplicationFormDTO]:
+        return super().paginate(self.list, params or ListApplicationFormParams(), prefetch, lazy)
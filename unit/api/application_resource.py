@@ -1,45 +1,30 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin, to_unit_response
 from unit.models.application import *
-from unit.models.codecs import DtoDecoder
 
 
-class ApplicationResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class ApplicationResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "applications"
 
     def create(self, request: Union[CreateIndividualApplicationRequest, CreateBusinessApplicationRequest]) -> Union[UnitResponse[ApplicationDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
+        # every status below 400 counts as created, as requests' response.ok always did for applications
+        return to_unit_response(response, success_statuses=range(200, 400))
 
-        if response.ok:
-            data = response.json().get("data")
-            included = response.json().get("included")
-            if data["type"] == "individualApplication":
-                return UnitResponse[IndividualApplicationDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-            else:
-                return UnitResponse[BusinessApplicationDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
-
-    def list(self, params: ListApplicationParams = None) -> Union[UnitResponse[List[ApplicationDTO]], UnitError]:
+    def list(self, params: ListApplicationParams = None, lazy: bool = False) -> Union[UnitResponse[List[ApplicationDTO]], UnitError]:
         params = params or ListApplicationParams()
         response = super().get(self.resource, params.to_dict())
-        if response.status_code == 200:
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[ApplicationDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListApplicationParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[ApplicationDTO]:
+        return super().paginate(self.list, params or ListApplicationParams(), prefetch, lazy)
 
     def get(self, application_id: str) -> Union[UnitResponse[ApplicationDTO], UnitError]:
         response = super().get(f"{self.resource}/{application_id}")
-        if response.status_code == 200:
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[ApplicationDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def upload(self, request: UploadDocumentRequest):
         url = f"{self.resource}/{request.application_id}/documents/{request.document_id}"
@@ -56,18 +41,10 @@ class ApplicationResource(BaseResource):
                 headers = {"Content-Type": "application/pdf"}
 
         response = super().put(url, request.file, headers)
-        if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[ApplicationDocumentDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def update(self, request: PatchApplicationRequest) -> Union[UnitResponse[ApplicationDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.application_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[ApplicationDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
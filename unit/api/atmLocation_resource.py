@@ -1,11 +1,11 @@
 from unit.api.base_resource import BaseResource
 from unit.models.atm_location import *
-from unit.models.codecs import DtoDecoder, UnitEncoder
+from unit.models.codecs import UnitEncoder
 
 
 class AtmLocationResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "atm-locations"
 
     """
@@ -26,10 +26,6 @@ class AtmLocationResource(BaseResource):
         if request.search_radius:
             params["filter[searchRadius]"] = request.search_radius
 
-        response = super().get(self.resource, params)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AtmLocationDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        response = super().cached_get(self.resource, params)
+        return super().to_unit_response(response)
 
@@ -1,46 +1,34 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.authorization_request import *
-from unit.models.codecs import DtoDecoder
 
 
-class AuthorizationRequestResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class AuthorizationRequestResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "authorization-requests"
 
     def get(self, authorization_id: str) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
         response = super().get(f"{self.resource}/{authorization_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListPurchaseAuthorizationRequestParams = None) \
+    def list(self, params: ListPurchaseAuthorizationRequestParams = None, lazy: bool = False) \
             -> Union[UnitResponse[List[PurchaseAuthorizationRequestDTO]], UnitError]:
         params = params or ListPurchaseAuthorizationRequestParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListPurchaseAuthorizationRequestParams = None, prefetch: bool = False, lazy: bool = False) \
+            -> Iterator[PurchaseAuthorizationRequestDTO]:
+        return super().paginate(self.list, params or ListPurchaseAuthorizationRequestParams(), prefetch, lazy)
 
     def approve(self, request: ApproveAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.authorization_id}/approve", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def decline(self, request: DeclineAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.authorization_id}/decline", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
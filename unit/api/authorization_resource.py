@@ -1,28 +1,23 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.authorization import *
-from unit.models.codecs import DtoDecoder
 
 
-class AuthorizationResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class AuthorizationResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "authorizations"
 
     def get(self, authorization_id: str, include_non_authorized: Optional[bool] = False) -> Union[UnitResponse[AuthorizationDTO], UnitError]:
         params = {"filter[includeNonAuthorized]": include_non_authorized}
 
         response = super().get(f"{self.resource}/{authorization_id}", params)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AuthorizationDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListAuthorizationParams = None) -> Union[UnitResponse[List[AuthorizationDTO]], UnitError]:
+    def list(self, params: ListAuthorizationParams = None, lazy: bool = False) -> Union[UnitResponse[List[AuthorizationDTO]], UnitError]:
         params = params or ListAuthorizationParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AuthorizationDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListAuthorizationParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[AuthorizationDTO]:
+        return super().paginate(self.list, params or ListAuthorizationParams(), prefetch, lazy)
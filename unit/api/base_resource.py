@@ -1,19 +1,17 @@
-import json
-import requests
-import backoff
-from typing import Optional, Dict
-from unit.models.codecs import UnitEncoder
+import copy
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Union, Iterable, List, Callable, Container
+from unit.models import UnitResponse, UnitError
+from unit.api.exceptions import UnitErrorException, UnitTimeoutException
+from unit.api.transport import Transport, RequestsTransport
+from unit.api.idempotency import with_idempotency_key
+from unit.api.retry import RetryPolicy
+from unit.api.timeout import Timeout
 from unit.app_config import sdk_version
-
-_retries = 1
-
-
-def get_max_retries():
-    return _retries
-
-
-def backoff_idempotency_key_handler(e):
-    return backoff_handler(e) and idempotency_key_is_present(e)
+from unit.utils import json_backend
+from unit.utils.json_stream import iter_json_members
 
 
 def backoff_handler(e):
@@ -33,83 +31,247 @@ def is_server_error(code):
     return 500 <= code <= 599
 
 
-def idempotency_key_is_present(e):
-    body = json.loads(e.request.body)
-    if body is None:
-        return False
+def no_retry(e):
+    """
+    Predicate of the creates sent without an idempotency key: repeating them could create the resource twice.
+    """
+    return False
+
+
+def close_retried(details):
+    """
+    Closes the response of an attempt that is retried, a streamed one holds its pooled connection until then.
+    """
+    if hasattr(details["value"], "close"):
+        details["value"].close()
+
+
+def get_next_offset(offset: int, limit: int, response):
+    """
+    Returns the offset of the page following a list response, or None once meta.pagination is exhausted.
+    Endpoints that don't report pagination are exhausted by the first page shorter than the limit.
+    """
+    count = len(response.data or [])
+    if count == 0:
+        return None
+
+    pagination = (response.meta or {}).get("pagination") or {}
+    if pagination.get("total") is not None:
+        return offset + count if offset + count < pagination["total"] else None
+
+    return offset + count if count >= limit else None
+
+
+_decode = None
+
+
+def decode(payload, lazy: bool = False):
+    """
+    DtoDecoder.decode. The decoders of every model are imported by the first response decoded, not by the first
+    resource used.
+    """
+    global _decode
+    if _decode is None:
+        from unit.models.codecs import DtoDecoder
+        _decode = DtoDecoder.decode
+
+    return _decode(payload, lazy)
+
+
+SUCCESS_STATUSES = (200, 201, 204)
+
+
+def to_unit_response(response, lazy: bool = False,
+                     success_statuses: Container[int] = SUCCESS_STATUSES) -> Union[UnitResponse, UnitError]:
+    """
+    Turns a JSON:API response into a UnitResponse, or a UnitError for statuses not in success_statuses.
+    The body is parsed exactly once and the result is shared by the data, included, meta and error decoding.
+    With lazy, data and included hold LazyDTO wrappers that decode on first access.
+    """
+    body = json_backend.loads(response.content)
+    if response.status_code in success_statuses:
+        return UnitResponse(decode(body.get("data"), lazy), decode(body.get("included"), lazy), body.get("meta"))
+    else:
+        return UnitError.from_json_api(body)
+
 
-    return body["data"]["attributes"].get("idempotencyKey") is not None
+class ListStream(object):
+    """
+    Iterates over the DTOs of a list response while its body is still arriving: the body is parsed incrementally
+    and every DTO is decoded as soon as its JSON is complete, so only the DTO in hand is held in memory instead of
+    the whole body. included and meta are set once the DTOs are exhausted.
+    The request is sent by the first iteration, a non 200 response raises UnitErrorException.
+    """
 
+    def __init__(self, send: Callable, lazy: bool = False, chunk_size: int = 64 * 1024):
+        self.send = send
+        self.lazy = lazy
+        self.chunk_size = chunk_size
+        self.response = None
+        self.members = None
+        self.included = []
+        self.meta = None
 
-class BaseResource(object):
-    def __init__(self, api_url, token, retries_amount):
-        global _retries
+    def __iter__(self):
+        return self
 
+    def __next__(self):
+        if self.members is None:
+            self.open()
+
+        try:
+            for key, value in self.members:
+                if key == "data":
+                    return decode(value, self.lazy)
+                elif key == "included":
+                    self.included.append(decode(value, self.lazy))
+                elif key == "meta":
+                    self.meta = value
+        except BaseException:
+            self.close()
+            raise
+
+        self.close()
+        raise StopIteration
+
+    def open(self):
+        self.response = self.send()
+        if self.response.status_code != 200:
+            try:
+                raise UnitErrorException(to_unit_response(self.response))
+            finally:
+                self.close()
+
+        self.members = iter_json_members(self.response.iter_content(self.chunk_size), ("data", "included"))
+
+    def close(self):
+        if self.response is not None:
+            self.response.close()
+        self.members = iter(())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ResourcePipeline(object):
+    """
+    What BaseResource and AsyncBaseResource share: the settings of a resource and the decisions every request goes
+    through, retries, deadline, rate limiter, circuit breaker and hedging. The two only differ where they wait or send.
+    """
+
+    def __init__(self, api_url, token, retries_amount: Union[int, RetryPolicy], transport):
         self.api_url = api_url.rstrip("/")
         self.token = token
+        self.transport = transport
         self.headers = {
             "content-type": "application/vnd.api+json",
             "authorization": f"Bearer {self.token}",
             "X-UNIT-SDK": f"unit-python-sdk@v{sdk_version}"
         }
-        # max_tries must be greater than 0 due to an infinite loop of backoff library otherwise
-        _retries = retries_amount if retries_amount > 1 else 1
+        self.retry_policy = retries_amount if isinstance(retries_amount, RetryPolicy) else RetryPolicy(retries_amount)
+        self.timeout: Optional[Timeout] = None
 
-    @backoff.on_predicate(backoff.expo,
-                          backoff_handler,
-                          max_tries=get_max_retries,
-                          jitter=backoff.random_jitter)
-    def get(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
-        return requests.get(f"{self.api_url}/{resource}", params=params, headers=self.__merge_headers(headers))
+    def with_retry(self, policy: Optional[RetryPolicy] = None, **changes):
+        """
+        Returns a copy of this resource retrying with policy, or with its own policy updated by changes,
+        e.g. unit.authorization_requests.with_retry(max_tries=1).approve(request). The copy shares the transport.
+        """
+        resource = copy.copy(self)
+        resource.retry_policy = (policy or self.retry_policy).replace(**changes)
+        return resource
 
-    @backoff.on_predicate(backoff.expo,
-                          backoff_handler,
-                          max_tries=get_max_retries,
-                          jitter=backoff.random_jitter)
-    def post(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
-        return requests.post(f"{self.api_url}/{resource}", data=data, headers=self.__merge_headers(headers))
+    def with_timeout(self, timeout: Optional[Timeout] = None, **changes):
+        """
+        Returns a copy of this resource whose calls are limited by timeout, or by the transport's timeout
+        updated by changes, e.g. unit.authorization_requests.with_timeout(total=0.5). The copy shares the transport.
+        """
+        resource = copy.copy(self)
+        resource.timeout = (timeout or self.timeout or self.transport.timeout or Timeout()).replace(**changes)
+        return resource
 
-    @backoff.on_predicate(backoff.expo,
-                          backoff_idempotency_key_handler,
-                          max_tries=get_max_retries,
-                          jitter=backoff.random_jitter)
-    def post_create(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
-        return requests.post(f"{self.api_url}/{resource}", data=data, headers=self.__merge_headers(headers))
+    def to_unit_response(self, response, lazy: bool = False) -> Union[UnitResponse, UnitError]:
+        single_flight = self.transport.single_flight
+        if single_flight is not None:
+            return single_flight.decode(response, lazy, to_unit_response)
 
-    @backoff.on_predicate(backoff.expo,
-                          backoff_handler,
-                          max_tries=get_max_retries,
-                          jitter=backoff.random_jitter)
-    def post_full_path(self, path: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
-        return requests.post(path, data=data, headers=self.__merge_headers(headers))
+        return to_unit_response(response, lazy)
 
-    @backoff.on_predicate(backoff.expo,
-                          backoff_handler,
-                          max_tries=get_max_retries,
-                          jitter=backoff.random_jitter)
-    def patch(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
-        return requests.patch(f"{self.api_url}/{resource}", data=data, headers=self.__merge_headers(headers))
+    def retrying(self, request: Callable, predicate, on_retry: Callable):
+        """
+        request wrapped by the retry policy, along with the timeout and the deadline of the call.
+        Retries stop at the deadline, an attempt that would start past it raises instead. on_retry closes the
+        responses that are retried.
+        """
+        timeout = self.timeout or self.transport.timeout
+        policy = self.retry_policy
+        deadline = None
+        if timeout is not None and timeout.total is not None:
+            deadline = time.monotonic() + timeout.total
+            if policy.max_time is None or policy.max_time > timeout.total:
+                policy = policy.replace(max_time=timeout.total)
 
-    @backoff.on_predicate(backoff.expo,
-                          backoff_handler,
-                          max_tries=get_max_retries,
-                          jitter=backoff.random_jitter)
-    def delete(self, resource: str, data: Dict = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
-        return requests.delete(f"{self.api_url}/{resource}", data=data, headers=self.__merge_headers(headers))
+        return policy.retrying(request, predicate, on_retry), timeout, deadline
 
-    @backoff.on_predicate(backoff.expo,
-                          backoff_handler,
-                          max_tries=get_max_retries,
-                          jitter=backoff.random_jitter)
-    def put(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        return requests.put(f"{self.api_url}/{resource}", data=data, headers=self.__merge_headers(headers))
+    def reserve_attempt(self, method: str, url: str, deadline: Optional[float]) -> float:
+        """
+        Takes a rate limiter token for an attempt and returns the seconds to wait before sending it.
+        """
+        limiter = self.transport.rate_limiter
+        if limiter is None:
+            return 0.0
+
+        wait = limiter.reserve(self.resource)
+        if wait > 0 and deadline is not None and time.monotonic() + wait >= deadline:
+            raise UnitTimeoutException(f"{method} {url} would be rate limited past its deadline")
+
+        return wait
+
+    def start_attempt(self, method: str, url: str, timeout: Optional[Timeout],
+                      deadline: Optional[float]) -> Optional[Timeout]:
+        """
+        Lets the circuit breaker reject an attempt and returns its timeout, bounded by what is left of the deadline.
+        """
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise UnitTimeoutException(f"{method} {url} exceeded its deadline")
+            timeout = timeout.bounded(remaining)
 
-    def __merge_headers(self, headers: Optional[Dict[str, str]] = None):
+        breaker = self.transport.circuit_breaker
+        if breaker is not None:
+            breaker.before_call(self.resource)
+
+        return timeout
+
+    def hedging_for(self, method: str):
+        return self.transport.hedging if method == "GET" else None
+
+    def admit_hedge(self) -> bool:
+        """
+        Takes a rate limiter token for a hedge, which is only sent if one is available right away.
+        """
+        limiter = self.transport.rate_limiter
+        return limiter is None or limiter.try_acquire(self.resource)
+
+    def attempt_failed(self, error: Exception):
+        breaker = self.transport.circuit_breaker
+        if breaker is not None:
+            breaker.record(self.resource, error=error)
+
+    def attempt_done(self, response):
+        breaker = self.transport.circuit_breaker
+        if breaker is not None:
+            breaker.record(self.resource, response)
+        limiter = self.transport.rate_limiter
+        if limiter is not None:
+            limiter.update(self.resource, response)
+
+        return response
+
+    def merge_headers(self, headers: Optional[Dict[str, str]] = None):
         if not headers:
             return self.headers
         else:
@@ -119,3 +281,159 @@ class BaseResource(object):
 
     def is_20x(self, status: int):
         return status == 200 or status == 201 or status == 204
+
+
+class BaseResource(ResourcePipeline):
+    def __init__(self, api_url, token, retries_amount: Union[int, RetryPolicy],
+                 transport: Optional[Transport] = None):
+        super().__init__(api_url, token, retries_amount, transport or RequestsTransport())
+
+    def get(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        url, headers = f"{self.api_url}/{resource}", self.merge_headers(headers)
+        single_flight = self.transport.single_flight
+        if single_flight is not None:
+            send = functools.partial(self.__send, backoff_handler, "GET", url, params=params, headers=headers)
+            return single_flight.send(single_flight.key("GET", url, params, headers), send)
+
+        return self.__send(backoff_handler, "GET", url, params=params, headers=headers)
+
+    def get_stream(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        """
+        GET whose response body is read as it is consumed, see ListStream. The caller closes the response.
+        """
+        return self.__send(backoff_handler, "GET", f"{self.api_url}/{resource}", params=params,
+                           headers=self.merge_headers(headers), stream=True)
+
+    def cached_get(self, resource: str, params: Dict = None):
+        """
+        GET of a slow changing resource, served from the transport's ResponseCache when it holds a fresh response.
+        """
+        cache = self.transport.cache
+        if cache is None:
+            return BaseResource.get(self, resource, params)
+
+        key = cache.key(self.api_url, resource, params, self.headers["authorization"])
+        response = cache.get(self.resource, key)
+        if response is None:
+            response = BaseResource.get(self, resource, params)
+            cache.set(self.resource, key, response)
+
+        return response
+
+    def post(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return self.__send(backoff_handler, "POST", f"{self.api_url}/{resource}", data=data,
+                           headers=self.merge_headers(headers))
+
+    def post_create(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        """
+        POST creating a resource. It is only retried if it holds an idempotency key, its own or one generated by
+        the transport's idempotency_keys, which is kept by every attempt.
+        """
+        data, idempotent = with_idempotency_key(data, self.transport.idempotency_keys)
+        data = json_backend.dumps(data) if data is not None else None
+        return self.__send(backoff_handler if idempotent else no_retry, "POST", f"{self.api_url}/{resource}",
+                           data=data, headers=self.merge_headers(headers))
+
+    def post_full_path(self, path: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return self.__send(backoff_handler, "POST", path, data=data, headers=self.merge_headers(headers))
+
+    def patch(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return self.__send(backoff_handler, "PATCH", f"{self.api_url}/{resource}", data=data,
+                           headers=self.merge_headers(headers))
+
+    def delete(self, resource: str, data: Dict = None, headers: Optional[Dict[str, str]] = None):
+        data = json_backend.dumps(data) if data is not None else None
+        return self.__send(backoff_handler, "DELETE", f"{self.api_url}/{resource}", data=data,
+                           headers=self.merge_headers(headers))
+
+    def put(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        return self.__send(backoff_handler, "PUT", f"{self.api_url}/{resource}", data=data,
+                           headers=self.merge_headers(headers))
+
+    def paginate(self, list_page, params, prefetch: bool = False, lazy: bool = False):
+        """
+        Lazily yields the DTOs of every page of a list endpoint, starting at params.offset.
+        With prefetch the next page is requested in the background while the current one is consumed.
+        At most one page is fetched ahead, so memory use stays constant however many pages there are.
+        lazy is handed on to list_page, see DtoDecoder.decode.
+        """
+        params = copy.copy(params)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending = None
+        try:
+            response = list_page(params, lazy)
+            while True:
+                if isinstance(response, UnitError):
+                    raise UnitErrorException(response)
+
+                next_offset = get_next_offset(params.offset, params.limit, response)
+                pending = None
+                if next_offset is not None:
+                    params = copy.copy(params)
+                    params.offset = next_offset
+                    if executor:
+                        pending = executor.submit(list_page, params, lazy)
+
+                yield from response.data
+
+                if next_offset is None:
+                    return
+                response = pending.result() if pending else list_page(params, lazy)
+        finally:
+            if executor:
+                # a page prefetched for a consumer that stopped early isn't requested if it hasn't started yet
+                if pending:
+                    pending.cancel()
+                executor.shutdown(wait=False)
+
+    def __send(self, predicate, method: str, url: str, **kwargs):
+        send, timeout, deadline = self.retrying(self.__request, predicate, close_retried)
+        return send(method, url, timeout=timeout, deadline=deadline, **kwargs)
+
+    def __request(self, method: str, url: str, timeout: Optional[Timeout] = None,
+                  deadline: Optional[float] = None, **kwargs):
+        wait = self.reserve_attempt(method, url, deadline)
+        if wait > 0:
+            time.sleep(wait)
+
+        timeout = self.start_attempt(method, url, timeout, deadline)
+        try:
+            hedging = self.hedging_for(method)
+            if hedging is not None:
+                request = functools.partial(self.transport.request, method, url, timeout=timeout, **kwargs)
+                response = hedging.send(self.resource, request, self.admit_hedge)
+            else:
+                response = self.transport.request(method, url, timeout=timeout, **kwargs)
+        except Exception as e:
+            self.attempt_failed(e)
+            raise
+
+        return self.attempt_done(response)
+
+
+class GetManyMixin(object):
+    """
+    get_many of the resources whose get takes an id.
+    """
+
+    def get_many(self, ids: Iterable[str], concurrency: int = 8, **kwargs) -> List:
+        """
+        Calls get(id, **kwargs) for every id, at most concurrency at a time, and returns the results in the order
+        of ids. An error doesn't stop the others: it is returned in place of its result, as a UnitError or as the
+        exception the call raised. Keep concurrency within the transport's connection pool size.
+        """
+        def get(_id):
+            try:
+                return self.get(_id, **kwargs)
+            except Exception as e:
+                return e
+
+        ids = list(ids)
+        if concurrency <= 1 or len(ids) <= 1:
+            return [get(_id) for _id in ids]
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(ids))) as executor:
+            return list(executor.map(get, ids))
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional
+from unit.models import UnitError
+
+
+class BatchResult(object):
+    """
+    Outcome of a call queued in a batch: the value it returned, a UnitError included, or the exception it raised.
+    """
+    __slots__ = ("index", "call", "args", "kwargs", "value")
+
+    def __init__(self, index: int, call: Callable, args: tuple, kwargs: dict):
+        self.index = index
+        self.call = call
+        self.args = args
+        self.kwargs = kwargs
+        self.value = None
+
+    @property
+    def error(self) -> bool:
+        return isinstance(self.value, UnitError)
+
+    @property
+    def exception(self) -> bool:
+        return isinstance(self.value, BaseException)
+
+    @property
+    def success(self) -> bool:
+        return not self.error and not self.exception
+
+
+class BatchResults(object):
+    """
+    The results of a batch, in the order their calls were added.
+    """
+    __slots__ = ("results",)
+
+    def __init__(self, results: List[BatchResult]):
+        self.results = results
+
+    @property
+    def successes(self) -> List[BatchResult]:
+        return [r for r in self.results if r.success]
+
+    @property
+    def errors(self) -> List[BatchResult]:
+        return [r for r in self.results if r.error]
+
+    @property
+    def exceptions(self) -> List[BatchResult]:
+        return [r for r in self.results if r.exception]
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> BatchResult:
+        return self.results[index]
+
+
+class Batch(object):
+    """
+    Queues calls of resource methods, e.g. batch.add(unit.cards.freeze, card_id), and runs them concurrently over
+    the client's connection pool. Every call goes through its resource as usual, so the transport's rate limiter,
+    circuit breaker and retries apply to it.
+    Used as a context manager, the queued calls run on exit and their results are kept in results.
+
+    :param concurrency: calls running at a time, keep it within the transport's connection pool size.
+    :param on_progress: called with the number of finished calls, their total and the BatchResult of the last one,
+    from the thread that runs the batch.
+    """
+
+    def __init__(self, concurrency: int = 8,
+                 on_progress: Optional[Callable[[int, int, BatchResult], None]] = None):
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self.queue: List[BatchResult] = []
+        self.results: Optional[BatchResults] = None
+
+    def add(self, call: Callable, *args, **kwargs) -> int:
+        """
+        Queues call(*args, **kwargs) and returns the index of its result.
+        """
+        self.queue.append(BatchResult(len(self.queue), call, args, kwargs))
+        return len(self.queue) - 1
+
+    def run(self) -> BatchResults:
+        queue, self.queue = self.queue, []
+        if queue:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(queue)))) as executor:
+                futures = [executor.submit(execute, result) for result in queue]
+                for done, future in enumerate(as_completed(futures), 1):
+                    if self.on_progress is not None:
+                        self.on_progress(done, len(queue), future.result())
+
+        self.results = BatchResults(queue)
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.run()
+
+
+def execute(result: BatchResult) -> BatchResult:
+    try:
+        result.value = result.call(*result.args, **result.kwargs)
+    except Exception as e:
+        result.value = e
+
+    return result
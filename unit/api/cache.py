@@ -0,0 +1,259 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
+from urllib.parse import urlencode
+
+# seconds the responses of a family are cached for unless configured otherwise
+DEFAULT_TTLS = {
+    "institutions": 24 * 60 * 60,
+    "payments/billpay/billers": 60 * 60,
+    "atm-locations": 60 * 60,
+    "accounts": 60 * 60,
+    "cards": 60,
+}
+
+
+class CacheBackend(object):
+    """
+    Stores cached response bodies by key. Keys start with the path of the request, followed by a ? and its query,
+    and end with the API URL and a digest of the credentials the request was sent with.
+    Implementations are expected to be safe to call from multiple threads.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError()
+
+    def set(self, key: str, value: bytes, ttl: float):
+        raise NotImplementedError()
+
+    def delete(self, prefix: Optional[str] = None):
+        """
+        Deletes the entries of the path prefix and the paths below it, or every entry.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+
+def matches(key: str, prefix: str) -> bool:
+    return key.startswith(prefix) and len(key) > len(prefix) and key[len(prefix)] in "/?"
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache, bounded by number of entries and by the total size of the cached bodies.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires = entry
+            if expires <= time.monotonic():
+                self.__remove(key)
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float):
+        if len(value) > self.max_bytes:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self.__remove(key)
+            self.entries[key] = (value, time.monotonic() + ttl)
+            self.size += len(value)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self.__remove(next(iter(self.entries)))
+
+    def delete(self, prefix: Optional[str] = None):
+        with self.lock:
+            for key in [k for k in self.entries if prefix is None or matches(k, prefix)]:
+                self.__remove(key)
+
+    def __remove(self, key: str):
+        value, _ = self.entries.pop(key)
+        self.size -= len(value)
+
+
+class SqliteCache(CacheBackend):
+    """
+    On-disk LRU cache in a SQLite database, shared by every process that opens the same path.
+    Entries expire by wall clock time, as processes don't share a monotonic clock.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, timeout: float = 5.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.connection = None
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        # a connection inherited from a parent process must not be used, every process opens its own
+        if self.connection is None or self.pid != os.getpid():
+            self.connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                              check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                                    "expires REAL NOT NULL, used REAL NOT NULL)")
+            self.pid = os.getpid()
+
+        return self.connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self.lock:
+            connection = self.connect()
+            row = connection.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            if row[1] <= now:
+                connection.execute("DELETE FROM entries WHERE key = ? AND expires <= ?", (key, now))
+                return None
+
+            connection.execute("UPDATE entries SET used = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        now = time.time()
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (key, value, now + ttl, now))
+                connection.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+                connection.execute("DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY used DESC "
+                                   "LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def delete(self, prefix: Optional[str] = None):
+        with self.lock:
+            connection = self.connect()
+            if prefix is None:
+                connection.execute("DELETE FROM entries")
+            else:
+                connection.execute("DELETE FROM entries WHERE substr(key, 1, ?) = ? AND substr(key, ?, 1) IN ('/', '?')",
+                                   (len(prefix), prefix, len(prefix) + 1))
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None and self.pid == os.getpid():
+                self.connection.close()
+            self.connection = None
+
+
+class CachedResponse(object):
+    """
+    A cached 200 response, standing in for the transport's response when decoding it.
+    """
+    __slots__ = ("content", "__weakref__")
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class CacheStats(object):
+    __slots__ = ("hits", "misses")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(object):
+    """
+    Caches the responses of the calls of slow changing resources, such as institutions or ATM locations.
+    Only 200 responses are cached, for the TTL of their endpoint family.
+
+    :param backend: where responses are stored, a MemoryCache by default, a SqliteCache to share them between processes.
+    :param ttls: seconds the responses of a family are cached for, e.g. {"institutions": 3600}, on top of DEFAULT_TTLS.
+    A TTL of 0 disables caching for the family.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttls: Optional[Dict[str, float]] = None):
+        self.backend = backend or MemoryCache()
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.families: Dict[str, CacheStats] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(api_url: str, path: str, params: Optional[Dict] = None, authorization: Optional[str] = None) -> str:
+        """
+        Key of a request, ending with a digest of its authorization header so that clients using different tokens
+        never read each other's responses, even through a shared SqliteCache.
+        """
+        query = urlencode(sorted((k, v) for k, v in params.items() if v is not None), doseq=True) if params else ""
+        credentials = hashlib.sha256(authorization.encode()).hexdigest() if authorization else ""
+        return f"{path}?{query}#{api_url}#{credentials}"
+
+    def get(self, family: str, key: str) -> Optional[CachedResponse]:
+        if not self.ttls.get(family):
+            return None
+
+        value = self.backend.get(key)
+        with self.lock:
+            stats = self.families.get(family)
+            if stats is None:
+                stats = self.families[family] = CacheStats()
+            if value is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+
+        return CachedResponse(value) if value is not None else None
+
+    def set(self, family: str, key: str, response):
+        ttl = self.ttls.get(family)
+        if ttl and response.status_code == 200:
+            self.backend.set(key, response.content, ttl)
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        Drops the cached responses of path and the paths below it, e.g. "cards/42" or "institutions", or all of them.
+        """
+        self.backend.delete(path.strip("/") if path else None)
+
+    def stats(self, family: Optional[str] = None) -> CacheStats:
+        """
+        Hits and misses of family, or of every family, in this process.
+        """
+        with self.lock:
+            if family is not None:
+                return self.families.get(family) or CacheStats()
+
+            total = CacheStats()
+            for stats in self.families.values():
+                total.hits += stats.hits
+                total.misses += stats.misses
+            return total
+
+    def close(self):
+        self.backend.close()
@@ -0,0 +1,123 @@
+import threading
+from time import monotonic
+from typing import Optional, Dict, Callable, List, Tuple
+from unit.api.exceptions import UnitCircuitOpenException
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+def is_failure(response) -> bool:
+    """
+    Responses counted against a circuit: timeouts and server errors. Rate limits are left to RateLimiter.
+    """
+    return response.status_code == 408 or 500 <= response.status_code <= 599
+
+
+class Circuit(object):
+    __slots__ = ("state", "failures", "opened_at", "trials", "rejected")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trials = 0
+        self.rejected = 0
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker per endpoint family (a resource such as payments or transactions), shared by every resource of
+    a client through its transport. After failure_threshold consecutive failed requests the circuit of a family
+    opens and its calls fail fast with UnitCircuitOpenException. Once cool_down seconds passed it turns half-open
+    and lets half_open_calls trial calls through: their success closes the circuit, a failure opens it again.
+
+    :param failure_threshold: consecutive failures that open a closed circuit.
+    :param cool_down: seconds an open circuit rejects calls.
+    :param half_open_calls: trial calls let through at once while half-open.
+    :param on_state_change: called with the family, the previous and the new state on every transition,
+    e.g. to export a metric or start shedding load.
+    :param failure: tells whether a response counts as a failure, timeouts and server errors by default.
+    Exceptions raised by the transport always count.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cool_down: float = 30, half_open_calls: int = 1,
+                 on_state_change: Optional[Callable[[str, str, str], None]] = None,
+                 failure: Callable[[object], bool] = is_failure):
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.half_open_calls = half_open_calls
+        self.on_state_change = on_state_change
+        self.failure = failure
+        self.circuits: Dict[str, Circuit] = {}
+        self.lock = threading.Lock()
+
+    def circuit(self, family: str) -> Circuit:
+        circuit = self.circuits.get(family)
+        if circuit is None:
+            circuit = self.circuits[family] = Circuit()
+
+        return circuit
+
+    def state(self, family: str) -> str:
+        with self.lock:
+            return self.circuit(family).state
+
+    def before_call(self, family: str):
+        """
+        Raises UnitCircuitOpenException if a call of family may not be sent now.
+        """
+        transitions = []
+        with self.lock:
+            circuit = self.circuit(family)
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.cool_down - monotonic()
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise UnitCircuitOpenException(family, retry_in)
+                self.__transition(family, circuit, HALF_OPEN, transitions)
+
+            if circuit.state == HALF_OPEN:
+                if circuit.trials >= self.half_open_calls:
+                    circuit.rejected += 1
+                    raise UnitCircuitOpenException(family, 0)
+                circuit.trials += 1
+
+        self.__notify(transitions)
+
+    def record(self, family: str, response=None, error: Optional[BaseException] = None):
+        """
+        Records the outcome of a call of family, either its response or the exception raised sending it.
+        """
+        failed = error is not None or self.failure(response)
+        transitions = []
+        with self.lock:
+            circuit = self.circuit(family)
+            if circuit.state == HALF_OPEN:
+                circuit.trials = max(0, circuit.trials - 1)
+                self.__transition(family, circuit, OPEN if failed else CLOSED, transitions)
+            elif failed:
+                circuit.failures += 1
+                if circuit.state == CLOSED and circuit.failures >= self.failure_threshold:
+                    self.__transition(family, circuit, OPEN, transitions)
+            else:
+                circuit.failures = 0
+
+        self.__notify(transitions)
+
+    @staticmethod
+    def __transition(family: str, circuit: Circuit, state: str, transitions: List[Tuple[str, str, str]]):
+        transitions.append((family, circuit.state, state))
+        circuit.state = state
+        circuit.failures = 0
+        if state == OPEN:
+            circuit.opened_at = monotonic()
+        if state != HALF_OPEN:
+            circuit.trials = 0
+
+    def __notify(self, transitions: List[Tuple[str, str, str]]):
+        # called once the lock is released, so callbacks may inspect the breaker
+        if self.on_state_change:
+            for family, previous, state in transitions:
+                self.on_state_change(family, previous, state)
@@ -1,30 +1,22 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.counterparty import *
-from unit.models.codecs import DtoDecoder
 
 
-class CounterpartyResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class CounterpartyResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "counterparties"
 
     def create(self, request: Union[CreateCounterpartyRequest, CreateCounterpartyWithTokenRequest]) -> Union[UnitResponse[CounterpartyDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CounterpartyDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def update(self, request: PatchCounterpartyRequest) -> Union[UnitResponse[CounterpartyDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.counterparty_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CounterpartyDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def delete(self, counterparty_id: str) -> Union[UnitResponse, UnitError]:
         response = super().delete(f"{self.resource}/{counterparty_id}")
@@ -35,25 +27,16 @@ class CounterpartyResource(BaseResource):
 
     def get(self, counterparty_id: str) -> Union[UnitResponse[CounterpartyDTO], UnitError]:
         response = super().get(f"{self.resource}/{counterparty_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CounterpartyDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListCounterpartyParams = None) -> Union[UnitResponse[List[CounterpartyDTO]], UnitError]:
+    def list(self, params: ListCounterpartyParams = None, lazy: bool = False) -> Union[UnitResponse[List[CounterpartyDTO]], UnitError]:
         params = params or ListCounterpartyParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CounterpartyDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListCounterpartyParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[CounterpartyDTO]:
+        return super().paginate(self.list, params or ListCounterpartyParams(), prefetch, lazy)
 
     def get_balance(self, counterparty_id: str) -> Union[UnitResponse[CounterpartyBalanceDTO], UnitError]:
         response = super().get(f"{self.resource}/{counterparty_id}/balance")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CounterpartyBalanceDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
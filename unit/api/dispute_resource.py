@@ -1,28 +1,21 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.dispute import *
-from unit.models.codecs import DtoDecoder
 
 
-class DisputeResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class DisputeResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "disputes"
 
     def get(self, dispute_id: str) -> Union[UnitResponse[DisputeDTO], UnitError]:
         response = super().get(f"{self.resource}/{dispute_id}")
-        if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[DisputeDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListDisputeParams = None) -> Union[UnitResponse[List[DisputeDTO]], UnitError]:
+    def list(self, params: ListDisputeParams = None, lazy: bool = False) -> Union[UnitResponse[List[DisputeDTO]], UnitError]:
         params = params or ListDisputeParams()
         response = super().get(self.resource, params.to_dict())
-        if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[DisputeDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
-
+        return super().to_unit_response(response, lazy)
 
+    def iter_all(self, params: ListDisputeParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[DisputeDTO]:
+        return super().paginate(self.list, params or ListDisputeParams(), prefetch, lazy)
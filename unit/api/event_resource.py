@@ -1,29 +1,24 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.event import *
-from unit.models.codecs import DtoDecoder
 
 
-class EventResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class EventResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "events"
 
     def get(self, event_id: str) -> Union[UnitResponse[EventDTO], UnitError]:
         response = super().get(f"{self.resource}/{event_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[EventDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListEventParams = None) -> Union[UnitResponse[List[EventDTO]], UnitError]:
+    def list(self, params: ListEventParams = None, lazy: bool = False) -> Union[UnitResponse[List[EventDTO]], UnitError]:
         params = params or ListEventParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[EventDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListEventParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[EventDTO]:
+        return super().paginate(self.list, params or ListEventParams(), prefetch, lazy)
 
     def fire(self, event_id: str) -> Union[UnitResponse, UnitError]:
         response = super().post(f"{self.resource}/{event_id}")
@@ -0,0 +1,36 @@
+from unit.models import UnitError
+
+
+class UnitException(Exception):
+    """
+    Base class of the exceptions raised by the SDK.
+    """
+    pass
+
+
+class UnitErrorException(UnitException):
+    """
+    Raised where an API error cannot be returned as a UnitError, e.g. while iterating over the pages of a list.
+    """
+
+    def __init__(self, error: UnitError):
+        super().__init__(str(error))
+        self.error = error
+
+
+class UnitTimeoutException(UnitException):
+    """
+    Raised when a request times out connecting or reading, or when a call runs past its total deadline.
+    """
+    pass
+
+
+class UnitCircuitOpenException(UnitException):
+    """
+    Raised instead of sending a request while the circuit of its endpoint family is open, see CircuitBreaker.
+    """
+
+    def __init__(self, family: str, retry_in: float):
+        super().__init__(f"the circuit of {family} is open, calls are rejected for another {retry_in:.1f}s")
+        self.family = family
+        self.retry_in = retry_in
@@ -0,0 +1,237 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from time import monotonic
+from typing import Optional, Dict, Callable
+
+
+class LatencyWindow(object):
+    """
+    The latencies of the last size calls of an endpoint family.
+    """
+    __slots__ = ("samples", "quantile", "recompute_every", "value", "pending")
+
+    def __init__(self, size: int, quantile: float, recompute_every: int = 10):
+        self.samples = deque(maxlen=size)
+        self.quantile = quantile
+        self.recompute_every = recompute_every
+        self.value = None
+        self.pending = 0
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+        self.pending += 1
+        if self.value is None or self.pending >= self.recompute_every:
+            ordered = sorted(self.samples)
+            self.value = ordered[min(len(ordered) - 1, int(len(ordered) * self.quantile))]
+            self.pending = 0
+
+
+class Hedging(object):
+    """
+    Hedges idempotent GETs: when a GET hasn't been answered after delay seconds, an identical request is sent on
+    another pooled connection. The first response wins and the other request is cancelled, or abandoned and closed
+    when it can't be. Every GET earns max_extra_load hedges, so hedging adds at most that share of extra requests.
+
+    :param delay: seconds after which a GET is hedged, by default the observed quantile of the family's latency.
+    :param quantile: latency quantile used as delay, 0.95 for the p95.
+    :param min_samples: calls of a family observed before it is hedged at its quantile.
+    :param window: calls of a family its latency quantile is computed from.
+    :param max_extra_load: extra requests hedging may add, as a share of all GETs.
+    :param max_workers: threads sending the hedged requests of synchronous clients and the calls they hedge.
+    """
+
+    def __init__(self, delay: Optional[float] = None, quantile: float = 0.95, min_samples: int = 20,
+                 window: int = 200, max_extra_load: float = 0.05, max_workers: int = 16):
+        self.delay = delay
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.window = window
+        self.max_extra_load = max_extra_load
+        self.max_workers = max_workers
+        self.latencies: Dict[str, LatencyWindow] = {}
+        # credits start at a single hedge and are capped so an idle period doesn't allow a burst of them
+        self.credits = 1.0
+        self.max_credits = max(1.0, max_extra_load * 100)
+        self.hedged = 0
+        self.lock = threading.Lock()
+        self.executor = None
+        self.busy = 0
+        self.closed = False
+
+    def delay_for(self, family: str) -> Optional[float]:
+        """
+        Seconds after which a GET of family is hedged, None while too few of its calls were observed.
+        """
+        if self.delay is not None:
+            return self.delay
+
+        latency = self.latencies.get(family)
+        if latency is None or len(latency.samples) < self.min_samples:
+            return None
+
+        return latency.value
+
+    def observe(self, family: str, seconds: float):
+        with self.lock:
+            latency = self.latencies.get(family)
+            if latency is None:
+                latency = self.latencies[family] = LatencyWindow(self.window, self.quantile)
+            latency.add(seconds)
+            self.credits = min(self.max_credits, self.credits + self.max_extra_load)
+
+    def take_credit(self) -> bool:
+        with self.lock:
+            if self.credits < 1:
+                return False
+
+            self.credits -= 1
+            self.hedged += 1
+            return True
+
+    def refund_credit(self):
+        with self.lock:
+            self.credits += 1
+            self.hedged -= 1
+
+    def reserve_worker(self, hedge: bool = False) -> bool:
+        """
+        Reserves an idle worker, False when they are all busy: calls never queue for a worker, so the delay before
+        a hedge isn't spent waiting for one. A hedge also takes a credit.
+        """
+        with self.lock:
+            if self.closed or self.busy >= self.max_workers or (hedge and self.credits < 1):
+                return False
+
+            self.busy += 1
+            if hedge:
+                self.credits -= 1
+                self.hedged += 1
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="unit-hedge")
+            return True
+
+    def release_worker(self):
+        with self.lock:
+            self.busy -= 1
+
+    def submit(self, request: Callable[[], object]) -> Future:
+        """
+        Runs request on the worker reserved for it.
+        """
+        return self.executor.submit(self.__run, request)
+
+    def __run(self, request: Callable[[], object]):
+        try:
+            if self.closed:
+                # still queued when the client was closed
+                raise CancelledError()
+            return request()
+        finally:
+            self.release_worker()
+
+    def send(self, family: str, request: Callable[[], object], admit: Optional[Callable[[], bool]] = None):
+        """
+        Calls request, hedging it with a second call if the first one is slow. admit is asked before sending a
+        hedge, e.g. for a rate limiter token, and the call isn't hedged when it declines.
+        The caller's thread waits for whichever call answers first, so the first call runs on a worker when one
+        is idle. When every worker is busy it runs on the caller's thread and isn't hedged, hedging never limits
+        how many GETs are sent at once.
+        """
+        delay = self.delay_for(family)
+        start = monotonic()
+        if delay is None or not self.reserve_worker():
+            response = request()
+            self.observe(family, monotonic() - start)
+            return response
+
+        primary = self.submit(request)
+        done, _ = wait([primary], timeout=delay)
+        hedge = None
+        if not done and self.reserve_worker(hedge=True):
+            if admit is None or admit():
+                hedge = self.submit(request)
+            else:
+                self.release_worker()
+                self.refund_credit()
+        if hedge is None:
+            response = primary.result()
+            self.observe(family, monotonic() - start)
+            return response
+
+        done, pending = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = done.pop()
+        if winner.exception() is not None and pending:
+            # the first call failed, the other one may still succeed
+            winner = pending.pop()
+            wait([winner])
+
+        # the loser may have completed too, or complete later, its response is closed either way
+        loser = hedge if winner is primary else primary
+        if loser.cancel():
+            # the loser was still queued and never ran, its worker and a hedge's credit are given back
+            self.release_worker()
+            if loser is hedge:
+                self.refund_credit()
+        else:
+            loser.add_done_callback(close_response)
+
+        response = winner.result()
+        self.observe(family, monotonic() - start)
+        return response
+
+    async def send_async(self, family: str, request: Callable[[], object],
+                         admit: Optional[Callable[[], bool]] = None):
+        """
+        Awaits request(), hedging it with a second call if the first one is slow, see send.
+        """
+        delay = self.delay_for(family)
+        start = monotonic()
+        if delay is None:
+            response = await request()
+            self.observe(family, monotonic() - start)
+            return response
+
+        primary = asyncio.ensure_future(request())
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self.take_credit():
+            response = await primary
+            self.observe(family, monotonic() - start)
+            return response
+
+        if admit is not None and not admit():
+            self.refund_credit()
+            response = await primary
+            self.observe(family, monotonic() - start)
+            return response
+
+        hedge = asyncio.ensure_future(request())
+        done, pending = await asyncio.wait({primary, hedge}, return_when=asyncio.FIRST_COMPLETED)
+        winner = done.pop()
+        if winner.exception() is not None and pending:
+            winner = pending.pop()
+            await asyncio.wait({winner})
+
+        loser = hedge if winner is primary else primary
+        loser.cancel()
+        loser.add_done_callback(aclose_response)
+
+        response = winner.result()
+        self.observe(family, monotonic() - start)
+        return response
+
+    def close(self):
+        self.closed = True
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+
+def close_response(future):
+    if not future.cancelled() and future.exception() is None and hasattr(future.result(), "close"):
+        future.result().close()
+
+
+def aclose_response(task):
+    if not task.cancelled() and task.exception() is None and hasattr(task.result(), "aclose"):
+        asyncio.ensure_future(task.result().aclose())
@@ -0,0 +1,31 @@
+from typing import Callable, Dict, Optional, Tuple
+
+
+def new_idempotency_key() -> str:
+    """
+    A random UUID, unique to one create request and reused by all of its attempts.
+    """
+    import uuid
+
+    return str(uuid.uuid4())
+
+
+def with_idempotency_key(data: Optional[Dict], new_key: Optional[Callable[[], str]] = None) \
+        -> Tuple[Optional[Dict], bool]:
+    """
+    Returns the JSON:API payload of a create request, given a key from new_key if it has none, and whether it
+    holds an idempotency key, which makes repeating the request safe. data itself is never modified.
+    """
+    resource = data.get("data") if isinstance(data, dict) else None
+    attributes = resource.get("attributes") if isinstance(resource, dict) else None
+    if not isinstance(attributes, dict):
+        return data, False
+
+    if attributes.get("idempotencyKey") is not None:
+        return data, True
+
+    if new_key is None:
+        return data, False
+
+    attributes = dict(attributes, idempotencyKey=new_key())
+    return dict(data, data=dict(resource, attributes=attributes)), True
@@ -1,47 +1,31 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.payment import *
-from unit.models.codecs import DtoDecoder
 
 
-class PaymentResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class PaymentResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "payments"
 
     def create(self, request: CreatePaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def update(self, request: PatchPaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.payment_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def get(self, payment_id: str, include: Optional[str] = "") -> Union[UnitResponse[PaymentDTO], UnitError]:
         response = super().get(f"{self.resource}/{payment_id}", {"include": include})
-        if response.status_code == 200:
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListPaymentParams = None) -> Union[UnitResponse[List[PaymentDTO]], UnitError]:
+    def list(self, params: ListPaymentParams = None, lazy: bool = False) -> Union[UnitResponse[List[PaymentDTO]], UnitError]:
         params = params or ListPaymentParams()
         response = super().get(self.resource, params.to_dict())
-        if response.status_code == 200:
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
 
+    def iter_all(self, params: ListPaymentParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[PaymentDTO]:
+        return super().paginate(self.list, params or ListPaymentParams(), prefetch, lazy)
@@ -0,0 +1,95 @@
+import threading
+from time import monotonic
+from typing import Optional, Dict
+from unit.api.retry import retry_after
+
+
+class TokenBucket(object):
+    __slots__ = ("rate", "max_rate", "burst", "tokens", "updated", "paused_until")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.max_rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = monotonic()
+        self.paused_until = 0.0
+
+
+class RateLimiter(object):
+    """
+    Client side token bucket per endpoint family (a resource such as payments or transactions), shared by every
+    resource of a client through its transport. The rate adapts AIMD style: a 429 response multiplies the family's
+    rate by decrease and pauses it for the Retry-After the API sent, every other response adds increase back up to
+    the configured rate, so bulk jobs settle at the rate the API allows.
+
+    :param rate: requests per second of a family.
+    :param burst: requests a family may send at once after being idle, rate by default.
+    :param families: rate overrides per family, e.g. {"payments": 5}.
+    :param min_rate: the rate a family is never slowed down below.
+    :param increase: requests per second added back after every response that wasn't rate limited.
+    :param decrease: factor the rate is multiplied by on a 429 response.
+    """
+
+    def __init__(self, rate: float = 10, burst: Optional[float] = None, families: Optional[Dict[str, float]] = None,
+                 min_rate: float = 0.5, increase: float = 0.1, decrease: float = 0.5):
+        self.rate = rate
+        self.burst = burst
+        self.families = families or {}
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, family: str) -> TokenBucket:
+        bucket = self.buckets.get(family)
+        if bucket is None:
+            rate = self.families.get(family, self.rate)
+            bucket = self.buckets[family] = TokenBucket(rate, self.burst or max(1.0, rate))
+
+        return bucket
+
+    def reserve(self, family: str) -> float:
+        """
+        Takes a token of family and returns the seconds to wait before sending the request it pays for.
+        Tokens are handed out in order, so concurrent callers queue up instead of racing for the next one.
+        """
+        with self.lock:
+            bucket = self.bucket(family)
+            now = monotonic()
+            bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate) - 1
+            bucket.updated = now
+            wait = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+            return max(wait, bucket.paused_until - now)
+
+    def try_acquire(self, family: str) -> bool:
+        """
+        Takes a token of family if one is available right now, for optional requests such as hedges that are
+        better not sent than delayed.
+        """
+        with self.lock:
+            bucket = self.bucket(family)
+            now = monotonic()
+            tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            if tokens < 1 or bucket.paused_until > now:
+                return False
+
+            bucket.tokens = tokens - 1
+            bucket.updated = now
+            return True
+
+    def update(self, family: str, response):
+        """
+        Adapts the rate of family to the response of a request sent with one of its tokens.
+        """
+        with self.lock:
+            bucket = self.bucket(family)
+            if response.status_code == 429:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                delay = retry_after(response)
+                if delay:
+                    bucket.paused_until = max(bucket.paused_until, monotonic() + delay)
+            elif bucket.rate < bucket.max_rate:
+                bucket.rate = min(bucket.max_rate, bucket.rate + self.increase)
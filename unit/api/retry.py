@@ -0,0 +1,100 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Callable
+
+
+def retry_after(response) -> Optional[float]:
+    """
+    Seconds to wait according to the Retry-After header of response, given either in seconds or as an HTTP date.
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (at - datetime.now(timezone.utc)).total_seconds())
+
+
+def random_jitter(value: float) -> float:
+    """
+    Same as backoff.random_jitter, adds up to a second to value. backoff is only imported once a policy retries.
+    """
+    return value + random.random()
+
+
+class RetryPolicy(object):
+    """
+    How a resource retries requests that failed with a timeout, a rate limit or a server error.
+
+    :param max_tries: attempts per request, the first one included.
+    :param max_time: seconds after which no further attempt is made, however many tries are left.
+    :param base: wait before the first retry in seconds, doubled on every following retry.
+    :param cap: upper bound of a single wait in seconds.
+    :param jitter: applied to every computed wait, random_jitter by default, None disables it.
+    :param respect_retry_after: on a 429 response with a Retry-After header wait as long as the API asks for instead.
+    """
+
+    def __init__(self, max_tries: int = 1, max_time: Optional[float] = None, base: float = 1,
+                 cap: Optional[float] = None, jitter: Optional[Callable[[float], float]] = random_jitter,
+                 respect_retry_after: bool = True):
+        # max_tries must be greater than 0 due to an infinite loop of backoff library otherwise
+        self.max_tries = max_tries if max_tries > 1 else 1
+        self.max_time = max_time
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def replace(self, **changes) -> "RetryPolicy":
+        options = dict(max_tries=self.max_tries, max_time=self.max_time, base=self.base, cap=self.cap,
+                       jitter=self.jitter, respect_retry_after=self.respect_retry_after)
+        options.update(changes)
+        return RetryPolicy(**options)
+
+    def wait(self):
+        """
+        backoff wait generator, it is sent the response of every failed attempt.
+        """
+        response = yield
+        retry = 0
+        while True:
+            seconds = None
+            if self.respect_retry_after and response is not None and response.status_code == 429:
+                seconds = retry_after(response)
+
+            if seconds is None:
+                seconds = self.base * 2 ** retry
+                if self.jitter is not None:
+                    seconds = self.jitter(seconds)
+                if self.cap is not None:
+                    seconds = min(seconds, self.cap)
+
+            retry += 1
+            response = yield seconds
+
+    def retrying(self, send, predicate, on_retry: Optional[Callable] = None):
+        """
+        Wraps send, a transport's request method, so that a call is repeated while predicate holds for its response.
+        on_retry is called with the backoff details of every response that is retried, whose "value" is the response.
+        Coroutine functions are supported too.
+        """
+        if self.max_tries == 1:
+            return send
+
+        import backoff
+
+        return backoff.on_predicate(self.wait, predicate, max_tries=self.max_tries, max_time=self.max_time,
+                                    jitter=None, on_backoff=on_retry)(send)
@@ -1,39 +1,27 @@
-from typing import Union, List, Optional
-from unit.api.base_resource import BaseResource
+from typing import Union, List, Optional, Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models import UnitResponse, UnitError
 from unit.models.reward import RewardDTO, ListRewardsParams, CreateRewardRequest
-from unit.models.codecs import DtoDecoder
 
 
-class RewardResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class RewardResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "rewards"
 
     def create(self, request: CreateRewardRequest) -> Union[UnitResponse[RewardDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[RewardDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def get(self, reward_id: str, include: Optional[str] = "") -> Union[UnitResponse[RewardDTO], UnitError]:
         response = super().get(f"{self.resource}/{reward_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[RewardDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListRewardsParams = None) -> Union[UnitResponse[List[RewardDTO]], UnitError]:
+    def list(self, params: ListRewardsParams = None, lazy: bool = False) -> Union[UnitResponse[List[RewardDTO]], UnitError]:
         params = params or ListRewardsParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[List[RewardDTO]](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListRewardsParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[RewardDTO]:
+        return super().paginate(self.list, params or ListRewardsParams(), prefetch, lazy)
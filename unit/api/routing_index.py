@@ -0,0 +1,223 @@
+import array
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Optional, Dict, Iterable, Union
+from unit.models import UnitResponse, UnitError, UnitErrorPayload
+from unit.models.codecs import UnitEncoder
+from unit.models.institution import InstitutionDTO
+
+MAGIC = b"UNITRTN\x02"
+# magic, record count and reserved bytes, followed by the sorted routing numbers as little endian 32 bit integers
+HEADER = struct.Struct("<8sI4x")
+KEY = struct.Struct("<I")
+# flags and the offset and length of the name and address in the heap that follows the records
+RECORD = struct.Struct("<BII")
+# record of every format version still read, the first one limited the name and address to 64 KiB
+RECORDS = {b"UNITRTN\x01": struct.Struct("<BIH"), MAGIC: RECORD}
+ACH_SUPPORTED = 1
+WIRE_SUPPORTED = 2
+
+
+def is_valid_routing_number(routing_number: str) -> bool:
+    """
+    Whether routing_number is nine digits with a valid ABA checksum: 3, 7 and 1 weights summing to a multiple of 10.
+    """
+    if len(routing_number) != 9 or not routing_number.isdigit() or not routing_number.isascii():
+        return False
+
+    d = [ord(c) - 48 for c in routing_number]
+    return (3 * (d[0] + d[3] + d[6]) + 7 * (d[1] + d[4] + d[7]) + d[2] + d[5] + d[8]) % 10 == 0
+
+
+def invalid_routing_number(routing_number: str) -> UnitError:
+    return UnitError([UnitErrorPayload("Invalid routing number", "400",
+                                       f"{routing_number} is not a valid ABA routing number")])
+
+
+def unknown_routing_number(routing_number: str) -> UnitError:
+    return UnitError([UnitErrorPayload("Not Found", "404", f"{routing_number} is not in the routing number index")])
+
+
+class RoutingIndex(object):
+    """
+    Offline index of institutions by routing number: a memory mapped file of sorted routing numbers, binary searched,
+    followed by a fixed size record per institution and the names and addresses of the institutions.
+    Routing numbers with an invalid checksum are rejected without any API call, the ones missing from the index are
+    fetched through institutions and added to it by the next update or refresh.
+
+    :param path: index file, created by the first update if it doesn't exist.
+    :param institutions: InstitutionResource or AsyncInstitutionResource used for misses and refreshes. Without it
+    a miss returns a 404 UnitError.
+    """
+
+    def __init__(self, path: str, institutions=None):
+        self.path = path
+        self.institutions = institutions
+        self.pending: Dict[str, InstitutionDTO] = {}
+        self.file = None
+        self.map = None
+        self.keys = None
+        self.count = 0
+        self.record_struct = RECORD
+        self.reload()
+
+    def reload(self):
+        """
+        Maps the current index file, e.g. after another process updated it.
+        """
+        self.close()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) <= HEADER.size:
+            return
+
+        self.file = open(self.path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self.map)
+        if magic not in RECORDS:
+            self.close()
+            raise ValueError(f"{self.path} is not a routing number index")
+        self.record_struct = RECORDS[magic]
+
+        keys = memoryview(self.map)[HEADER.size:HEADER.size + self.count * KEY.size]
+        if sys.byteorder == "little":
+            self.keys = keys.cast("I")
+        else:
+            self.keys = array.array("I", keys)
+            self.keys.byteswap()
+            keys.release()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, routing_number: str):
+        return self.find(routing_number) is not None or routing_number in self.pending
+
+    def find(self, routing_number: str) -> Optional[int]:
+        """
+        Position of the record of routing_number in the index, or None.
+        """
+        if not self.count or len(routing_number) != 9 or not routing_number.isdigit():
+            return None
+
+        key = int(routing_number)
+        position = bisect.bisect_left(self.keys, key)
+        return position if position < self.count and self.keys[position] == key else None
+
+    def record(self, position: int) -> InstitutionDTO:
+        record = self.record_struct
+        flags, offset, length = record.unpack_from(self.map, HEADER.size + self.count * KEY.size +
+                                                   position * record.size)
+        name, address = json.loads(self.map[offset:offset + length])
+        return InstitutionDTO(f"{self.keys[position]:09d}", name, bool(flags & ACH_SUPPORTED),
+                              bool(flags & WIRE_SUPPORTED), address)
+
+    def lookup(self, routing_number: str) -> Optional[InstitutionDTO]:
+        """
+        The institution of routing_number, if it is in the index. Never calls the API.
+        """
+        position = self.find(routing_number)
+        if position is not None:
+            return self.record(position)
+
+        return self.pending.get(routing_number)
+
+    def get(self, routing_number: str) -> Union[UnitResponse[InstitutionDTO], UnitError]:
+        """
+        Same as InstitutionResource.get, served from the index when possible.
+        """
+        if not is_valid_routing_number(routing_number):
+            return invalid_routing_number(routing_number)
+
+        institution = self.lookup(routing_number)
+        if institution is not None:
+            return UnitResponse(institution, None)
+        if self.institutions is None:
+            return unknown_routing_number(routing_number)
+
+        response = self.institutions.get(routing_number)
+        if isinstance(response, UnitResponse):
+            self.pending[routing_number] = response.data
+        return response
+
+    async def get_async(self, routing_number: str) -> Union[UnitResponse[InstitutionDTO], UnitError]:
+        """
+        Same as AsyncInstitutionResource.get, served from the index when possible.
+        """
+        if not is_valid_routing_number(routing_number):
+            return invalid_routing_number(routing_number)
+
+        institution = self.lookup(routing_number)
+        if institution is not None:
+            return UnitResponse(institution, None)
+        if self.institutions is None:
+            return unknown_routing_number(routing_number)
+
+        response = await self.institutions.get(routing_number)
+        if isinstance(response, UnitResponse):
+            self.pending[routing_number] = response.data
+        return response
+
+    def refresh(self, routing_numbers: Iterable[str] = ()):
+        """
+        Fetches the institutions of routing_numbers through a synchronous InstitutionResource and writes them, along
+        with the ones fetched on misses, to the index.
+        """
+        for routing_number in routing_numbers:
+            response = self.institutions.get(routing_number)
+            if isinstance(response, UnitResponse):
+                self.pending[routing_number] = response.data
+
+        self.update(())
+
+    def update(self, institutions: Iterable[InstitutionDTO]):
+        """
+        Merges institutions and the ones fetched on misses into the index file.
+        The file is replaced atomically, so processes reading it keep a consistent view until they reload.
+        """
+        self.reload()
+        merged = {}
+        for position in range(self.count):
+            institution = self.record(position)
+            merged[institution.attributes["routingNumber"]] = institution
+        merged.update(self.pending)
+        merged.update((institution.attributes["routingNumber"], institution) for institution in institutions)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        self.write(temporary, merged.values())
+        self.close()
+        os.replace(temporary, self.path)
+        self.pending.clear()
+        self.reload()
+
+    @staticmethod
+    def write(path: str, institutions: Iterable[InstitutionDTO]):
+        keys, records, heap = [], [], bytearray()
+        institutions = sorted((i for i in institutions if is_valid_routing_number(i.attributes["routingNumber"])),
+                              key=lambda i: i.attributes["routingNumber"])
+        start = HEADER.size + len(institutions) * (KEY.size + RECORD.size)
+        for institution in institutions:
+            attributes = institution.attributes
+            value = json.dumps([attributes["name"], attributes.get("address")], separators=(",", ":"),
+                               cls=UnitEncoder).encode()
+            flags = (ACH_SUPPORTED if attributes["isACHSupported"] else 0) | \
+                    (WIRE_SUPPORTED if attributes["isWireSupported"] else 0)
+            keys.append(KEY.pack(int(attributes["routingNumber"])))
+            records.append(RECORD.pack(flags, start + len(heap), len(value)))
+            heap += value
+
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(institutions)))
+            f.write(b"".join(keys))
+            f.write(b"".join(records))
+            f.write(heap)
+
+    def close(self):
+        if isinstance(self.keys, memoryview):
+            self.keys.release()
+        if self.map is not None:
+            self.map.close()
+        if self.file is not None:
+            self.file.close()
+        self.file, self.map, self.keys, self.count = None, None, None, 0
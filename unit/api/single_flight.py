@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+import weakref
+from typing import Callable, Dict, Optional, Tuple
+
+
+class Flight(object):
+    """
+    A GET in flight, the callers that issued it at the same time wait for its outcome, or await its task.
+    """
+    __slots__ = ("done", "response", "error", "task", "followers")
+
+    def __init__(self, task: Optional[asyncio.Future] = None):
+        self.done = threading.Event()
+        self.response = None
+        self.error: Optional[BaseException] = None
+        self.task = task
+        self.followers = 0
+
+
+class SharedResult(object):
+    """
+    The decoded results of a response handed to several callers, one per lazy mode.
+    """
+    __slots__ = ("lock", "results")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical GETs of a client: a GET issued while the same one (method, URL, params and
+    headers) is still in flight waits for it instead of being sent, and all of its callers get the same response and
+    the same decoded UnitResponse, which must hence be treated as read only. Callers that join a flight share its
+    retries and time limits, as well as its error.
+    Thread safe, and asyncio safe for the clients of a single event loop.
+    """
+
+    def __init__(self):
+        self.flights: Dict[Tuple, Flight] = {}
+        self.tasks: Dict[Tuple, Flight] = {}
+        self.shared = weakref.WeakKeyDictionary()
+        self.coalesced = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None) -> Tuple:
+        return (method, url, json.dumps(params, sort_keys=True, default=str) if params else None,
+                tuple(sorted(headers.items())) if headers else None)
+
+    def send(self, key: Tuple, request: Callable[[], object]):
+        """
+        Calls request, unless a call of key is already in flight, in which case its outcome is returned.
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = Flight()
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+        else:
+            try:
+                flight.response = request()
+            except BaseException as e:
+                flight.error = e
+            finally:
+                with self.lock:
+                    del self.flights[key]
+                    if flight.followers and flight.response is not None:
+                        self.shared[flight.response] = SharedResult()
+                flight.done.set()
+
+        if flight.error is not None:
+            raise flight.error
+
+        return flight.response
+
+    async def send_async(self, key: Tuple, request: Callable[[], object]):
+        """
+        Awaits request(), unless a call of key is already in flight, in which case its outcome is returned.
+        The call runs as a task of its own, so a cancelled caller doesn't cancel it for the others.
+        """
+        flight = self.tasks.get(key)
+        if flight is None:
+            flight = self.tasks[key] = Flight(asyncio.ensure_future(request()))
+            flight.task.add_done_callback(lambda task: self.__finish(key, flight))
+        else:
+            flight.followers += 1
+            self.coalesced += 1
+
+        return await asyncio.shield(flight.task)
+
+    def decode(self, response, lazy: bool, decode: Callable):
+        """
+        decode(response, lazy), computed once for a response shared by several callers.
+        """
+        shared = self.shared.get(response)
+        if shared is None:
+            return decode(response, lazy)
+
+        with shared.lock:
+            if lazy not in shared.results:
+                shared.results[lazy] = decode(response, lazy)
+            return shared.results[lazy]
+
+    def __finish(self, key: Tuple, flight: Flight):
+        del self.tasks[key]
+        task = flight.task
+        if flight.followers and not task.cancelled() and task.exception() is None:
+            self.shared[task.result()] = SharedResult()
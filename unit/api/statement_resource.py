@@ -1,38 +1,114 @@
+import hashlib
+import os
+from typing import Iterator, BinaryIO
 from unit.api.base_resource import BaseResource
 from unit.models.statement import *
-from unit.models.codecs import DtoDecoder
+
+Destination = Union[None, str, os.PathLike, BinaryIO]
+
+
+class StatementSink(object):
+    """
+    Receives the chunks of a statement download and hashes them with checksum, a hashlib algorithm such as sha256,
+    on the way. They are written to destination: a path, written to a .part file renamed once complete, a binary
+    file object, or memory when destination is None.
+    """
+
+    def __init__(self, destination: Destination = None, checksum: Optional[str] = None):
+        self.hash = hashlib.new(checksum) if checksum else None
+        self.size = 0
+        self.buffer = bytearray() if destination is None else None
+        self.path = os.fspath(destination) if isinstance(destination, (str, os.PathLike)) else None
+        self.temporary = f"{self.path}.part" if self.path is not None else None
+        self.file = open(self.temporary, "wb") if self.temporary is not None else destination
+
+    def write(self, chunk: bytes):
+        if self.hash is not None:
+            self.hash.update(chunk)
+        if self.buffer is not None:
+            self.buffer += chunk
+        else:
+            self.file.write(chunk)
+        self.size += len(chunk)
+
+    def finish(self, content_type: Optional[str]) -> StatementDownload:
+        if self.temporary is not None:
+            self.file.close()
+            os.replace(self.temporary, self.path)
+
+        return StatementDownload(self.size, self.hash.hexdigest() if self.hash is not None else None, content_type,
+                                 self.path, memoryview(self.buffer) if self.buffer is not None else None)
+
+    def abort(self):
+        if self.temporary is not None:
+            self.file.close()
+            try:
+                os.remove(self.temporary)
+            except OSError:
+                pass
 
 
 class StatementResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "statements"
 
-    def get(self, params: GetStatementParams) -> Union[UnitResponse[str], UnitError]:
-        parameters = {"language": params.language}
-        if params.customer_id:
-            parameters["filter[customerId]"] = params.customer_id
-
-        response = super().get(f"{self.resource}/{params.statement_id}/{params.output_type}", parameters)
+    def get(self, params: GetStatementParams) -> Union[UnitResponse[bytes], UnitError]:
+        response = super().get(f"{self.resource}/{params.statement_id}/{params.output_type}", params.to_dict())
         if response.status_code == 200:
-            return UnitResponse[str](response.text, None)
+            return UnitResponse[bytes](response.content, None)
         else:
             return UnitError.from_json_api(response.json())
 
-    def get_bank_verification(self, account_id: str, include_proof_of_funds: Optional[bool] = False) -> Union[UnitResponse[str], UnitError]:
+    def get_bank_verification(self, account_id: str, include_proof_of_funds: Optional[bool] = False) -> Union[UnitResponse[bytes], UnitError]:
         response = super().get(f"{self.resource}/{account_id}/bank/pdf",
                                {"includeProofOfFunds": include_proof_of_funds})
         if response.status_code == 200:
-            return UnitResponse[str](response.text, None)
+            return UnitResponse[bytes](response.content, None)
         else:
             return UnitError.from_json_api(response.json())
 
-    def list(self, params: ListStatementParams = None) -> Union[UnitResponse[List[StatementDTO]], UnitError]:
+    def download(self, params: GetStatementParams, destination: Destination = None, checksum: Optional[str] = None,
+                 chunk_size: int = 64 * 1024) -> Union[UnitResponse[StatementDownload], UnitError]:
+        """
+        Streams the HTML or PDF statement to destination chunk by chunk, as bytes, see StatementSink.
+        Memory use doesn't depend on the size of the statement unless it is downloaded to memory.
+        """
+        return self.__download(f"{self.resource}/{params.statement_id}/{params.output_type}", params.to_dict(),
+                               destination, checksum, chunk_size)
+
+    def download_bank_verification(self, account_id: str, include_proof_of_funds: Optional[bool] = False,
+                                   destination: Destination = None, checksum: Optional[str] = None,
+                                   chunk_size: int = 64 * 1024) -> Union[UnitResponse[StatementDownload], UnitError]:
+        """
+        Streams the bank verification PDF of the account to destination, like download.
+        """
+        return self.__download(f"{self.resource}/{account_id}/bank/pdf",
+                               {"includeProofOfFunds": include_proof_of_funds}, destination, checksum, chunk_size)
+
+    def list(self, params: ListStatementParams = None, lazy: bool = False) -> Union[UnitResponse[List[StatementDTO]], UnitError]:
         params = params or ListStatementParams()
         response = super().get(self.resource, params.to_dict())
-        if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[StatementDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListStatementParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[StatementDTO]:
+        return super().paginate(self.list, params or ListStatementParams(), prefetch, lazy)
+
+    def __download(self, resource: str, parameters: Dict, destination: Destination, checksum: Optional[str],
+                   chunk_size: int):
+        response = super().get_stream(resource, parameters)
+        try:
+            if response.status_code != 200:
+                return UnitError.from_json_api(response.json())
+
+            sink = StatementSink(destination, checksum)
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    sink.write(chunk)
+            except BaseException:
+                sink.abort()
+                raise
 
+            return UnitResponse[StatementDownload](sink.finish(response.headers.get("content-type")), None)
+        finally:
+            response.close()
@@ -0,0 +1,28 @@
+from typing import Optional
+
+
+class Timeout(object):
+    """
+    Time limits of a call, in seconds, None meaning no limit.
+
+    :param connect: time to wait for a connection to the API to be established.
+    :param read: time to wait for the API between bytes of the response.
+    :param total: time the call may take as a whole, every retry and wait between retries included.
+    """
+
+    def __init__(self, connect: Optional[float] = None, read: Optional[float] = None, total: Optional[float] = None):
+        self.connect = connect
+        self.read = read
+        self.total = total
+
+    def replace(self, **changes) -> "Timeout":
+        options = dict(connect=self.connect, read=self.read, total=self.total)
+        options.update(changes)
+        return Timeout(**options)
+
+    def bounded(self, remaining: float) -> "Timeout":
+        """
+        The timeouts of a single attempt that has remaining seconds left before the deadline of its call.
+        """
+        return Timeout(remaining if self.connect is None else min(self.connect, remaining),
+                       remaining if self.read is None else min(self.read, remaining), self.total)
@@ -1,48 +1,36 @@
-from unit.api.base_resource import BaseResource
-from unit.models.codecs import DtoDecoder
+import functools
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin, ListStream
 from unit.models.transaction import *
 
 
-class TransactionResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class TransactionResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "transactions"
 
     def get(self, transaction_id: str, include: Optional[str] = "") -> Union[UnitResponse[TransactionDTO], UnitError]:
         response = super().get(f"{self.resource}/{transaction_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
-
-    def list(self, params: ListTransactionParams = None) -> Union[UnitResponse[List[TransactionDTO]], UnitError]:
+        return super().to_unit_response(response)
+
+    def list(self, params: ListTransactionParams = None, lazy: bool = False) -> Union[UnitResponse[List[TransactionDTO]], UnitError]:
         params = params or ListTransactionParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListTransactionParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[TransactionDTO]:
+        return super().paginate(self.list, params or ListTransactionParams(), prefetch, lazy)
+
+    def stream(self, params: ListTransactionParams = None, lazy: bool = False) -> ListStream:
+        params = params or ListTransactionParams()
+        return ListStream(functools.partial(super().get_stream, self.resource, params.to_dict()), lazy)
 
     def update(self, request: PatchTransactionRequest) -> Union[UnitResponse[TransactionDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"accounts/{request.account_id}/{self.resource}/{request.transaction_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def get_by_id_and_account(self, transaction_id: str, account_id: str, include: Optional[str] = "") ->\
             Union[UnitResponse[TransactionDTO], UnitError]:
         response = super().get(f"accounts/{account_id}/{self.resource}/{transaction_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
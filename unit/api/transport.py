@@ -0,0 +1,99 @@
+from typing import Optional, Dict, Callable, TYPE_CHECKING
+from unit.api.exceptions import UnitTimeoutException
+from unit.api.timeout import Timeout
+
+if TYPE_CHECKING:
+    # only for annotations: the policies are imported by the code using them, and requests by RequestsTransport
+    import requests
+    from unit.api.cache import ResponseCache
+    from unit.api.circuit_breaker import CircuitBreaker
+    from unit.api.hedging import Hedging
+    from unit.api.rate_limit import RateLimiter
+    from unit.api.single_flight import SingleFlight
+
+
+class Transport(object):
+    """
+    Sends HTTP requests on behalf of the resources of a Unit client.
+    A single transport instance is shared by every resource a client builds, so implementations
+    are expected to be safe to call from multiple threads.
+    A request running past its timeout must raise UnitTimeoutException.
+    With stream, the body of the response is only read as response.iter_content is consumed, and the caller closes
+    the response.
+    """
+    rate_limiter: Optional["RateLimiter"] = None
+    circuit_breaker: Optional["CircuitBreaker"] = None
+    hedging: Optional["Hedging"] = None
+    single_flight: Optional["SingleFlight"] = None
+    cache: Optional["ResponseCache"] = None
+    timeout: Optional[Timeout] = None
+    idempotency_keys: Optional[Callable[[], str]] = None
+
+    def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None, stream: bool = False):
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Keep-alive transport backed by a pooled requests.Session.
+
+    :param pool_connections: number of per-host connection pools to keep.
+    :param pool_maxsize: maximum number of connections kept open per host.
+    :param pool_block: when True, a request waits for a free connection instead of opening one beyond pool_maxsize,
+    which turns pool_maxsize into a hard per-host connection limit.
+    :param rate_limiter: throttles the requests of every resource using this transport, see RateLimiter.
+    :param timeout: default time limits of the calls of every resource using this transport.
+    :param circuit_breaker: rejects the calls of endpoint families that keep failing, see CircuitBreaker.
+    :param hedging: hedges slow GETs with a second request, see Hedging.
+    :param single_flight: coalesces concurrent identical GETs into a single request, see SingleFlight.
+    :param cache: caches the responses of slow changing resources, see ResponseCache.
+    :param idempotency_keys: generates an idempotency key for every create request sent without one, e.g.
+    new_idempotency_key, so that creates are retried like any other request.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 session: Optional["requests.Session"] = None, rate_limiter: Optional["RateLimiter"] = None,
+                 timeout: Optional[Timeout] = None, circuit_breaker: Optional["CircuitBreaker"] = None,
+                 hedging: Optional["Hedging"] = None, single_flight: Optional["SingleFlight"] = None,
+                 cache: Optional["ResponseCache"] = None, idempotency_keys: Optional[Callable[[], str]] = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.requests = requests
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.single_flight = single_flight
+        self.cache = cache
+        self.idempotency_keys = idempotency_keys
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None, stream: bool = False):
+        try:
+            return self.session.request(method, url, params=params, data=data, headers=headers,
+                                        timeout=(timeout.connect, timeout.read) if timeout else None, stream=stream)
+        except self.requests.exceptions.Timeout as e:
+            raise UnitTimeoutException(f"{method} {url} timed out: {e}") from e
+
+    def close(self):
+        if self.hedging is not None:
+            self.hedging.close()
+        self.session.close()
@@ -1,66 +1,45 @@
-from unit.api.base_resource import BaseResource
+from typing import Iterator
+from unit.api.base_resource import BaseResource, GetManyMixin
 from unit.models.webhook import *
-from unit.models.codecs import DtoDecoder
 import hmac
 from hashlib import sha1
 import base64
 
 
-class WebhookResource(BaseResource):
-    def __init__(self, api_url, token, retries):
-        super().__init__(api_url, token, retries)
+class WebhookResource(GetManyMixin, BaseResource):
+    def __init__(self, api_url, token, retries, transport=None):
+        super().__init__(api_url, token, retries, transport)
         self.resource = "webhooks"
 
     def create(self, request: CreateWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def get(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
         response = super().get(f"{self.resource}/{webhook_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
-    def list(self, params: ListWebhookParams = None) -> Union[UnitResponse[List[WebhookDTO]], UnitError]:
+    def list(self, params: ListWebhookParams = None, lazy: bool = False) -> Union[UnitResponse[List[WebhookDTO]], UnitError]:
         params = params or ListWebhookParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response, lazy)
+
+    def iter_all(self, params: ListWebhookParams = None, prefetch: bool = False, lazy: bool = False) -> Iterator[WebhookDTO]:
+        return super().paginate(self.list, params or ListWebhookParams(), prefetch, lazy)
 
     def update(self, request: PatchWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.webhook_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def enable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
         response = super().post(f"{self.resource}/{webhook_id}/enable")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def disable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
         response = super().post(f"{self.resource}/{webhook_id}/disable")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().to_unit_response(response)
 
     def verify(self, signature: str, secret: str, payload):
         mac = hmac.new(
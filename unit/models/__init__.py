@@ -1,5 +1,5 @@
 import json
-from typing import TypeVar, Generic, Union, Optional, Literal, List, Dict
+from typing import TypeVar, Generic, Union, Optional, Literal, List, Dict, Tuple
 from datetime import datetime, date
 
 
@@ -10,16 +10,94 @@ def to_camel_case(snake_str):
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
+_slot_names = {}
+
+
+def slot_names(cls) -> List[str]:
+    """
+    Returns the names of every slot declared along the MRO of cls, base classes first.
+    """
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for c in reversed(cls.__mro__):
+            slots = c.__dict__.get("__slots__", ())
+            names.extend(n for n in ((slots,) if isinstance(slots, str) else slots) if n not in names)
+        _slot_names[cls] = names
+
+    return names
+
+
+_camel_case_names = {}
+
+
+def camel_case_name(name: str) -> str:
+    """
+    to_camel_case of name, computed once per name.
+    """
+    camel = _camel_case_names.get(name)
+    if camel is None:
+        camel = _camel_case_names[name] = to_camel_case(name)
+
+    return camel
+
+
+_field_tables = {}
+
+
+def field_table(cls) -> Tuple[Tuple[str, str], ...]:
+    """
+    The (slot, camelCase key) pairs serialized by to_dict for instances of cls, computed once per class.
+    """
+    table = _field_tables.get(cls)
+    if table is None:
+        table = _field_tables[cls] = tuple((name, camel_case_name(name)) for name in slot_names(cls)
+                                           if name not in ("__dict__", "__weakref__"))
+
+    return table
+
+
+def to_camel_case_dict(obj) -> Dict[str, object]:
+    """
+    The attributes of a model instance that aren't None, keyed by their camelCase names. Slots are read through the
+    field table of the class, attributes held in a __dict__ are renamed through the cached names.
+    """
+    d = getattr(obj, "__dict__", None)
+    result = dict((camel_case_name(k), val) for k, val in d.items() if val is not None) if d else {}
+    for name, key in _field_tables.get(type(obj)) or field_table(type(obj)):
+        val = getattr(obj, name, None)
+        if val is not None and key not in result:
+            result[key] = val
+
+    return result
+
+
+def fields(obj) -> Dict[str, object]:
+    """
+    The attributes of a model instance, whether they are held in __slots__ or in a __dict__.
+    Slots that were never assigned are left out, like attributes vars() wouldn't have.
+    """
+    v = dict(getattr(obj, "__dict__", {}))
+    for name in slot_names(type(obj)):
+        if name not in v and hasattr(obj, name):
+            v[name] = getattr(obj, name)
+
+    return v
+
+
 class UnitDTO(object):
+    __slots__ = ()
+
     def to_dict(self):
         if type(self) is dict:
             return self
         else:
-            v = vars(self)
-            return dict((to_camel_case(k), val) for k, val in v.items() if val is not None)
+            return to_camel_case_dict(self)
 
 
 class Relationship(UnitDTO):
+    __slots__ = ("type", "id")
+
     def __init__(self, _type: str, _id: str):
         self.type = _type
         self.id = _id
@@ -35,6 +113,8 @@ T = TypeVar('T')
 
 
 class RelationshipArray(Generic[T], UnitDTO):
+    __slots__ = ("data",)
+
     def __init__(self, l: List[T]):
         relationships = []
         for r in l:
@@ -53,9 +133,12 @@ class RelationshipArray(Generic[T], UnitDTO):
 
 
 class UnitResponse(Generic[T]):
-    def __init__(self, data: Union[T, List[T]], included):
+    __slots__ = ("data", "included", "meta")
+
+    def __init__(self, data: Union[T, List[T]], included, meta: Optional[Dict] = None):
         self.data = data
         self.included = included
+        self.meta = meta
 
     @staticmethod
     def from_json_api(data: str):
@@ -63,16 +146,22 @@ class UnitResponse(Generic[T]):
 
 
 class UnitRequest(object):
+    __slots__ = ()
+
     def to_json_api(self) -> Dict:
         pass
 
 
 class UnitParams(object):
+    __slots__ = ()
+
     def to_dict(self) -> Dict:
         pass
 
 
 class RawUnitObject(UnitDTO):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id, _type, attributes, relationships):
         self.id = _id
         self.type = _type
@@ -80,11 +169,15 @@ class RawUnitObject(UnitDTO):
         self.relationships = relationships
 
     def to_dict(self):
-        v = vars(self.attributes)
-        return dict((to_camel_case(k), val) for k, val in v.items() if val is not None)
+        if isinstance(self.attributes, dict):
+            return dict((camel_case_name(k), val) for k, val in self.attributes.items() if val is not None)
+
+        return to_camel_case_dict(self.attributes)
 
 
 class UnitErrorPayload(object):
+    __slots__ = ("title", "status", "detail", "details", "source", "code", "meta")
+
     def __init__(self, title: str, status: str, detail: Optional[str] = None, details: Optional[str] = None,
                  source: Optional[Dict] = None, code: Optional[str] = None, meta: Optional[Dict[str, object]] = None):
         self.title = title
@@ -100,6 +193,8 @@ class UnitErrorPayload(object):
 
 
 class UnitError(object):
+    __slots__ = ("errors",)
+
     def __init__(self, errors: List[UnitErrorPayload]):
         self.errors = errors
 
@@ -126,6 +221,8 @@ EntityType = Literal["Corporation", "LLC", "Partnership"]
 
 
 class FullName(UnitDTO):
+    __slots__ = ("first", "last")
+
     def __init__(self, first: str, last: str):
         self.first = first
         self.last = last
@@ -137,6 +234,8 @@ class FullName(UnitDTO):
 
 # todo: Alex - use typing.Literal for multi accepted values (e.g country)
 class Address(UnitDTO):
+    __slots__ = ("street", "street2", "city", "state", "postal_code", "country")
+
     def __init__(self, street: str, city: str, state: str, postal_code: str, country: str,
                  street2: Optional[str] = None):
         self.street = street
@@ -155,6 +254,8 @@ class Address(UnitDTO):
         return None
 
 class Phone(UnitDTO):
+    __slots__ = ("country_code", "number")
+
     def __init__(self, country_code: str, number: str):
         self.country_code = country_code
         self.number = number
@@ -165,6 +266,8 @@ class Phone(UnitDTO):
 
 
 class BusinessContact(UnitDTO):
+    __slots__ = ("full_name", "email", "phone")
+
     def __init__(self, full_name: FullName, email: str, phone: Phone):
         self.full_name = full_name
         self.email = email
@@ -176,6 +279,9 @@ class BusinessContact(UnitDTO):
 
 
 class Officer(UnitDTO):
+    __slots__ = ("full_name", "date_of_birth", "address", "phone", "email", "status", "title", "ssn", "passport",
+                 "nationality")
+
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, phone: Phone, email: str,
                  status: Optional[Status] = None, title: Optional[Title] = None, ssn: Optional[str] = None,
                  passport: Optional[str] = None, nationality: Optional[str] = None):
@@ -198,6 +304,9 @@ class Officer(UnitDTO):
 
 
 class BeneficialOwner(UnitDTO):
+    __slots__ = ("full_name", "date_of_birth", "address", "phone", "email", "status", "ssn", "passport", "nationality",
+                 "percentage")
+
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, phone: Phone, email: str,
                  status: Optional[Status] = None, ssn: Optional[str] = None, passport: Optional[str] = None,
                  nationality: Optional[str] = None, percentage: Optional[int] = None):
@@ -223,6 +332,8 @@ class BeneficialOwner(UnitDTO):
 
 
 class AuthorizedUser(UnitDTO):
+    __slots__ = ("full_name", "email", "phone", "jwt_subject")
+
     def __init__(self, full_name: FullName, email: str, phone: Phone, jwt_subject: Optional[str]):
         self.full_name = full_name
         self.email = email
@@ -245,6 +356,8 @@ class AuthorizedUser(UnitDTO):
                               Phone.from_json_api(d.get("phone")), d.get("jwtSubject")) for d in data]
 
 class WireCounterparty(UnitDTO):
+    __slots__ = ("routing_number", "account_number", "name", "address")
+
     def __init__(self, routing_number: str, account_number: str, name: str, address: Address):
         self.routing_number = routing_number
         self.account_number = account_number
@@ -257,6 +370,8 @@ class WireCounterparty(UnitDTO):
                                 Address.from_json_api(data["address"]))
 
 class Counterparty(UnitDTO):
+    __slots__ = ("routing_number", "account_number", "account_type", "name")
+
     def __init__(self, routing_number: str, account_number: str, account_type: str, name: str):
         self.routing_number = routing_number
         self.account_number = account_number
@@ -268,6 +383,8 @@ class Counterparty(UnitDTO):
         return Counterparty(data["routingNumber"], data["accountNumber"], data["accountType"], data["name"])
 
 class Coordinates(UnitDTO):
+    __slots__ = ("longitude", "latitude")
+
     def __init__(self, longitude: float, latitude: float):
         self.longitude = longitude
         self.latitude = latitude
@@ -281,6 +398,8 @@ class Coordinates(UnitDTO):
 
 
 class Merchant(UnitDTO):
+    __slots__ = ("name", "type", "category", "location", "id")
+
     def __init__(self, name: str, _type: int, category: str, location: Optional[str], _id: Optional[str]):
         self.name = name
         self.type = _type
@@ -297,6 +416,8 @@ class Merchant(UnitDTO):
 
 
 class CardLevelLimits(UnitDTO):
+    __slots__ = ("daily_withdrawal", "daily_purchase", "monthly_withdrawal", "monthly_purchase")
+
     def __init__(self, daily_withdrawal: int, daily_purchase: int, monthly_withdrawal: int, monthly_purchase: int):
         self.daily_withdrawal = daily_withdrawal
         self.daily_purchase = daily_purchase
@@ -309,6 +430,8 @@ class CardLevelLimits(UnitDTO):
                       data["monthlyPurchase"])
 
 class CardTotals(UnitDTO):
+    __slots__ = ("withdrawals", "deposits", "purchases")
+
     def __init__(self, withdrawals: int, deposits: int, purchases: int):
         self.withdrawals = withdrawals
         self.deposits = deposits
@@ -320,6 +443,8 @@ class CardTotals(UnitDTO):
 
 
 class DeviceFingerprint(UnitDTO):
+    __slots__ = ("value", "provider")
+
     def __init__(self, value: str, provider: str = "iovation"):
         self.value = value
         self.provider = provider
@@ -335,6 +460,8 @@ class DeviceFingerprint(UnitDTO):
         return cls(value=data["value"], provider=data["provider"])
 
 class CheckCounterparty(object):
+    __slots__ = ("routing_number", "account_number", "name")
+
     def __init__(self, routing_number: str, account_number: str, name: str):
         self.routing_number = routing_number
         self.account_number = account_number
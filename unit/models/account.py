@@ -10,6 +10,8 @@ CreditAccountType = "creditAccount"
 
 
 class DepositAccountDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, created_at: datetime, updated_at: Optional[datetime], name: str, deposit_product: str,
                  routing_number: str, account_number: str, currency: str, balance: int, hold: int, available: int,
                  status: AccountStatus, tags: Optional[Dict[str, str]], close_reason: Optional[CloseReason],
@@ -34,6 +36,8 @@ class DepositAccountDTO(object):
 
 
 class CreditAccountDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, created_at: datetime, updated_at: Optional[datetime], name: str, credit_terms: str,
                  currency: str, credit_limit: int, balance: int, hold: int, available: int,
                  tags: Optional[Dict[str, str]], status: AccountStatus, freeze_reason: Optional[str],
@@ -63,6 +67,8 @@ AccountDTO = Union[DepositAccountDTO, CreditAccountDTO]
 
 
 class CreateDepositAccountRequest(UnitRequest):
+    __slots__ = ("deposit_product", "tags", "idempotency_key", "relationships")
+
     def __init__(self, deposit_product: str, relationships: Optional[Dict[str, Union[Relationship, RelationshipArray]]],
                  tags: Optional[Dict[str, str]] = None, idempotency_key: Optional[str] = None):
         self.deposit_product = deposit_product
@@ -94,6 +100,8 @@ class CreateDepositAccountRequest(UnitRequest):
 
 
 class CreateCreditAccountRequest(UnitRequest):
+    __slots__ = ("credit_terms", "credit_limit", "tags", "idempotency_key", "relationships")
+
     def __init__(self, credit_terms: str, credit_limit: int, relationships: Dict[str, Relationship],
                  tags: Optional[Dict[str, str]] = None, idempotency_key: Optional[str] = None):
         self.credit_terms = credit_terms
@@ -130,6 +138,8 @@ CreateAccountRequest = Union[CreateDepositAccountRequest, CreateCreditAccountReq
 
 
 class PatchDepositAccountRequest(UnitRequest):
+    __slots__ = ("account_id", "deposit_product", "tags")
+
     def __init__(self, account_id: str, deposit_product: Optional[str] = None, tags: Optional[Dict[str, str]] = None):
         self.account_id = account_id
         self.deposit_product = deposit_product
@@ -156,6 +166,8 @@ class PatchDepositAccountRequest(UnitRequest):
 
 
 class PatchCreditAccountRequest(UnitRequest):
+    __slots__ = ("account_id", "tags", "credit_limit")
+
     def __init__(self, account_id: str, tags: Optional[Dict[str, str]] = None, credit_limit: Optional[int] = None):
         self.account_id = account_id
         self.tags = tags
@@ -185,6 +197,8 @@ PatchAccountRequest = Union[PatchDepositAccountRequest, PatchCreditAccountReques
 
 
 class AchTotals(object):
+    __slots__ = ("debits", "credits")
+
     def __init__(self, debits: int, credits: int):
         self.debits = debits
         self.credits = credits
@@ -195,6 +209,9 @@ class AchTotals(object):
 
 
 class AchLimits(object):
+    __slots__ = ("daily_debit", "daily_credit", "monthly_debit", "monthly_credit", "daily_debit_soft",
+                 "monthly_debit_soft")
+
     def __init__(self, daily_debit: int, daily_credit: int, monthly_debit: int, monthly_credit: int,
                  daily_debit_soft: int, monthly_debit_soft: int):
         self.daily_debit = daily_debit
@@ -211,6 +228,8 @@ class AchLimits(object):
 
 
 class AccountAchLimits(object):
+    __slots__ = ("limits", "totals_daily", "totals_monthly")
+
     def __init__(self, limits: AchLimits, totals_daily: AchTotals, totals_monthly: AchTotals):
         self.limits = limits
         self.totals_daily = totals_daily
@@ -223,6 +242,8 @@ class AccountAchLimits(object):
 
 
 class CardLimits(object):
+    __slots__ = ("daily_withdrawal", "daily_deposit", "daily_purchase", "daily_card_transaction")
+
     def __init__(self, daily_withdrawal: int, daily_deposit: int, daily_purchase: int, daily_card_transaction: int):
         self.daily_withdrawal = daily_withdrawal
         self.daily_deposit = daily_deposit
@@ -235,6 +256,8 @@ class CardLimits(object):
                           data["dailyPurchase"], data["dailyCardTransaction"])
 
 class CardTotals(object):
+    __slots__ = ("withdrawals", "deposits", "purchases", "card_transactions")
+
     def __init__(self, withdrawals: int, deposits: int, purchases: int, card_transactions: int):
         self.withdrawals = withdrawals
         self.deposits = deposits
@@ -246,6 +269,8 @@ class CardTotals(object):
         return CardTotals(data["withdrawals"], data["deposits"], data["purchases"], data["cardTransactions"])
 
 class AccountCardLimits(object):
+    __slots__ = ("limits", "totals_daily")
+
     def __init__(self, limits: CardLimits, totals_daily: CardTotals):
         self.limits = limits
         self.totals_daily = totals_daily
@@ -257,6 +282,8 @@ class AccountCardLimits(object):
 
 
 class CheckDepositLimits(object):
+    __slots__ = ("daily", "monthly", "daily_soft", "monthly_soft")
+
     def __init__(self, daily: int, monthly: int, daily_soft: int, monthly_soft: int):
         self.daily = daily
         self.monthly = monthly
@@ -269,6 +296,8 @@ class CheckDepositLimits(object):
 
 
 class CheckDepositAccountLimits(object):
+    __slots__ = ("limits", "totals_daily", "totals_monthly")
+
     def __init__(self, limits: CheckDepositLimits, totals_daily: int, totals_monthly: int):
         self.limits = limits
         self.totals_daily = totals_daily
@@ -281,6 +310,8 @@ class CheckDepositAccountLimits(object):
 
 
 class AccountLimitsDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, ach: AccountAchLimits, card: AccountCardLimits, check_deposit: CheckDepositAccountLimits):
         self.type = "limits"
         self.attributes = {"ach": ach, "card": card, "checkDeposit": check_deposit}
@@ -293,6 +324,8 @@ class AccountLimitsDTO(object):
 
 
 class CloseAccountRequest(UnitRequest):
+    __slots__ = ("account_id", "reason")
+
     def __init__(self, account_id: str, reason: Optional[Literal["ByCustomer", "Fraud"]] = "ByCustomer"):
         self.account_id = account_id
         self.reason = reason
@@ -314,6 +347,8 @@ class CloseAccountRequest(UnitRequest):
 
 
 class ListAccountParams(UnitParams):
+    __slots__ = ("offset", "limit", "customer_id", "tags", "include", "status", "from_balance", "to_balance")
+
     def __init__(self, offset: int = 0, limit: int = 100, customer_id: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, include: Optional[str] = None, status: Optional[AccountStatus] = None,
                  from_balance: Optional[int] = None, to_balance: Optional[int] = None):
@@ -344,6 +379,8 @@ class ListAccountParams(UnitParams):
 
 
 class AccountOwnersRequest(UnitRequest):
+    __slots__ = ("account_id", "customers")
+
     def __init__(self, account_id: str, customers: RelationshipArray):
         self.account_id = account_id
         self.customers = customers
@@ -356,6 +393,8 @@ class AccountOwnersRequest(UnitRequest):
 
 
 class AccountDepositProductDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, name: str):
         self.type = "accountDepositProduct"
         self.attributes = {"name": name}
@@ -365,6 +404,8 @@ class AccountDepositProductDTO(object):
         return AccountDepositProductDTO(attributes["name"])
 
 class FreezeAccountRequest(UnitRequest):
+    __slots__ = ("account_id", "reason", "reason_text")
+
     def __init__(self, account_id: str, reason: Literal["Fraud", "Other"], reason_text: Optional[str] = None):
         self.account_id = account_id
         self.reason = reason
@@ -4,6 +4,8 @@ from unit.models import *
 
 
 class AccountEndOfDayDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, date: str, balance: int, hold: int, available: int,
                  relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -18,6 +20,8 @@ class AccountEndOfDayDTO(object):
 
 
 class ListAccountEndOfDayParams(UnitParams):
+    __slots__ = ("limit", "offset", "account_id", "customer_id", "since", "until")
+
     def __init__(self, limit: int = 100, offset: int = 0, account_id: Optional[str] = None,
                  customer_id: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None):
         self.limit = limit
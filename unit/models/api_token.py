@@ -3,6 +3,8 @@ from unit.utils import date_utils
 
 
 class APITokenDTO(object):
+    __slots__ = ("id", "type", "attributes")
+
     def __init__(self, id: str, created_at: datetime, description: str, expiration: datetime, token: Optional[str],
                  source_ip: Optional[str]):
         self.id = id
@@ -18,6 +20,8 @@ class APITokenDTO(object):
 
 
 class CreateAPITokenRequest(object):
+    __slots__ = ("user_id", "description", "scope", "expiration", "source_ip")
+
     def __init__(self, user_id: str, description: str, scope: str, expiration: datetime,
                  source_ip: Optional[str] = None):
         # for backward compatibility
@@ -13,6 +13,8 @@ ReasonCode = Literal["PoorQuality", "NameMismatch", "SSNMismatch", "AddressMisma
 ApplicationTypes = Literal["individualApplication", "businessApplication"]
 
 class IndividualApplicationDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, full_name: FullName, address: Address, date_of_birth: date,
                  email: str, phone: Phone, status: ApplicationStatus, ssn: Optional[str], message: Optional[str],
                  ip: Optional[str], ein: Optional[str], dba: Optional[str],
@@ -40,6 +42,8 @@ class IndividualApplicationDTO(object):
 
 
 class BusinessApplicationDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, name: str, address: Address, phone: Phone,
                  status: ApplicationStatus, state_of_incorporation: str, entity_type: EntityType,
                  contact: BusinessContact, officer: Officer, beneficial_owners: [BeneficialOwner], ssn: Optional[str],
@@ -69,6 +73,9 @@ class BusinessApplicationDTO(object):
 ApplicationDTO = Union[IndividualApplicationDTO, BusinessApplicationDTO]
 
 class CreateIndividualApplicationRequest(UnitRequest):
+    __slots__ = ("full_name", "date_of_birth", "address", "email", "phone", "ip", "ein", "dba", "sole_proprietorship",
+                 "ssn", "passport", "nationality", "device_fingerprints", "idempotency_key", "tags", "jwt_subject")
+
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, email: str, phone: Phone,
                  ip: str = None, ein: str = None, dba: str = None, sole_proprietorship: bool = None,
                  passport: str = None, nationality: str = None, ssn = None,
@@ -145,6 +152,9 @@ class CreateIndividualApplicationRequest(UnitRequest):
 
 
 class CreateBusinessApplicationRequest(UnitRequest):
+    __slots__ = ("name", "address", "phone", "state_of_incorporation", "ein", "contact", "officer", "beneficial_owners",
+                 "entity_type", "dba", "ip", "website")
+
     def __init__(self, name: str, address: Address, phone: Phone, state_of_incorporation: str, ein: str,
                  contact: BusinessContact, officer: Officer, beneficial_owners: [BeneficialOwner],
                  entity_type: EntityType, dba: str = None, ip: str = None, website: str = None):
@@ -195,6 +205,8 @@ class CreateBusinessApplicationRequest(UnitRequest):
 
 
 class ApplicationDocumentDTO(object):
+    __slots__ = ("id", "type", "attributes")
+
     def __init__(self, id: str, status: ApplicationStatus, document_type: DocumentType, description: str,
                  name: Optional[str], address: Optional[Address], date_of_birth: Optional[date],
                  passport: Optional[str], ein: Optional[str], reason_code: Optional[ReasonCode], reason: Optional[str]):
@@ -217,6 +229,8 @@ FileType = Literal["jpeg", "png", "pdf"]
 
 
 class UploadDocumentRequest(object):
+    __slots__ = ("application_id", "document_id", "file", "file_type", "is_back_side")
+
     def __init__(self, application_id: str, document_id: str, file: IO, file_type: FileType,
                  is_back_side: Optional[bool] = False):
         self.application_id = application_id
@@ -227,6 +241,8 @@ class UploadDocumentRequest(object):
 
 
 class ListApplicationParams(UnitParams):
+    __slots__ = ("offset", "limit", "email", "query", "sort", "tags")
+
     def __init__(self, offset: int = 0, limit: int = 100, email: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, query: Optional[str] = None,
                  sort: Optional[Literal["createdAt", "-createdAt"]] = None):
@@ -250,6 +266,8 @@ class ListApplicationParams(UnitParams):
         return parameters
 
 class PatchApplicationRequest(UnitRequest):
+    __slots__ = ("application_id", "type", "tags")
+
     def __init__(self, application_id: str, type: ApplicationTypes = "individualApplication",
                  tags: Optional[Dict[str, str]] = None):
         self.application_id = application_id
@@ -7,6 +7,10 @@ ApplicationFormStage = Literal["ChooseBusinessOrIndividual", "EnterIndividualInf
 
 
 class ApplicationFormPrefill(UnitDTO):
+    __slots__ = ("application_type", "full_name", "ssn", "passport", "nationality", "date_of_birth", "email", "name",
+                 "state_of_incorporation", "entity_type", "contact", "officer", "beneficial_owners", "website", "dba",
+                 "ein", "address", "phone")
+
     def __init__(self, application_type: Optional[str], full_name: Optional[FullName], ssn: Optional[str],
                  passport: Optional[str], nationality: Optional[str], date_of_birth: Optional[date],
                  email: Optional[str], name: Optional[str], state_of_incorporation: Optional[str],
@@ -34,6 +38,8 @@ class ApplicationFormPrefill(UnitDTO):
 
 
 class ApplicationFormDTO(UnitDTO):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, url: str, stage: ApplicationFormStage, applicant_details: ApplicationFormPrefill,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -51,6 +57,10 @@ AllowedApplicationTypes = Union["Individual", "Business", "SoleProprietorship"]
 
 
 class ApplicationFormSettingsOverride(UnitDTO):
+    __slots__ = ("redirect_url", "privacy_policy_url", "electronic_disclosures_url", "deposit_terms_url",
+                 "client_terms_url", "cardholder_terms_url", "cash_advanced_terms_url", "debit_card_disclosure_url",
+                 "additional_disclosures")
+
     def __init__(self, redirect_url: str, privacy_policy_url: str, electronic_disclosures_url: str,
                  deposit_terms_url: str, client_terms_url: str, cardholder_terms_url: str, cash_advanced_terms_url: str,
                  debit_card_disclosure_url: str, additional_disclosures: [Dict[str, str]]):
@@ -66,6 +76,8 @@ class ApplicationFormSettingsOverride(UnitDTO):
 
 
 class CreateApplicationFormRequest(UnitRequest):
+    __slots__ = ("tags", "application_details", "allowed_application_types", "lang", "settings_override")
+
     def __init__(self, tags: Optional[Dict[str, str]] = None,
                  application_details: Optional[ApplicationFormPrefill] = None,
                  allowed_application_types: Optional[List[AllowedApplicationTypes]] = None,
@@ -106,6 +118,8 @@ class CreateApplicationFormRequest(UnitRequest):
 
 
 class ListApplicationFormParams(UnitParams):
+    __slots__ = ("offset", "limit", "tags", "sort")
+
     def __init__(self, offset: int = 0, limit: int = 100, tags: Optional[Dict[str, str]] = None,
                  sort: Optional[Literal["createdAt", "-createdAt"]] = None):
         self.offset = offset
@@ -3,6 +3,8 @@ from unit.models import *
 
 
 class AtmLocationDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, network: int, location_name: str, coordinates: Coordinates, address: Address, distance: float,
                  surcharge_free: bool, accept_deposits: bool):
         self.type = "atmLocation"
@@ -19,6 +21,8 @@ class AtmLocationDTO(object):
 
 
 class GetAtmLocationParams(object):
+    __slots__ = ("search_radius", "coordinates", "postal_code", "address")
+
     def __init__(self, search_radius: Optional[int] = None, coordinates: Optional[Coordinates] = None,
                  postal_code: Optional[str] = None, address: Optional[Address] = None):
         self.search_radius = search_radius
@@ -7,6 +7,8 @@ AuthorizationStatus = Literal["Authorized", "Completed", "Canceled", "Declined"]
 
 
 class AuthorizationDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, amount: int, card_last_4_digits: str, status: AuthorizationStatus,
                  merchant_name: str,
                  merchant_type: int, merchant_category: str, merchant_location: Optional[str], recurring: bool,
@@ -38,6 +40,9 @@ class AuthorizationDTO(object):
 
 
 class ListAuthorizationParams(UnitParams):
+    __slots__ = ("limit", "offset", "account_id", "customer_id", "card_id", "since", "until", "include_non_authorized",
+                 "status", "sort")
+
     def __init__(self, limit: int = 100, offset: int = 0, account_id: Optional[str] = None,
                  customer_id: Optional[str] = None, card_id: Optional[str] = None, since: Optional[str] = None,
                  until: Optional[str] = None, include_non_authorized: Optional[bool] = False,
@@ -9,6 +9,8 @@ DeclineReason = Literal["AccountClosed", "CardExceedsAmountLimit", "DoNotHonor",
 
 
 class PurchaseAuthorizationRequestDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, amount: int, status: PurchaseAuthorizationRequestStatus,
                  partial_approval_allowed: str, approved_amount: Optional[int], decline_reason: Optional[DeclineReason],
                  merchant_name: str, merchant_type: int, merchant_category: str, merchant_location: Optional[str],
@@ -38,6 +40,8 @@ class PurchaseAuthorizationRequestDTO(object):
 
 
 class ListPurchaseAuthorizationRequestParams(object):
+    __slots__ = ("limit", "offset", "account_id", "customer_id")
+
     def __init__(self, limit: int = 100, offset: int = 0, account_id: Optional[str] = None,
                  customer_id: Optional[str] = None):
         self.limit = limit
@@ -55,6 +59,8 @@ class ListPurchaseAuthorizationRequestParams(object):
 
 
 class ApproveAuthorizationRequest(object):
+    __slots__ = ("authorization_id", "amount", "tags")
+
     def __init__(self, authorization_id: str, amount: Optional[int] = None, tags: Optional[Dict[str, str]] = None):
         self.authorization_id = authorization_id
         self.amount = amount
@@ -81,6 +87,8 @@ class ApproveAuthorizationRequest(object):
 
 
 class DeclineAuthorizationRequest(object):
+    __slots__ = ("authorization_id", "reason")
+
     def __init__(self, authorization_id: str, reason: DeclineReason):
         self.authorization_id = authorization_id
         self.reason = reason
@@ -4,6 +4,8 @@ from unit.models import *
 
 
 class BillerDTO(object):
+    __slots__ = ("id", "type", "attributes")
+
     def __init__(self, id: str, name: int, category: str):
         self.id = id
         self.type = "biller"
@@ -15,6 +17,8 @@ class BillerDTO(object):
 
 
 class GetBillersParams(object):
+    __slots__ = ("name", "page")
+
     def __init__(self, name: str, page: Optional[int] = None):
         self.name = name
         self.page = page
@@ -5,6 +5,8 @@ CardStatus = Literal["Inactive", "Active", "Stolen", "Lost", "Frozen", "ClosedBy
 
 
 class IndividualDebitCardDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, last_4_digits: str, expiration_date: str, status: CardStatus,
                  shipping_address: Optional[Address], design: Optional[str],
                  relationships: Optional[Dict[str, Relationship]], tags: Optional[Dict[str, str]]):
@@ -24,6 +26,8 @@ class IndividualDebitCardDTO(object):
 
 
 class BusinessCardDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, _type: str, created_at: datetime, last_4_digits: str, expiration_date: str,
                  ssn: Optional[str], full_name: FullName, date_of_birth: date, address: Address, phone: Phone,
                  email: str, status: CardStatus, passport: Optional[str], nationality: Optional[str],
@@ -52,6 +56,8 @@ class BusinessCardDTO(object):
 
 
 class BusinessDebitCardDTO(BusinessCardDTO):
+    __slots__ = ()
+
     def __init__(self, card: BusinessCardDTO):
         self.id = card.id
         self.type = card.type
@@ -64,6 +70,8 @@ class BusinessDebitCardDTO(BusinessCardDTO):
 
 
 class BusinessCreditCardDTO(BusinessCardDTO):
+    __slots__ = ()
+
     def __init__(self, card: BusinessCardDTO):
         self.id = card.id
         self.type = card.type
@@ -76,6 +84,8 @@ class BusinessCreditCardDTO(BusinessCardDTO):
 
 
 class IndividualVirtualDebitCardDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, created_at: datetime, last_4_digits: str, expiration_date: str, status: CardStatus,
                  relationships: Optional[Dict[str, Relationship]], tags: Optional[Dict[str, str]]):
         self.id = _id
@@ -93,6 +103,8 @@ class IndividualVirtualDebitCardDTO(object):
 
 
 class BusinessVirtualCardDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, _type: str, created_at: datetime, last_4_digits: str, expiration_date: str,
                  ssn: Optional[str], full_name: FullName, date_of_birth: date, address: Address, phone: Phone,
                  email: str, status: CardStatus, passport: Optional[str], nationality: Optional[str],
@@ -116,6 +128,8 @@ class BusinessVirtualCardDTO(object):
 
 
 class BusinessVirtualDebitCardDTO(BusinessVirtualCardDTO):
+    __slots__ = ()
+
     def __init__(self, card: BusinessVirtualCardDTO):
         self.id = card.id
         self.type = card.type
@@ -128,6 +142,8 @@ class BusinessVirtualDebitCardDTO(BusinessVirtualCardDTO):
 
 
 class BusinessVirtualCreditCardDTO(BusinessVirtualCardDTO):
+    __slots__ = ()
+
     def __init__(self, card: BusinessVirtualCardDTO):
         self.id = card.id
         self.type = card.type
@@ -144,6 +160,8 @@ Card = Union[IndividualDebitCardDTO, BusinessDebitCardDTO, IndividualVirtualDebi
 
 
 class CreateIndividualDebitCard(object):
+    __slots__ = ("shipping_address", "design", "idempotency_key", "tags", "relationships")
+
     def __init__(self, relationships: Dict[str, Relationship], shipping_address: Optional[Address] = None,
                  design: Optional[str] = None, idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
@@ -181,6 +199,10 @@ class CreateIndividualDebitCard(object):
 
 
 class CreateBusinessCard(object):
+    __slots__ = ("full_name", "date_of_birth", "address", "phone", "email", "shipping_address", "ssn", "passport",
+                 "nationality", "design", "idempotency_key", "tags", "relationships", "limits",
+                 "additional_embossed_text", "print_only_business_name")
+
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, phone: Phone, email: str,
                  relationships: Dict[str, Relationship], shipping_address: Optional[Address] = None,
                  ssn: Optional[str] = None, passport: Optional[str] = None, nationality: Optional[str] = None,
@@ -256,16 +278,22 @@ class CreateBusinessCard(object):
 
 
 class CreateBusinessDebitCard(CreateBusinessCard):
+    __slots__ = ()
+
     def to_json_api(self):
         return super().to_json_api("businessDebitCard")
 
 
 class CreateBusinessCreditCard(CreateBusinessCard):
+    __slots__ = ()
+
     def to_json_api(self):
         return super().to_json_api("businessCreditCard")
 
 
 class CreateIndividualVirtualDebitCard(object):
+    __slots__ = ("idempotency_key", "tags", "relationships")
+
     def __init__(self, relationships: Dict[str, Relationship], idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
         self.idempotency_key = idempotency_key
@@ -294,6 +322,9 @@ class CreateIndividualVirtualDebitCard(object):
 
 
 class CreateBusinessVirtualCard(object):
+    __slots__ = ("full_name", "date_of_birth", "address", "phone", "email", "ssn", "passport", "nationality",
+                 "idempotency_key", "tags", "relationships", "limits")
+
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, phone: Phone, email: str,
                  relationships: Dict[str, Relationship], ssn: Optional[str] = None, passport: Optional[str] = None,
                  nationality: Optional[str] = None, idempotency_key: Optional[str] = None,
@@ -351,11 +382,15 @@ class CreateBusinessVirtualCard(object):
 
 
 class CreateBusinessVirtualDebitCard(CreateBusinessVirtualCard):
+    __slots__ = ()
+
     def to_json_api(self):
         return super().to_json_api("businessVirtualDebitCard")
 
 
 class CreateBusinessVirtualCreditCard(CreateBusinessVirtualCard):
+    __slots__ = ()
+
     def to_json_api(self):
         return super().to_json_api("businessVirtualCreditCard")
 
@@ -365,6 +400,8 @@ CreateCardRequest = Union[CreateIndividualDebitCard, CreateBusinessDebitCard, Cr
 
 
 class PatchIndividualDebitCard(object):
+    __slots__ = ("card_id", "shipping_address", "design", "tags")
+
     def __init__(self, card_id: str, shipping_address: Optional[Address] = None, design: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
         self.card_id = card_id
@@ -396,6 +433,8 @@ class PatchIndividualDebitCard(object):
 
 
 class PatchBusinessCard(object):
+    __slots__ = ("card_id", "shipping_address", "address", "phone", "email", "design", "tags", "limits")
+
     def __init__(self, card_id: str, shipping_address: Optional[Address] = None, address: Optional[Address] = None,
                  phone: Optional[Phone] = None, email: Optional[str] = None, design: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, limits: Optional[CardLevelLimits] = None):
@@ -444,15 +483,19 @@ class PatchBusinessCard(object):
 
 
 class PatchBusinessDebitCard(PatchBusinessCard):
-    pass
+    __slots__ = ()
 
 
 class PatchBusinessCreditCard(PatchBusinessCard):
+    __slots__ = ()
+
     def to_json_api(self) -> Dict:
         return super().to_json_api("businessCreditCard")
 
 
 class PatchIndividualVirtualDebitCard(object):
+    __slots__ = ("card_id", "tags")
+
     def __init__(self, card_id: str, tags: Optional[Dict[str, str]] = None):
         self.card_id = card_id
         self.tags = tags
@@ -475,6 +518,8 @@ class PatchIndividualVirtualDebitCard(object):
 
 
 class PatchBusinessVirtualCard(object):
+    __slots__ = ("card_id", "address", "phone", "email", "tags", "limits")
+
     def __init__(self, card_id: str, address: Optional[Address] = None, phone: Optional[Phone] = None,
                  email: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
                  _type: str = "businessVirtualDebitCard", limits: Optional[CardLevelLimits] = None):
@@ -512,10 +557,12 @@ class PatchBusinessVirtualCard(object):
 
 
 class PatchBusinessVirtualDebitCard(PatchBusinessVirtualCard):
-    pass
+    __slots__ = ()
 
 
 class PatchBusinessVirtualCreditCard(PatchBusinessVirtualCard):
+    __slots__ = ()
+
     def to_json_api(self) -> Dict:
         return super().to_json_api("businessVirtualCreditCard")
 
@@ -525,6 +572,8 @@ PatchCardRequest = Union[PatchIndividualDebitCard, PatchBusinessDebitCard, Patch
 
 
 class ReplaceCardRequest(object):
+    __slots__ = ("shipping_address",)
+
     def __init__(self, shipping_address: Optional[Address] = None):
         self.shipping_address = shipping_address
 
@@ -549,6 +598,8 @@ PinStatus = Literal["Set", "NotSet"]
 
 
 class PinStatusDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, status: PinStatus):
         self.type = "pinStatus"
         self.attributes = {"status": status}
@@ -559,6 +610,8 @@ class PinStatusDTO(object):
 
 
 class CardLimitsDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, limits: CardLevelLimits, daily_totals: CardTotals, monthly_totals: CardTotals):
         self.type = "limits"
         self.attributes = {"limits": limits, "dailyTotals": daily_totals, "monthlyTotals": monthly_totals}
@@ -571,6 +624,8 @@ class CardLimitsDTO(object):
 
 
 class ListCardParams(UnitParams):
+    __slots__ = ("offset", "limit", "account_id", "customer_id", "tags", "include", "sort", "status")
+
     def __init__(self, offset: int = 0, limit: int = 100, account_id: Optional[str] = None,
                  customer_id: Optional[str] = None, tags: Optional[Dict[str, str]] = None, include: Optional[str] = None,
                  sort: Optional[Literal["createdAt", "-createdAt"]] = None,
@@ -603,6 +658,8 @@ class ListCardParams(UnitParams):
 
 
 class GetMobileWalletPayloadRequest(UnitRequest):
+    __slots__ = ("card_id", "signed_nonce", "secure_path")
+
     def __init__(self, card_id: str, signed_nonce: str, secure_path: Optional[str] = "https://secure.api.s.unit.sh"):
         self.card_id = card_id
         self.signed_nonce = signed_nonce
@@ -623,6 +680,8 @@ class GetMobileWalletPayloadRequest(UnitRequest):
 
 
 class MobileWalletPayloadDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, payload: str):
         self.type = "mobileWalletPayload"
         self.attributes = {"payload": payload}
@@ -7,6 +7,8 @@ CheckDepositStatus = Literal["AwaitingImages", "AwaitingFrontImage", "AwaitingBa
                              "Rejected", "Clearing", "Sent", "Canceled", "Returned"]
 
 class CheckDepositDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, status: str, description: str, amount: str, reason: Optional[str],
                  check_number: Optional[str], counterparty: Optional[CheckCounterparty], settlement_date: Optional[date],
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -27,6 +29,8 @@ class CheckDepositDTO(object):
 
 
 class CreateCheckDepositRequest(UnitRequest):
+    __slots__ = ("amount", "description", "tags", "idempotency_key", "relationships")
+
     def __init__(self, amount: int, relationships: Dict[str, Relationship], description: str,
                  tags: Optional[Dict[str, str]] = None, idempotency_key: Optional[str] = None ):
         self.amount = amount
@@ -59,6 +63,8 @@ class CreateCheckDepositRequest(UnitRequest):
         json.dumps(self.to_json_api())
 
 class ListCheckDepositParams(UnitParams):
+    __slots__ = ("offset", "limit", "account_id", "customer_id", "tags", "sort", "include")
+
     def __init__(self, offset: int = 0, limit: int = 100, account_id: Optional[str] = None,
                  customer_id: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
                  sort: Optional[str] = None, include: Optional[str] = None):
@@ -87,6 +93,8 @@ class ListCheckDepositParams(UnitParams):
 UploadSide = Literal["front", "back"]
 
 class UploadCheckDepositDocumentRequest(object):
+    __slots__ = ("check_deposit_id", "file", "side")
+
     def __init__(self, check_deposit_id: str, file: IO, side: UploadSide = "front"):
         self.check_deposit_id = check_deposit_id
         self.file = file
@@ -94,6 +102,8 @@ class UploadCheckDepositDocumentRequest(object):
 
 
 class PatchCheckDepositRequest(UnitRequest):
+    __slots__ = ("check_deposit_id", "tags")
+
     def __init__(self, check_deposit_id: str, tags: Optional[Dict[str, str]] = None):
         self.check_deposit_id = check_deposit_id
         self.tags = tags
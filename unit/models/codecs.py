@@ -1,3 +1,6 @@
+import re
+from collections.abc import Mapping
+from typing import Callable
 from unit.models.applicationForm import ApplicationFormDTO
 from unit.models.application import IndividualApplicationDTO, BusinessApplicationDTO, ApplicationDocumentDTO
 from unit.models.account import DepositAccountDTO, AccountLimitsDTO, AccountDepositProductDTO, CreditAccountDTO
@@ -25,324 +28,293 @@ from unit.models.account_end_of_day import AccountEndOfDayDTO
 from unit.models.check_deposit import CheckDepositDTO
 from unit.models.dispute import DisputeDTO
 
-mappings = {
-        "individualApplication": lambda _id, _type, attributes, relationships:
-        IndividualApplicationDTO.from_json_api(_id, _type, attributes, relationships),
+Decoder = Callable[[Optional[str], str, Dict, Optional[Dict[str, Union[Relationship, RelationshipArray]]]], object]
 
-        "businessApplication": lambda _id, _type, attributes, relationships:
-        BusinessApplicationDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "document": lambda _id, _type, attributes, relationships:
+mappings: Dict[str, Decoder] = {
+    "individualApplication": IndividualApplicationDTO.from_json_api,
+    "businessApplication": BusinessApplicationDTO.from_json_api,
+    "document": lambda _id, _type, attributes, relationships:
         ApplicationDocumentDTO.from_json_api(_id, _type, attributes),
+    "individualCustomer": IndividualCustomerDTO.from_json_api,
+    "businessCustomer": BusinessCustomerDTO.from_json_api,
+    "depositAccount": DepositAccountDTO.from_json_api,
+    "creditAccount": CreditAccountDTO.from_json_api,
+    "limits": lambda _id, _type, attributes, relationships: decode_limits(attributes),
+    "individualDebitCard": IndividualDebitCardDTO.from_json_api,
+    "businessDebitCard": BusinessDebitCardDTO.from_json_api,
+    "businessCreditCard": BusinessCreditCardDTO.from_json_api,
+    "individualVirtualDebitCard": IndividualVirtualDebitCardDTO.from_json_api,
+    "businessVirtualDebitCard": BusinessVirtualDebitCardDTO.from_json_api,
+    "businessVirtualCreditCard": BusinessVirtualCreditCardDTO.from_json_api,
+    "originatedAchTransaction": OriginatedAchTransactionDTO.from_json_api,
+    "receivedAchTransaction": ReceivedAchTransactionDTO.from_json_api,
+    "returnedAchTransaction": ReturnedAchTransactionDTO.from_json_api,
+    "returnedReceivedAchTransaction": ReturnedReceivedAchTransactionDTO.from_json_api,
+    "dishonoredAchTransaction": DishonoredAchTransactionDTO.from_json_api,
+    "bookTransaction": BookTransactionDTO.from_json_api,
+    "purchaseTransaction": PurchaseTransactionDTO.from_json_api,
+    "atmTransaction": AtmTransactionDTO.from_json_api,
+    "feeTransaction": FeeTransactionDTO.from_json_api,
+    "cardTransaction": CardTransactionDTO.from_json_api,
+    "wireTransaction": WireTransactionDTO.from_json_api,
+    "releaseTransaction": ReleaseTransactionDTO.from_json_api,
+    "adjustmentTransaction": AdjustmentTransactionDTO.from_json_api,
+    "interestTransaction": InterestTransactionDTO.from_json_api,
+    "disputeTransaction": DisputeTransactionDTO.from_json_api,
+    "checkDepositTransaction": CheckDepositTransactionDTO.from_json_api,
+    "returnedCheckDepositTransaction": ReturnedCheckDepositTransactionDTO.from_json_api,
+    "paymentAdvanceTransaction": PaymentAdvanceTransactionDTO.from_json_api,
+    "repaidPaymentAdvanceTransaction": RepaidPaymentAdvanceTransactionDTO.from_json_api,
+    "rewardTransaction": RewardTransactionDTO.from_json_api,
+    "paymentCanceledTransaction": PaymentCanceledTransactionDTO.from_json_api,
+    "chargebackTransaction": ChargebackTransactionDTO.from_json_api,
+    "cardReversalTransaction": CardReversalTransactionDTO.from_json_api,
+    "achPayment": AchPaymentDTO.from_json_api,
+    "bookPayment": BookPaymentDTO.from_json_api,
+    "wirePayment": WirePaymentDTO.from_json_api,
+    "billPayment": BillPaymentDTO.from_json_api,
+    "achReceivedPayment": AchReceivedPaymentDTO.from_json_api,
+    "accountStatementDTO": StatementDTO.from_json_api,
+    "sandboxAccountStatement": StatementDTO.from_json_api,
+    "customerBearerToken": CustomerTokenDTO.from_json_api,
+    "customerTokenVerification": CustomerVerificationTokenDTO.from_json_api,
+    "achCounterparty": CounterpartyDTO.from_json_api,
+    "applicationForm": ApplicationFormDTO.from_json_api,
+    "fee": FeeDTO.from_json_api,
+    "account.closed": AccountClosedEvent.from_json_api,
+    "account.frozen": AccountFrozenEvent.from_json_api,
+    "application.awaitingDocuments": ApplicationAwaitingDocumentsEvent.from_json_api,
+    "application.denied": ApplicationDeniedEvent.from_json_api,
+    "application.pendingReview": ApplicationPendingReviewEvent.from_json_api,
+    "card.activated": CardActivatedEvent.from_json_api,
+    "card.statusChanged": CardStatusChangedEvent.from_json_api,
+    "authorization.created": AuthorizationCreatedEvent.from_json_api,
+    "authorizationRequest.declined": AuthorizationRequestDeclinedEvent.from_json_api,
+    "authorizationRequest.pending": AuthorizationRequestPendingEvent.from_json_api,
+    "authorizationRequest.approved": AuthorizationRequestApprovedEvent.from_json_api,
+    "document.approved": DocumentApprovedEvent.from_json_api,
+    "document.rejected": DocumentRejectedEvent.from_json_api,
+    "checkDeposit.created": CheckDepositCreatedEvent.from_json_api,
+    "checkDeposit.clearing": CheckDepositClearingEvent.from_json_api,
+    "checkDeposit.sent": CheckDepositSentEvent.from_json_api,
+    "payment.clearing": PaymentClearingEvent.from_json_api,
+    "payment.sent": PaymentSentEvent.from_json_api,
+    "payment.returned": PaymentReturnedEvent.from_json_api,
+    "statements.created": StatementsCreatedEvent.from_json_api,
+    "transaction.created": TransactionCreatedEvent.from_json_api,
+    "customer.created": CustomerCreatedEvent.from_json_api,
+    "account.reopened": AccountReopenedEvent.from_json_api,
+    "webhook": WebhookDTO.from_json_api,
+    "institution": InstitutionDTO.from_json_api,
+    "atmLocation": lambda _id, _type, attributes, relationships: AtmLocationDTO.from_json_api(_type, attributes),
+    "biller": BillerDTO.from_json_api,
+    "apiToken": APITokenDTO.from_json_api,
+    "authorization": AuthorizationDTO.from_json_api,
+    "purchaseAuthorizationRequest": PurchaseAuthorizationRequestDTO.from_json_api,
+    "accountEndOfDay": AccountEndOfDayDTO.from_json_api,
+    "counterpartyBalance": CounterpartyBalanceDTO.from_json_api,
+    "pinStatus": lambda _id, _type, attributes, relationships: PinStatusDTO.from_json_api(attributes),
+    "accountDepositProduct": lambda _id, _type, attributes, relationships:
+        AccountDepositProductDTO.from_json_api(attributes),
+    "checkDeposit": CheckDepositDTO.from_json_api,
+    "dispute": DisputeDTO.from_json_api,
+    "mobileWalletPayload": MobileWalletPayloadDTO.from_json_api,
+}
 
-        "individualCustomer": lambda _id, _type, attributes, relationships:
-        IndividualCustomerDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "businessCustomer": lambda _id, _type, attributes, relationships:
-        BusinessCustomerDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "depositAccount": lambda _id, _type, attributes, relationships:
-        DepositAccountDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "creditAccount": lambda _id, _type, attributes, relationships:
-        CreditAccountDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "limits": lambda _id, _type, attributes, relationships:
-        decode_limits(attributes),
-
-        "individualDebitCard": lambda _id, _type, attributes, relationships:
-        IndividualDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "businessDebitCard": lambda _id, _type, attributes, relationships:
-        BusinessDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "businessCreditCard": lambda _id, _type, attributes, relationships:
-        BusinessCreditCardDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "individualVirtualDebitCard": lambda _id, _type, attributes, relationships:
-        IndividualVirtualDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "businessVirtualDebitCard": lambda _id, _type, attributes, relationships:
-        BusinessVirtualDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "businessVirtualCreditCard": lambda _id, _type, attributes, relationships:
-        BusinessVirtualCreditCardDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "originatedAchTransaction": lambda _id, _type, attributes, relationships:
-        OriginatedAchTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "receivedAchTransaction": lambda _id, _type, attributes, relationships:
-        ReceivedAchTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "returnedAchTransaction": lambda _id, _type, attributes, relationships:
-        ReturnedAchTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "returnedReceivedAchTransaction": lambda _id, _type, attributes, relationships:
-        ReturnedReceivedAchTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "dishonoredAchTransaction": lambda _id, _type, attributes, relationships:
-        DishonoredAchTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "bookTransaction": lambda _id, _type, attributes, relationships:
-        BookTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "purchaseTransaction": lambda _id, _type, attributes, relationships:
-        PurchaseTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "atmTransaction": lambda _id, _type, attributes, relationships:
-        AtmTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "feeTransaction": lambda _id, _type, attributes, relationships:
-        FeeTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "cardTransaction": lambda _id, _type, attributes, relationships:
-        CardTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "wireTransaction": lambda _id, _type, attributes, relationships:
-        WireTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "releaseTransaction": lambda _id, _type, attributes, relationships:
-        ReleaseTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "adjustmentTransaction": lambda _id, _type, attributes, relationships:
-        AdjustmentTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "interestTransaction": lambda _id, _type, attributes, relationships:
-        InterestTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "disputeTransaction": lambda _id, _type, attributes, relationships:
-        DisputeTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "checkDepositTransaction": lambda _id, _type, attributes, relationships:
-        CheckDepositTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "returnedCheckDepositTransaction": lambda _id, _type, attributes, relationships:
-        ReturnedCheckDepositTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "paymentAdvanceTransaction": lambda _id, _type, attributes, relationships:
-        PaymentAdvanceTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "repaidPaymentAdvanceTransaction": lambda _id, _type, attributes, relationships:
-        RepaidPaymentAdvanceTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "rewardTransaction": lambda _id, _type, attributes, relationships:
-        RewardTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "paymentCanceledTransaction": lambda _id, _type, attributes, relationships:
-        PaymentCanceledTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "chargebackTransaction": lambda _id, _type, attributes, relationships:
-        ChargebackTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "cardReversalTransaction": lambda _id, _type, attributes, relationships:
-        CardReversalTransactionDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "achPayment": lambda _id, _type, attributes, relationships:
-        AchPaymentDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "bookPayment": lambda _id, _type, attributes, relationships:
-        BookPaymentDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "wirePayment": lambda _id, _type, attributes, relationships:
-        WirePaymentDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "billPayment": lambda _id, _type, attributes, relationships:
-        BillPaymentDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "achReceivedPayment": lambda _id, _type, attributes, relationships:
-        AchReceivedPaymentDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "accountStatementDTO": lambda _id, _type, attributes, relationships:
-        StatementDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "sandboxAccountStatement": lambda _id, _type, attributes, relationships:
-        StatementDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "customerBearerToken": lambda _id, _type, attributes, relationships:
-        CustomerTokenDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "customerTokenVerification": lambda _id, _type, attributes, relationships:
-        CustomerVerificationTokenDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "achCounterparty": lambda _id, _type, attributes, relationships:
-        CounterpartyDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "applicationForm": lambda _id, _type, attributes, relationships:
-        ApplicationFormDTO.from_json_api(_id, _type, attributes, relationships),
-
-        "fee": lambda _id, _type, attributes, relationships:
-        FeeDTO.from_json_api(_id, _type, attributes, relationships),
+# types whose DTOs ignore relationships, they aren't decoded for them
+without_relationships = {"document", "limits", "atmLocation", "pinStatus", "accountDepositProduct"}
 
-        "account.closed": lambda _id, _type, attributes, relationships:
-        AccountClosedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "account.frozen": lambda _id, _type, attributes, relationships:
-        AccountFrozenEvent.from_json_api(_id, _type, attributes, relationships),
+def decode_relationships(payload: Optional[Dict]):
+    if not payload:
+        return None
 
-        "application.awaitingDocuments": lambda _id, _type, attributes, relationships:
-        ApplicationAwaitingDocumentsEvent.from_json_api(_id, _type, attributes, relationships),
+    relationships = dict()
+    for k, v in payload.items():
+        data = v["data"]
+        if isinstance(data, list):
+            relationships[k] = RelationshipArray(data)
+        else:
+            relationships[k] = Relationship(data["type"], data["id"])
 
-        "application.denied": lambda _id, _type, attributes, relationships:
-        ApplicationDeniedEvent.from_json_api(_id, _type, attributes, relationships),
+    return relationships
 
-        "application.pendingReview": lambda _id, _type, attributes, relationships:
-        ApplicationPendingReviewEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "card.activated": lambda _id, _type, attributes, relationships:
-        CardActivatedEvent.from_json_api(_id, _type, attributes, relationships),
+def split_json_api_single_response(payload: Dict):
+    _id, _type, attributes = payload.get("id"), payload["type"], payload["attributes"]
+    return _id, _type, attributes, decode_relationships(payload.get("relationships"))
 
-        "card.statusChanged": lambda _id, _type, attributes, relationships:
-        CardStatusChangedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "authorization.created": lambda _id, _type, attributes, relationships:
-        AuthorizationCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+def split_json_api_array_response(payload):
+    if not isinstance(payload, list):
+        raise Exception("split_json_api_array_response - couldn't parse response.")
 
-        "authorizationRequest.declined": lambda _id, _type, attributes, relationships:
-        AuthorizationRequestDeclinedEvent.from_json_api(_id, _type, attributes, relationships),
+    dtos = []
+    for single_obj in payload:
+        dtos.append(split_json_api_single_response(single_obj))
 
-        "authorizationRequest.pending": lambda _id, _type, attributes, relationships:
-        AuthorizationRequestPendingEvent.from_json_api(_id, _type, attributes, relationships),
+    return dtos
 
-        "authorizationRequest.approved": lambda _id, _type, attributes, relationships:
-        AuthorizationRequestApprovedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "document.approved": lambda _id, _type, attributes, relationships:
-        DocumentApprovedEvent.from_json_api(_id, _type, attributes, relationships),
+def decode_limits(attributes: Dict):
+    if "ach" in attributes.keys():
+        return AccountLimitsDTO.from_json_api(attributes)
+    else:
+        return CardLimitsDTO.from_json_api(attributes)
 
-        "document.rejected": lambda _id, _type, attributes, relationships:
-        DocumentRejectedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "document.approved": lambda _id, _type, attributes, relationships:
-        DocumentApprovedEvent.from_json_api(_id, _type, attributes, relationships),
+def mapping_wraper(_id, _type, attributes, relationships):
+    decoder = mappings.get(_type)
+    if decoder:
+        return decoder(_id, _type, attributes, relationships)
+    else:
+        return RawUnitObject(_id, _type, attributes, relationships)
 
-        "checkDeposit.created": lambda _id, _type, attributes, relationships:
-        CheckDepositCreatedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "checkDeposit.clearing": lambda _id, _type, attributes, relationships:
-        CheckDepositClearingEvent.from_json_api(_id, _type, attributes, relationships),
+def compile_decoder(from_json_api: Decoder, relationships: bool = True) -> Callable[[Dict], object]:
+    """
+    Specializes from_json_api into a function of the raw JSON:API object, so decoding an object is a single call
+    and relationships are only decoded for the types that keep them.
+    """
+    if relationships:
+        def decode(payload: Dict):
+            return from_json_api(payload.get("id"), payload["type"], payload["attributes"],
+                                 decode_relationships(payload.get("relationships")))
+    else:
+        def decode(payload: Dict):
+            return from_json_api(payload.get("id"), payload["type"], payload["attributes"], None)
 
-        "checkDeposit.sent": lambda _id, _type, attributes, relationships:
-        CheckDepositSentEvent.from_json_api(_id, _type, attributes, relationships),
+    return decode
 
-        "payment.clearing": lambda _id, _type, attributes, relationships:
-        PaymentClearingEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "payment.sent": lambda _id, _type, attributes, relationships:
-        PaymentSentEvent.from_json_api(_id, _type, attributes, relationships),
+decoders = dict((_type, compile_decoder(from_json_api, _type not in without_relationships))
+                for _type, from_json_api in mappings.items())
+decode_raw_object = compile_decoder(RawUnitObject)
 
-        "payment.returned": lambda _id, _type, attributes, relationships:
-        PaymentReturnedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "statements.created": lambda _id, _type, attributes, relationships:
-        StatementsCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+def register_decoder(_type: str, from_json_api: Decoder, relationships: bool = True):
+    """
+    Registers how objects of a JSON:API type are decoded, replacing the SDK's decoder if it has one.
+    from_json_api is called with the id, type, attributes and relationships of every object of that type,
+    with relationships=False they aren't decoded and None is passed instead.
+    """
+    mappings[_type] = from_json_api
+    decoders[_type] = compile_decoder(from_json_api, relationships)
+    if relationships:
+        without_relationships.discard(_type)
+    else:
+        without_relationships.add(_type)
 
-        "transaction.created": lambda _id, _type, attributes, relationships:
-        TransactionCreatedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "customer.created": lambda _id, _type, attributes, relationships:
-        CustomerCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+def decode_object(payload: Dict):
+    return decoders.get(payload["type"], decode_raw_object)(payload)
 
-        "account.reopened": lambda _id, _type, attributes, relationships:
-        AccountReopenedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "webhook": lambda _id, _type, attributes, relationships:
-        WebhookDTO.from_json_api(_id, _type, attributes, relationships),
+_date_like = re.compile(r"\d{4}-\d\d-\d\d")
 
-        "institution": lambda _id, _type, attributes, relationships:
-        InstitutionDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "atmLocation": lambda _id, _type, attributes, relationships:
-        AtmLocationDTO.from_json_api(_type, attributes),
+def is_passthrough_value(value) -> bool:
+    """
+    True for the attribute values every DTO keeps unchanged: numbers, booleans and strings that aren't dates.
+    Dates, nested objects and lists are converted by the DTO's own from_json_api.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return True
 
-        "biller": lambda _id, _type, attributes, relationships:
-        BillerDTO.from_json_api(_id, _type, attributes, relationships),
+    return isinstance(value, str) and _date_like.match(value) is None
 
-        "apiToken": lambda _id, _type, attributes, relationships:
-        APITokenDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "authorization": lambda _id, _type, attributes, relationships:
-        AuthorizationDTO.from_json_api(_id, _type, attributes, relationships),
+class LazyAttributes(Mapping):
+    """
+    Read-only view of the attributes of a LazyDTO. Plain values are served straight from the raw payload,
+    anything else materializes the DTO once and is read from it.
+    """
+    __slots__ = ("_owner", "_raw")
 
-        "purchaseAuthorizationRequest": lambda _id, _type, attributes, relationships:
-        PurchaseAuthorizationRequestDTO.from_json_api(_id, _type, attributes, relationships),
+    def __init__(self, owner: "LazyDTO", raw: Dict):
+        self._owner = owner
+        self._raw = raw
 
-        "accountEndOfDay": lambda _id, _type, attributes, relationships:
-        AccountEndOfDayDTO.from_json_api(_id, _type, attributes, relationships),
+    def __getitem__(self, key):
+        if self._owner._dto is None:
+            value = self._raw.get(key, _missing)
+            if value is not _missing and is_passthrough_value(value):
+                return value
 
-        "counterpartyBalance": lambda _id, _type, attributes, relationships:
-        CounterpartyBalanceDTO.from_json_api(_id, _type, attributes, relationships),
+        return self._owner.materialize().attributes[key]
 
-        "pinStatus": lambda _id, _type, attributes, relationships:
-        PinStatusDTO.from_json_api(attributes),
+    def __iter__(self):
+        return iter(self._owner.materialize().attributes)
 
-        "accountDepositProduct": lambda _id, _type, attributes, relationships:
-        AccountDepositProductDTO.from_json_api(attributes),
+    def __len__(self):
+        return len(self._owner.materialize().attributes)
 
-        "checkDeposit": lambda _id, _type, attributes, relationships:
-        CheckDepositDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "dispute": lambda _id, _type, attributes, relationships:
-        DisputeDTO.from_json_api(_id, _type, attributes, relationships),
+_missing = object()
 
-        "mobileWalletPayload": lambda _id, _type, attributes, relationships:
-        MobileWalletPayloadDTO.from_json_api(_id, _type, attributes, relationships),
-    }
 
+class LazyDTO(object):
+    """
+    Wraps a raw JSON:API resource object and decodes it on demand. id and type are available right away,
+    relationships are decoded on first access and the typed DTO, with its dates and nested objects, is built
+    the first time an attribute needs it. Every decoded part is memoized.
+    """
+    __slots__ = ("id", "type", "raw", "_dto", "_attributes", "_relationships")
 
-def split_json_api_single_response(payload: Dict):
-    _id, _type, attributes = payload.get("id"), payload["type"], payload["attributes"]
-    relationships = None
+    def __init__(self, payload: Dict):
+        self.id = payload.get("id")
+        self.type = payload["type"]
+        self.raw = payload
+        self._dto = None
+        self._attributes = None
+        self._relationships = _missing
 
-    if payload.get("relationships"):
-        relationships = dict()
-        for k, v in payload.get("relationships").items():
-            if isinstance(v["data"], list):
-                relationships[k] = RelationshipArray(v["data"])
-            else:
-                relationships[k] = Relationship(v["data"]["type"], v["data"]["id"])
+    def materialize(self):
+        if self._dto is None:
+            _id, _type, attributes, _ = split_json_api_single_response(self.raw)
+            self._dto = mapping_wraper(_id, _type, attributes, self.relationships)
 
-    return _id, _type, attributes, relationships
+        return self._dto
 
+    @property
+    def attributes(self):
+        if self._attributes is None:
+            self._attributes = LazyAttributes(self, self.raw.get("attributes") or {})
 
-def split_json_api_array_response(payload):
-    if not isinstance(payload, list):
-        raise Exception("split_json_api_array_response - couldn't parse response.")
+        return self._attributes
 
-    dtos = []
-    for single_obj in payload:
-        dtos.append(split_json_api_single_response(single_obj))
+    @property
+    def relationships(self):
+        if self._relationships is _missing:
+            self._relationships = decode_relationships(self.raw.get("relationships"))
 
-    return dtos
+        return self._relationships
 
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
 
-def decode_limits(attributes: Dict):
-    if "ach" in attributes.keys():
-        return AccountLimitsDTO.from_json_api(attributes)
-    else:
-        return CardLimitsDTO.from_json_api(attributes)
+        return getattr(self.materialize(), name)
 
-def mapping_wraper(_id, _type, attributes, relationships):
-    if _type in mappings:
-        return mappings[_type](_id, _type, attributes, relationships)
-    else:
-        return RawUnitObject(_id, _type, attributes, relationships)
 
 class DtoDecoder(object):
     @staticmethod
-    def decode(payload):
+    def decode(payload, lazy: bool = False):
+        """
+        Decodes a JSON:API data or included member. With lazy, LazyDTO wrappers are returned and every object
+        is only decoded as far as it is accessed.
+        """
         if payload is None:
             return None
-        # if response contains a list of dtos
-        if isinstance(payload, list):
-            dtos = split_json_api_array_response(payload)
-            response = []
-            for _id, _type, attributes, relationships in dtos:
-                response.append(mapping_wraper(_id, _type, attributes, relationships))
 
-            return response
+        if lazy:
+            return [LazyDTO(p) for p in payload] if isinstance(payload, list) else LazyDTO(payload)
+
+        if isinstance(payload, list):
+            return [decoders.get(p["type"], decode_raw_object)(p) for p in payload]
         else:
-            _id, _type, attributes, relationships = split_json_api_single_response(payload)
-            return mapping_wraper(_id, _type, attributes, relationships)
+            return decode_object(payload)
+
 
 class UnitEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -6,6 +6,8 @@ from unit.models import *
 
 
 class CounterpartyDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, name: str, routing_number: str, bank: Optional[str],
                  account_number: str, account_type: str, type: str, permissions: str,
                  relationships: [Dict[str, Relationship]]):
@@ -24,6 +26,9 @@ class CounterpartyDTO(object):
 
 
 class CreateCounterpartyRequest(object):
+    __slots__ = ("name", "routing_number", "account_number", "account_type", "type", "relationships", "tags",
+                 "idempotency_key")
+
     def __init__(self, name: str, routing_number: str, account_number: str, account_type: str, type: str,
                  relationships: [Dict[str, Relationship]], tags: Optional[object] = None,
                  idempotency_key: Optional[str] = None):
@@ -64,6 +69,9 @@ class CreateCounterpartyRequest(object):
 
 
 class CreateCounterpartyWithTokenRequest(UnitRequest):
+    __slots__ = ("name", "type", "plaid_processor_token", "verify_name", "permissions", "relationships", "tags",
+                 "idempotency_key")
+
     def __init__(self, name: str, type: str, plaid_processor_token: str, relationships: [Dict[str, Relationship]],
                  verify_name: Optional[bool] = None, permissions: Optional[str] = None, tags: Optional[object] = None,
                  idempotency_key: Optional[str] = None):
@@ -109,6 +117,8 @@ class CreateCounterpartyWithTokenRequest(UnitRequest):
 
 
 class PatchCounterpartyRequest(object):
+    __slots__ = ("counterparty_id", "plaid_processor_token", "verify_name", "permissions", "tags")
+
     def __init__(self, counterparty_id: str, plaid_processor_token: str, verify_name: Optional[bool] = None,
                  permissions: Optional[str] = None, tags: Optional[object] = None):
         self.counterparty_id = counterparty_id
@@ -143,6 +153,8 @@ class PatchCounterpartyRequest(object):
 
 
 class CounterpartyBalanceDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, balance: int, available: int, relationships: [Dict[str, Relationship]]):
         self.id = id
         self.type = "counterpartyBalance"
@@ -155,6 +167,8 @@ class CounterpartyBalanceDTO(object):
 
 
 class ListCounterpartyParams(UnitParams):
+    __slots__ = ("offset", "limit", "customer_id", "tags")
+
     def __init__(self, offset: int = 0, limit: int = 100, customer_id: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
         self.offset = offset
@@ -8,6 +8,8 @@ CustomerStatus = Literal["Active", "Archived"]
 
 
 class IndividualCustomerDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, full_name: FullName, date_of_birth: date, address: Address,
                  phone: Phone, email: str, ssn: Optional[str], passport: Optional[str], nationality: Optional[str],
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]],
@@ -35,6 +37,8 @@ class IndividualCustomerDTO(object):
 
 
 class BusinessCustomerDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, created_at: datetime, name: str, address: Address, phone: Phone,
                  state_of_incorporation: str, ein: str, entity_type: EntityType, contact: BusinessContact,
                  authorized_users: Optional[List[AuthorizedUser]], dba: Optional[str], tags: Optional[Dict[str, str]],
@@ -63,6 +67,8 @@ CustomerDTO = Union[IndividualCustomerDTO, BusinessCustomerDTO]
 
 
 class PatchIndividualCustomerRequest(UnitRequest):
+    __slots__ = ("customer_id", "address", "phone", "email", "dba", "tags", "jwt_subject", "authorized_users")
+
     def __init__(self, customer_id: str, address: Optional[Address] = None, phone: Optional[Phone] = None,
                  email: Optional[str] = None, dba: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
                  jwt_subject: Optional[str] = None, authorized_users: Optional[AuthorizedUser] = None):
@@ -111,6 +117,8 @@ class PatchIndividualCustomerRequest(UnitRequest):
 
 
 class PatchBusinessCustomerRequest(UnitRequest):
+    __slots__ = ("customer_id", "address", "phone", "contact", "authorized_users", "tags")
+
     def __init__(self, customer_id: str, address: Optional[Address] = None, phone: Optional[Phone] = None,
                  contact: Optional[BusinessContact] = None, authorized_users: Optional[List[AuthorizedUser]] = None,
                  tags: Optional[Dict[str, str]] = None):
@@ -154,6 +162,8 @@ PatchCustomerRequest = Union[PatchIndividualCustomerRequest, PatchBusinessCustom
 
 
 class ListCustomerParams(UnitParams):
+    __slots__ = ("offset", "limit", "query", "email", "tags", "sort")
+
     def __init__(self, offset: int = 0, limit: int = 100, query: Optional[str] = None, email: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, sort: Optional[Literal["createdAt", "-createdAt"]] = None):
         self.offset = offset
@@ -177,6 +187,8 @@ class ListCustomerParams(UnitParams):
 
 
 class ArchiveCustomerRequest(UnitRequest):
+    __slots__ = ("customer_id", "reason")
+
     def __init__(self, customer_id: str, reason: Optional[ArchiveReason] = None):
         self.customer_id = customer_id
         self.reason = reason
@@ -199,6 +211,8 @@ class ArchiveCustomerRequest(UnitRequest):
 
 
 class AddAuthorizedUsersRequest(UnitRequest):
+    __slots__ = ("customer_id", "authorized_users")
+
     def __init__(self, customer_id: str, authorized_users: List[AuthorizedUser]):
         self.customer_id = customer_id
         self.authorized_users = authorized_users
@@ -218,6 +232,8 @@ class AddAuthorizedUsersRequest(UnitRequest):
 
 
 class RemoveAuthorizedUsersRequest(UnitRequest):
+    __slots__ = ("customer_id", "authorized_users_emails")
+
     def __init__(self, customer_id: str, authorized_users_emails: List[str]):
         self.customer_id = customer_id
         self.authorized_users_emails = authorized_users_emails
@@ -2,6 +2,8 @@ from unit.models import *
 
 
 class CustomerTokenDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, token: str, expires_in: int):
         self.type = "customerBearerToken"
         self.attributes = {"token": token, "expiresIn": expires_in}
@@ -12,6 +14,8 @@ class CustomerTokenDTO(object):
 
 
 class CustomerVerificationTokenDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, verification_token: str):
         self.type = "customerTokenVerification"
         self.attributes = {"verificationToken": verification_token}
@@ -22,6 +26,8 @@ class CustomerVerificationTokenDTO(object):
 
 
 class CreateCustomerToken(UnitRequest):
+    __slots__ = ("customer_id", "scope", "verification_token", "verification_code", "expires_in", "jwt_token")
+
     def __init__(self, customer_id: str, scope: str, verification_token: Optional[str] = None,
                  verification_code: Optional[str] = None, expires_in: Optional[int] = None,
                  jwt_token: Optional[str] = None):
@@ -61,6 +67,8 @@ class CreateCustomerToken(UnitRequest):
 
 
 class CreateCustomerTokenVerification(UnitRequest):
+    __slots__ = ("customer_id", "channel", "phone", "app_hash", "language")
+
     def __init__(self, customer_id: str, channel: str, phone: Optional[Phone] = None, app_hash: Optional[str] = None,
                  language: Optional[str] = None):
         self.customer_id = customer_id
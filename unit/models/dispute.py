@@ -5,6 +5,8 @@ DisputeStatus = Literal["InvestigationStarted", "ProvisionallyCredited", "Denied
 
 
 class DisputeStatusHistory(object):
+    __slots__ = ("type", "updated_at")
+
     def __init__(self, _type: DisputeStatus, updated_at: datetime):
         self.type = _type
         self.updated_at = updated_at
@@ -22,6 +24,8 @@ class DisputeStatusHistory(object):
 
 
 class DisputeDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, source: str, status: DisputeStatus,
                  status_history: Optional[List[DisputeStatusHistory]], description: str, created_at: datetime,
                  updated_at: Optional[datetime], amount: str, decision_reason: Optional[str],
@@ -43,6 +47,8 @@ class DisputeDTO(object):
 
 
 class ListDisputeParams(UnitParams):
+    __slots__ = ("limit", "offset", "query")
+
     def __init__(self, limit: int = 100, offset: int = 0, query: Optional[str] = None):
         self.limit = limit
         self.offset = offset
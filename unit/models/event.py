@@ -5,6 +5,8 @@ from unit.utils import date_utils
 from unit.models import *
 
 class BaseEvent(object):
+    __slots__ = ("id", "attributes", "relationships", "type")
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -13,6 +15,8 @@ class BaseEvent(object):
 
 
 class AccountClosedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, close_reason: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -26,6 +30,8 @@ class AccountClosedEvent(BaseEvent):
 
 
 class AccountFrozenEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, freeze_reason: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -39,6 +45,8 @@ class AccountFrozenEvent(BaseEvent):
 
 
 class ApplicationDeniedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -51,6 +59,8 @@ class ApplicationDeniedEvent(BaseEvent):
 
 
 class ApplicationPendingReviewEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -63,6 +73,8 @@ class ApplicationPendingReviewEvent(BaseEvent):
 
 
 class ApplicationAwaitingDocumentsEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -75,6 +87,8 @@ class ApplicationAwaitingDocumentsEvent(BaseEvent):
 
 
 class AuthorizationCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, card_last_4_digits: str, recurring: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -89,6 +103,8 @@ class AuthorizationCreatedEvent(BaseEvent):
                                          attributes.get("tags"), relationships)
 
 class AuthorizationRequestApprovedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, amount: str, status: str, approved_amount: str,
                  partial_approval_allowed: str, merchant: Dict[str, str], recurring: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -112,6 +128,8 @@ class AuthorizationRequestApprovedEvent(BaseEvent):
 
 
 class AuthorizationRequestDeclinedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, amount: str, status: str, decline_reason: str,
                  partial_approval_allowed: str, merchant: Dict[str, str], recurring: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -135,6 +153,8 @@ class AuthorizationRequestDeclinedEvent(BaseEvent):
 
 
 class AuthorizationRequestPendingEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, amount: str, status: str, partial_approval_allowed: str,
                  merchant: Dict[str, str], recurring: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -155,6 +175,8 @@ class AuthorizationRequestPendingEvent(BaseEvent):
                                                 attributes["recurring"], attributes.get("tags"), relationships)
 
 class CardActivatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -167,6 +189,8 @@ class CardActivatedEvent(BaseEvent):
 
 
 class CardStatusChangedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, new_status: str, previous_status: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -181,6 +205,8 @@ class CardStatusChangedEvent(BaseEvent):
 
 
 class CheckDepositCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -193,6 +219,8 @@ class CheckDepositCreatedEvent(BaseEvent):
                                       attributes["status"], attributes.get("tags"), relationships)
 
 class CheckDepositClearingEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -206,6 +234,8 @@ class CheckDepositClearingEvent(BaseEvent):
 
 
 class CheckDepositSentEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -219,6 +249,8 @@ class CheckDepositSentEvent(BaseEvent):
 
 
 class CheckDepositReturnedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -232,6 +264,8 @@ class CheckDepositReturnedEvent(BaseEvent):
 
 
 class CustomerCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -243,6 +277,8 @@ class CustomerCreatedEvent(BaseEvent):
                                     attributes.get("tags"), relationships)
 
 class DocumentApprovedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -254,6 +290,8 @@ class DocumentApprovedEvent(BaseEvent):
                                     attributes.get("tags"), relationships)
 
 class DocumentRejectedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, reason: str, reason_code: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -269,6 +307,8 @@ class DocumentRejectedEvent(BaseEvent):
 
 
 class PaymentClearingEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -281,6 +321,8 @@ class PaymentClearingEvent(BaseEvent):
                                     attributes.get("tags"), relationships)
 
 class PaymentSentEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -293,6 +335,8 @@ class PaymentSentEvent(BaseEvent):
                                     attributes.get("tags"), relationships)
 
 class PaymentReturnedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -305,6 +349,8 @@ class PaymentReturnedEvent(BaseEvent):
                                     attributes.get("tags"), relationships)
 
 class StatementsCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, period: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -317,6 +363,8 @@ class StatementsCreatedEvent(BaseEvent):
                                     attributes.get("tags"), relationships)
 
 class TransactionCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, summary: str, direction: str, amount: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -332,6 +380,8 @@ class TransactionCreatedEvent(BaseEvent):
                                        relationships)
 
 class AccountReopenedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime,tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -352,6 +402,8 @@ EventDTO = Union[AccountClosedEvent, AccountFrozenEvent, ApplicationDeniedEvent,
 
 
 class ListEventParams(UnitParams):
+    __slots__ = ("limit", "offset", "type")
+
     def __init__(self, limit: int = 100, offset: int = 0, type: Optional[List[str]] = None):
         self.limit = limit
         self.offset = offset
@@ -4,6 +4,8 @@ from unit.models import *
 
 
 class FeeDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, amount: int, description: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -17,6 +19,8 @@ class FeeDTO(object):
 
 
 class CreateFeeRequest(object):
+    __slots__ = ("amount", "description", "tags", "idempotency_key", "relationships")
+
     def __init__(self, amount: int, description: str, relationships: Optional[Dict[str, Relationship]],
                  tags: Optional[Dict[str, str]] = None, idempotency_key: Optional[str] = None):
         self.amount = amount
@@ -4,6 +4,8 @@ from unit.models import *
 
 
 class InstitutionDTO(object):
+    __slots__ = ("type", "attributes")
+
     def __init__(self, routing_number: str, name: str, is_ach_supported: bool, is_wire_supported: bool,
                  address: Optional[Address] = None):
         self.type = "institution"
@@ -1,12 +1,18 @@
 from unit.utils import date_utils
 from unit.models import *
+from unit.models.schema import json_api_request, required, optional
 
 PaymentTypes = Literal["AchPayment", "BookPayment", "WirePayment", "BillPayment"]
 PaymentDirections = Literal["Debit", "Credit"]
 PaymentStatus = Literal["Pending", "Rejected", "Clearing", "Sent", "Canceled", "Returned"]
 
+payment_request_fields = (required("amount"), required("direction"), required("description"),
+                          optional("idempotency_key"), optional("tags"))
+
 
 class BasePayment(object):
+    __slots__ = ("id", "attributes", "relationships", "type")
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, direction: PaymentDirections, description: str,
                  amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -17,6 +23,8 @@ class BasePayment(object):
 
 
 class AchPaymentDTO(BasePayment):
+    __slots__ = ()
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, counterparty: Counterparty, direction: str,
                  description: str, amount: int, addenda: Optional[str], reason: Optional[str],
                  settlement_date: Optional[date], tags: Optional[Dict[str, str]],
@@ -38,6 +46,8 @@ class AchPaymentDTO(BasePayment):
 
 
 class BookPaymentDTO(BasePayment):
+    __slots__ = ()
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, direction: Optional[str], description: str,
                  amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -52,6 +62,8 @@ class BookPaymentDTO(BasePayment):
 
 
 class WirePaymentDTO(BasePayment):
+    __slots__ = ()
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, counterparty: WireCounterparty,
                  direction: str, description: str, amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -68,6 +80,8 @@ class WirePaymentDTO(BasePayment):
 
 
 class BillPaymentDTO(BasePayment):
+    __slots__ = ()
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, direction: str, description: str,
                  amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -87,6 +101,8 @@ AchReceivedPaymentStatus = Literal["Pending", "Advanced", "Completed", "Returned
 
 
 class AchReceivedPaymentDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, created_at: datetime, status: AchReceivedPaymentStatus, was_advanced: bool,
                  completion_date: date, return_reason: Optional[str], amount: int, description: str,
                  addenda: Optional[str], company_name: str, counterparty_routing_number: str, trace_number: str,
@@ -111,7 +127,10 @@ class AchReceivedPaymentDTO(object):
                                      attributes.get("secCode"), attributes.get("tags"), relationships)
 
 
+@json_api_request(*payment_request_fields)
 class CreatePaymentBaseRequest(UnitRequest):
+    __slots__ = ("type", "amount", "description", "direction", "idempotency_key", "tags", "relationships", "same_day")
+
     def __init__(self, amount: int, description: str, relationships: Dict[str, Relationship],
                  idempotency_key: Optional[str], tags: Optional[Dict[str, str]], direction: str = "Credit",
                  type: str = "achPayment"):
@@ -123,32 +142,14 @@ class CreatePaymentBaseRequest(UnitRequest):
         self.tags = tags
         self.relationships = relationships
 
-    def to_json_api(self) -> Dict:
-        payload = {
-            "data": {
-                "type": self.type,
-                "attributes": {
-                    "amount": self.amount,
-                    "direction": self.direction,
-                    "description": self.description
-                },
-                "relationships": self.relationships
-            }
-        }
-
-        if self.idempotency_key:
-            payload["data"]["attributes"]["idempotencyKey"] = self.idempotency_key
-
-        if self.tags:
-            payload["data"]["attributes"]["tags"] = self.tags
-
-        return payload
-
     def __repr__(self):
         json.dumps(self.to_json_api())
 
 
+@json_api_request(*payment_request_fields, required("counterparty"), required("same_day"), optional("addenda"))
 class CreateInlinePaymentRequest(CreatePaymentBaseRequest):
+    __slots__ = ("counterparty", "addenda")
+
     def __init__(self, amount: int, description: str, counterparty: Counterparty, relationships: Dict[str, Relationship],
                  addenda: Optional[str] = None, idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, direction: str = "Credit", same_day: bool = False):
@@ -157,19 +158,12 @@ class CreateInlinePaymentRequest(CreatePaymentBaseRequest):
         self.addenda = addenda
         self.same_day = same_day
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-
-        payload["data"]["attributes"]["counterparty"] = self.counterparty
-        payload["data"]["attributes"]["sameDay"] = self.same_day
-
-        if self.addenda:
-            payload["data"]["attributes"]["addenda"] = self.addenda
-
-        return payload
-
 
+@json_api_request(*payment_request_fields, required("same_day"), optional("addenda"),
+                  optional("verify_counterparty_balance"))
 class CreateLinkedPaymentRequest(CreatePaymentBaseRequest):
+    __slots__ = ("addenda", "verify_counterparty_balance")
+
     def __init__(self, amount: int, description: str, relationships: Dict[str, Relationship],
                  addenda: Optional[str] = None, verify_counterparty_balance: Optional[bool] = None,
                  idempotency_key: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
@@ -179,21 +173,12 @@ class CreateLinkedPaymentRequest(CreatePaymentBaseRequest):
         self.verify_counterparty_balance = verify_counterparty_balance
         self.same_day = same_day
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-
-        payload["data"]["attributes"]["sameDay"] = self.same_day
-
-        if self.addenda:
-            payload["data"]["attributes"]["addenda"] = self.addenda
-
-        if self.verify_counterparty_balance:
-            payload["data"]["attributes"]["verifyCounterpartyBalance"] = self.verify_counterparty_balance
-
-        return payload
-
 
+@json_api_request(*payment_request_fields, required("plaid_processor_token"), required("same_day"),
+                  optional("counterparty_name"), optional("verify_counterparty_balance"))
 class CreateVerifiedPaymentRequest(CreatePaymentBaseRequest):
+    __slots__ = ("plaid_processor_token", "counterparty_name", "verify_counterparty_balance")
+
     def __init__(self, amount: int, description: str, plaid_processor_token: str, relationships: Dict[str, Relationship],
                  counterparty_name: Optional[str] = None, verify_counterparty_balance: Optional[bool] = None,
                  idempotency_key: Optional[str] = None, tags: Optional[Dict[str, str]] = None, direction: str = "Credit",
@@ -204,28 +189,20 @@ class CreateVerifiedPaymentRequest(CreatePaymentBaseRequest):
         self.verify_counterparty_balance = verify_counterparty_balance
         self.same_day = same_day
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-        payload["data"]["attributes"]["plaidProcessorToken"] = self.plaid_processor_token
-        payload["data"]["attributes"]["sameDay"] = self.same_day
-
-        if self.counterparty_name:
-            payload["data"]["attributes"]["counterpartyName"] = self.counterparty_name
-
-        if self.verify_counterparty_balance:
-            payload["data"]["attributes"]["verifyCounterpartyBalance"] = self.verify_counterparty_balance
-
-        return payload
-
 
 class CreateBookPaymentRequest(CreatePaymentBaseRequest):
+    __slots__ = ()
+
     def __init__(self, amount: int, description: str, relationships: Dict[str, Relationship],
                  idempotency_key: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
                  direction: str = "Credit"):
         super().__init__(amount, description, relationships, idempotency_key, tags, direction, "bookPayment")
 
 
+@json_api_request(*payment_request_fields, required("counterparty"))
 class CreateWirePaymentRequest(CreatePaymentBaseRequest):
+    __slots__ = ("counterparty",)
+
     def __init__(self, amount: int, description: str, counterparty: WireCounterparty,
                  relationships: Dict[str, Relationship], idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, direction: str = "Credit"):
@@ -233,54 +210,31 @@ class CreateWirePaymentRequest(CreatePaymentBaseRequest):
                                       "wirePayment")
         self.counterparty = counterparty
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-        payload["data"]["attributes"]["counterparty"] = self.counterparty
-        return payload
-
 
 CreatePaymentRequest = Union[CreateInlinePaymentRequest, CreateLinkedPaymentRequest, CreateVerifiedPaymentRequest,
                              CreateBookPaymentRequest, CreateWirePaymentRequest]
 
 
+@json_api_request(required("tags"), _type="achPayment", relationships=None)
 class PatchAchPaymentRequest(object):
+    __slots__ = ("payment_id", "tags")
+
     def __init__(self, payment_id: str, tags: Dict[str, str]):
         self.payment_id = payment_id
         self.tags = tags
 
-    def to_json_api(self) -> Dict:
-        payload = {
-            "data": {
-                "type": "achPayment",
-                "attributes": {
-                    "tags": self.tags
-                }
-            }
-        }
-
-        return payload
-
     def __repr__(self):
         json.dumps(self.to_json_api())
 
 
+@json_api_request(required("tags"), _type="bookPayment", relationships=None)
 class PatchBookPaymentRequest(object):
+    __slots__ = ("payment_id", "tags")
+
     def __init__(self, payment_id: str, tags: Dict[str, str]):
         self.payment_id = payment_id
         self.tags = tags
 
-    def to_json_api(self) -> Dict:
-        payload = {
-            "data": {
-                "type": "bookPayment",
-                "attributes": {
-                    "tags": self.tags
-                }
-            }
-        }
-
-        return payload
-
     def __repr__(self):
         json.dumps(self.to_json_api())
 
@@ -289,6 +243,9 @@ PatchPaymentRequest = Union[PatchAchPaymentRequest, PatchBookPaymentRequest]
 
 
 class ListPaymentParams(UnitParams):
+    __slots__ = ("limit", "offset", "account_id", "customer_id", "tags", "status", "type", "direction", "since",
+                 "until", "sort", "include")
+
     def __init__(self, limit: int = 100, offset: int = 0, account_id: Optional[str] = None,
                  customer_id: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
                  status: Optional[List[PaymentStatus]] = None, type: Optional[List[PaymentTypes]] = None,
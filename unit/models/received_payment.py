@@ -7,6 +7,8 @@ AchReceivedPaymentStatus = Literal["Pending", "Advanced", "Completed", "Returned
 
 
 class AchReceivedPaymentDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, created_at: datetime, status: AchReceivedPaymentStatus, was_advanced: bool,
                  completion_date: date, return_reason: Optional[str], amount: int, description: str,
                  addenda: Optional[str], company_name: str, counterparty_routing_number: str, trace_number: str,
@@ -31,6 +33,8 @@ class AchReceivedPaymentDTO(object):
 
 
 class PatchReceivedPaymentRequest(object):
+    __slots__ = ("payment_id", "tags")
+
     def __init__(self, payment_id: str, tags: Dict[str, str]):
         self.payment_id = payment_id
         self.tags = tags
@@ -52,6 +56,9 @@ class PatchReceivedPaymentRequest(object):
 
 
 class ListReceivedPaymentParams(UnitParams):
+    __slots__ = ("limit", "offset", "account_id", "customer_id", "tags", "status", "include_completed", "sort",
+                 "include")
+
     def __init__(self, limit: int = 100, offset: int = 0, account_id: Optional[str] = None,
                  customer_id: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
                  status: Optional[List[AchReceivedPaymentStatus]] = None, include_completed: Optional[bool] = None,
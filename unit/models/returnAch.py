@@ -6,6 +6,8 @@ AchReturnReason = Literal["Unauthorized"]
 
 
 class ReturnReceivedAchTransactionRequest(object):
+    __slots__ = ("transaction_id", "reason", "relationships")
+
     def __init__(self, transaction_id: str, reason: AchReturnReason, relationships: [Dict[str, Relationship]]):
         self.transaction_id = transaction_id
         self.reason = reason
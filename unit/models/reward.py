@@ -9,6 +9,8 @@ RELATED_RESOURCES = Literal["customer", "account", "transaction"]
 RewardStatus = Literal["Sent", "Rejected"]
 
 class RewardDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, _id: str, created_at: datetime, amount: int, description: str, status: RewardStatus,
                  reject_reason: Optional[str], tags: Optional[Dict[str, str]] = None,
                  relationships: Optional[Dict[str, Relationship]] = None):
@@ -26,6 +28,9 @@ class RewardDTO(object):
 
 
 class CreateRewardRequest(UnitRequest):
+    __slots__ = ("type", "amount", "description", "rewarded_transaction_id", "receiving_account_id",
+                 "funding_account_id", "idempotency_key", "tags", "relationships")
+
     def __init__(
         self,
         amount: int,
@@ -82,6 +87,9 @@ class CreateRewardRequest(UnitRequest):
 
 
 class ListRewardsParams(UnitParams):
+    __slots__ = ("limit", "offset", "transaction_id", "rewarded_transaction_id", "receiving_account_id", "customer_id",
+                 "card_id", "status", "since", "until", "sort", "include", "tags")
+
     def __init__(
         self,
         limit: int = 100,
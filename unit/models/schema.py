@@ -0,0 +1,167 @@
+"""
+Declarative field schemas of JSON:API models. A model lists its attributes once, with json_api_dto or
+json_api_request, and its from_json_api or to_json_api, and the constructor of a DTO, are generated from the list as
+straight-line Python source, compiled once when the class is defined: decoding and encoding run no per-field
+branches or loops of their own, and the list is the only place the names and JSON:API keys of the attributes are
+given.
+"""
+import linecache
+from typing import Callable, Optional, Tuple
+from unit.models import camel_case_name
+
+
+class Field(object):
+    """
+    An attribute of a model: name is its Python name, key its JSON:API name, camelCase of name unless given.
+    A required field is always decoded and encoded, an optional one may be missing from the payload and is only
+    encoded when truthy. convert maps the JSON value to its Python value, e.g. date_utils.to_datetime or a nested
+    model's from_json_api, and is never called with None for an optional field.
+    """
+    __slots__ = ("name", "key", "required", "convert")
+
+    def __init__(self, name: str, required: bool = True, convert: Optional[Callable] = None, key: Optional[str] = None):
+        self.name = name
+        self.key = key or camel_case_name(name)
+        self.required = required
+        self.convert = convert
+
+    def __repr__(self):
+        return f"Field({self.name!r}, required={self.required})"
+
+
+def required(name: str, convert: Optional[Callable] = None, key: Optional[str] = None) -> Field:
+    return Field(name, True, convert, key)
+
+
+def optional(name: str, convert: Optional[Callable] = None, key: Optional[str] = None) -> Field:
+    return Field(name, False, convert, key)
+
+
+def compile_function(name: str, owner: type, lines: list, namespace: dict) -> Callable:
+    """
+    Compiles the source of a generated function. The source is registered with linecache, so tracebacks and
+    debuggers show the generated lines.
+    """
+    source = "\n".join(lines) + "\n"
+    filename = f"<{name} of {owner.__module__}.{owner.__qualname__}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace[name]
+
+
+def compile_decoder(cls: type, _type: str, fields: Tuple[Field, ...]) -> Callable:
+    """
+    Generates from_json_api(_id, _type, attributes, relationships) of a DTO holding its fields in an attributes
+    dict keyed by their JSON:API names, as the DTOs' constructors do. The DTO is built without its constructor.
+    """
+    namespace = {"new": object.__new__, "cls": cls}
+    values = []
+    for i, field in enumerate(fields):
+        key = repr(field.key)
+        if field.convert is not None:
+            namespace[f"convert_{i}"] = field.convert
+
+        if field.required:
+            value = f"attributes[{key}]"
+            values.append(f"{key}: convert_{i}({value})" if field.convert is not None else f"{key}: {value}")
+        elif field.convert is not None:
+            values.append(f"{key}: convert_{i}(value) if (value := attributes.get({key})) is not None else None")
+        else:
+            values.append(f"{key}: attributes.get({key})")
+
+    lines = ["def from_json_api(_id, _type, attributes, relationships):",
+             "    dto = new(cls)",
+             "    dto.id = _id",
+             f"    dto.type = {_type!r}",
+             "    dto.attributes = {" + ", ".join(values) + "}",
+             "    dto.relationships = relationships",
+             "    return dto"]
+    return compile_function("from_json_api", cls, lines, namespace)
+
+
+def compile_initializer(cls: type, _type: str, fields: Tuple[Field, ...], order: Tuple[str, ...]) -> Callable:
+    """
+    Generates __init__(self, id, *order, relationships) of a DTO, building the same attributes dict as its decoder
+    from already converted values. order names every field once, in the order the constructor takes them.
+    """
+    names = [field.name for field in fields]
+    if sorted(order) != sorted(names):
+        raise TypeError(f"The constructor of {cls.__qualname__} must take its fields {', '.join(names)}")
+
+    values = [f"{field.key!r}: {field.name}" for field in fields]
+    lines = [f"def __init__(self, id, {', '.join(list(order) + ['relationships'])}):",
+             "    self.id = id",
+             f"    self.type = {_type!r}",
+             "    self.attributes = {" + ", ".join(values) + "}",
+             "    self.relationships = relationships"]
+    return compile_function("__init__", cls, lines, {})
+
+
+def compile_encoder(cls: type, _type: Optional[str], fields: Tuple[Field, ...],
+                    relationships: Optional[str]) -> Callable:
+    """
+    Generates to_json_api(self) of a request. Required fields are always encoded, optional ones only when truthy,
+    in the order of fields.
+    """
+    namespace = {}
+    leading = []
+    for field in fields:
+        if not field.required or field.convert is not None:
+            break
+        leading.append(f"{field.key!r}: self.{field.name}")
+
+    lines = ["def to_json_api(self):", "    attributes = {" + ", ".join(leading) + "}"]
+    for i, field in enumerate(fields[len(leading):], len(leading)):
+        value = f"self.{field.name}"
+        if field.convert is not None:
+            namespace[f"convert_{i}"] = field.convert
+            value = f"convert_{i}(value)" if not field.required else f"convert_{i}({value})"
+
+        if field.required:
+            lines.append(f"    attributes[{field.key!r}] = {value}")
+        else:
+            lines.append(f"    value = self.{field.name}")
+            lines.append("    if value:")
+            lines.append(f"        attributes[{field.key!r}] = {value if field.convert is not None else 'value'}")
+
+    data = f"'type': {'self.type' if _type is None else repr(_type)}, 'attributes': attributes"
+    if relationships is not None:
+        data += f", 'relationships': self.{relationships}"
+    lines.append("    return {'data': {" + data + "}}")
+    return compile_function("to_json_api", cls, lines, namespace)
+
+
+def json_api_dto(_type: str, *fields: Field, init_order: Optional[Tuple[str, ...]] = None):
+    """
+    Class decorator generating the from_json_api of a DTO of the JSON:API type _type from its fields, and its
+    __init__ unless the class defines one. The constructor takes the id, the fields in the order of init_order, or of
+    fields if None, and the relationships, all positionally.
+    """
+    def decorate(cls):
+        cls.json_api_fields = fields
+        cls.from_json_api = staticmethod(compile_decoder(cls, _type, fields))
+        if "__init__" not in vars(cls):
+            order = init_order if init_order is not None else tuple(field.name for field in fields)
+            cls.__init__ = compile_initializer(cls, _type, fields, order)
+        return cls
+
+    return decorate
+
+
+def json_api_request(*fields: Field, _type: Optional[str] = None, relationships: Optional[str] = "relationships"):
+    """
+    Class decorator generating the to_json_api of a request from its fields. The JSON:API type is _type, or the
+    type attribute of the request if None, and relationships names the attribute holding its relationships, if any.
+    Every field must be a slot of the request, so its constructor and its fields can't drift apart unnoticed.
+    """
+    def decorate(cls):
+        slots = {slot for c in cls.__mro__ for slot in getattr(c, "__slots__", ())}
+        missing = [field.name for field in fields if field.name not in slots]
+        if missing:
+            raise TypeError(f"{cls.__qualname__} has no slots for its fields {', '.join(missing)}")
+
+        cls.json_api_fields = fields
+        cls.to_json_api = compile_encoder(cls, _type, fields, relationships)
+        return cls
+
+    return decorate
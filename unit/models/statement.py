@@ -3,6 +3,8 @@ from unit.models import *
 
 
 class StatementDTO(object):
+    __slots__ = ("id", "type", "attributes", "relationships")
+
     def __init__(self, id: str, _type: str, period: str, relationships: Optional[Dict[str, Relationship]]):
         self.id = id
         self.type = _type
@@ -17,6 +19,8 @@ class StatementDTO(object):
 OutputType = Literal["html", "pdf"]
 
 class GetStatementParams(object):
+    __slots__ = ("statement_id", "output_type", "language", "customer_id")
+
     def __init__(self, statement_id: str, output_type: Optional[OutputType] = "html", language: Optional[str] = "en",
                  customer_id: Optional[str] = None):
         self.statement_id = statement_id
@@ -24,8 +28,32 @@ class GetStatementParams(object):
         self.language = language
         self.customer_id = customer_id
 
+    def to_dict(self) -> Dict:
+        parameters = {"language": self.language}
+        if self.customer_id:
+            parameters["filter[customerId]"] = self.customer_id
+        return parameters
+
+
+class StatementDownload(object):
+    """
+    A downloaded statement: its size in bytes, its hex digest when a checksum was asked for, and its content type.
+    path is set when it was written to a path, content holds its bytes when it was downloaded to memory.
+    """
+    __slots__ = ("size", "checksum", "content_type", "path", "content")
+
+    def __init__(self, size: int, checksum: Optional[str], content_type: Optional[str], path: Optional[str] = None,
+                 content: Optional[memoryview] = None):
+        self.size = size
+        self.checksum = checksum
+        self.content_type = content_type
+        self.path = path
+        self.content = content
+
 
 class ListStatementParams(UnitParams):
+    __slots__ = ("limit", "offset", "customer_id", "account_id", "sort", "period")
+
     def __init__(self, limit: int = 100, offset: int = 0, customer_id: Optional[str] = None,
                  account_id: Optional[str] = None, sort: Optional[Literal["period", "-period"]] = None,
                  period: Optional[str] = None):
@@ -9,6 +9,8 @@ WebhookStatus = Literal["Enabled", "Disabled"]
 
 
 class WebhookDTO(object):
+    __slots__ = ("id", "type", "attributes")
+
     def __init__(self, id: str, created_at: datetime, label: str, url: str, status: WebhookStatus,
                  content_type: ContentType, token: str):
         self.id = id
@@ -24,6 +26,8 @@ class WebhookDTO(object):
 
 
 class CreateWebhookRequest(object):
+    __slots__ = ("label", "url", "token", "content_type")
+
     def __init__(self, label: str, url: str, token: str, content_type: ContentType):
         self.label = label
         self.url = url
@@ -50,6 +54,8 @@ class CreateWebhookRequest(object):
 
 
 class PatchWebhookRequest(object):
+    __slots__ = ("webhook_id", "label", "url", "content_type", "token")
+
     def __init__(self, webhook_id: str, label: Optional[str] = None, url: Optional[str] = None,
                  content_type: Optional[ContentType] = None, token: Optional[str] = None):
         self.webhook_id = webhook_id
@@ -82,6 +88,8 @@ class PatchWebhookRequest(object):
 
 
 class ListWebhookParams(UnitParams):
+    __slots__ = ("limit", "offset")
+
     def __init__(self, limit: int = 100, offset: int = 0):
         self.limit = limit
         self.offset = offset
@@ -1,11 +1,66 @@
-from datetime import date, datetime
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+_iso_datetime = re.compile(r"(\d{4})-(\d\d)-(\d\d)[Tt ](\d\d):(\d\d):(\d\d)(?:\.(\d+))?([Zz]|[+-]\d\d:?\d\d)", re.ASCII)
+_timezones = {"Z": timezone.utc, "z": timezone.utc, "+00:00": timezone.utc, "-00:00": timezone.utc}
+
+
+def get_timezone(offset: str) -> timezone:
+    """
+    Returns a cached timezone for an ISO-8601 offset such as Z, +02:00 or -0500.
+    """
+    tz = _timezones.get(offset)
+    if tz is None:
+        if len(offset) not in (5, 6) or offset[0] not in "+-" or not offset[1:3].isdigit() or \
+                not offset[-2:].isdigit() or (len(offset) == 6 and offset[3] != ":"):
+            raise ValueError(f"Invalid UTC offset: {offset}")
+
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:]))
+        tz = timezone(-delta if offset[0] == "-" else delta)
+        _timezones[offset] = tz
+
+    return tz
+
+
+def parse_iso_datetime(dt: str) -> datetime:
+    """
+    Parses the timestamps the API emits, YYYY-MM-DDTHH:MM:SS with an optional fraction of any number of digits
+    and a Z or numeric offset, without going through strptime.
+    """
+    match = _iso_datetime.fullmatch(dt)
+    if match is None:
+        raise ValueError(f"Invalid ISO-8601 datetime: {dt}")
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    int(fraction[:6].ljust(6, "0")) if fraction else 0, get_timezone(offset))
+
+
+if sys.version_info >= (3, 11):
+    def _parse_datetime(dt: str) -> datetime:
+        # from 3.11 fromisoformat accepts Z and fractions of any length, and it is implemented in C, but it also
+        # accepts dates, naive timestamps and ISO-8601 forms the API never emits, so the pattern still decides
+        if _iso_datetime.fullmatch(dt) is None:
+            raise ValueError(f"Invalid ISO-8601 datetime: {dt}")
+
+        try:
+            return datetime.fromisoformat(dt)
+        except ValueError:
+            # a lowercase t or z, which fromisoformat rejects
+            return parse_iso_datetime(dt)
+else:
+    _parse_datetime = parse_iso_datetime
 
 
 def to_datetime(dt: str):
     if dt is None:
         return None
 
-    return datetime.strptime(dt, "%Y-%m-%dT%H:%M:%S.%f%z")
+    try:
+        return _parse_datetime(dt)
+    except ValueError:
+        return datetime.strptime(dt, "%Y-%m-%dT%H:%M:%S.%f%z")
 
 def from_datetime(dt: datetime):
     return dt.isoformat(timespec='milliseconds') + "Z"
@@ -0,0 +1,72 @@
+"""
+JSON encoding and decoding of request and response bodies, backed by orjson or ujson when one of them is installed
+and by the standard library otherwise. Every backend encodes dates and datetimes to ISO-8601 and models to their
+to_dict(), like UnitEncoder, and decodes bytes without decoding them to str first.
+"""
+import json
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def default(obj):
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def stdlib_dumps(obj) -> bytes:
+    return json.dumps(obj, default=default).encode()
+
+
+def orjson_dumps(obj) -> bytes:
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def ujson_dumps(obj) -> bytes:
+    return ujson.dumps(obj, default=default, escape_forward_slashes=False).encode()
+
+
+def accepts_default(module) -> bool:
+    """
+    Whether module.dumps takes a default function. Older ujson releases don't and are left out of the backends.
+    """
+    try:
+        module.dumps(None, default=default)
+    except TypeError:
+        return False
+
+    return True
+
+
+backends = {"json": (stdlib_dumps, json.loads)}
+if ujson is not None and accepts_default(ujson):
+    backends["ujson"] = (ujson_dumps, ujson.loads)
+if orjson is not None:
+    backends["orjson"] = (orjson_dumps, orjson.loads)
+
+
+def use(name: str):
+    """
+    Switches every client to the backend name: orjson, ujson or json. The fastest one installed is used by default.
+    """
+    global backend, dumps, loads
+    if name not in backends:
+        raise ValueError(f"JSON backend {name} is not installed, available backends: {', '.join(backends)}")
+
+    backend = name
+    dumps, loads = backends[name]
+
+
+use("orjson" if orjson is not None else "ujson" if ujson is not None else "json")
@@ -0,0 +1,136 @@
+import codecs
+import json
+from typing import Iterable, Iterator, List, Tuple
+
+_whitespace = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+START, KEY, COLON, VALUE, ELEMENT, AFTER_ELEMENT, AFTER_VALUE, DONE = range(8)
+
+
+class JsonStreamParser(object):
+    """
+    Incremental parser of a JSON object that is fed its text chunk by chunk as it arrives.
+    Every member of the object is emitted as a (key, value) event once complete, except the arrays of the members
+    named in stream_keys: each of their elements is emitted as a (key, element) event as soon as it is complete,
+    so an array is never held in memory as a whole. Only the unparsed tail of the text is buffered.
+    """
+
+    def __init__(self, stream_keys: Iterable[str] = ("data",)):
+        self.stream_keys = frozenset(stream_keys)
+        self.state = START
+        self.buffer = ""
+        self.position = 0
+        self.key = None
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, object]]:
+        self.buffer = self.buffer[self.position:] + self.decoder.decode(chunk)
+        self.position = 0
+        return self.__parse(False)
+
+    def close(self) -> List[Tuple[str, object]]:
+        self.buffer = self.buffer[self.position:] + self.decoder.decode(b"", final=True)
+        self.position = 0
+        events = self.__parse(True)
+        if self.state != DONE:
+            raise ValueError("Truncated JSON document")
+
+        return events
+
+    def __parse(self, final: bool) -> List[Tuple[str, object]]:
+        events = []
+        while True:
+            char = self.__next()
+            if char is None:
+                return events
+
+            state = self.state
+            if state == START:
+                self.__expect(char, "{")
+                self.state = KEY
+            elif state == KEY or state == AFTER_VALUE:
+                if char == "}":
+                    self.position += 1
+                    self.state = DONE
+                elif state == AFTER_VALUE:
+                    self.__expect(char, ",")
+                    self.state = KEY
+                else:
+                    value = self.__value(final)
+                    if value is None:
+                        return events
+                    self.key = value[0]
+                    self.state = COLON
+            elif state == COLON:
+                self.__expect(char, ":")
+                self.state = VALUE
+            elif state == VALUE:
+                if char == "[" and self.key in self.stream_keys:
+                    self.position += 1
+                    self.state = ELEMENT
+                else:
+                    value = self.__value(final)
+                    if value is None:
+                        return events
+                    events.append((self.key, value[0]))
+                    self.state = AFTER_VALUE
+            elif state == ELEMENT or state == AFTER_ELEMENT:
+                if char == "]":
+                    self.position += 1
+                    self.state = AFTER_VALUE
+                elif state == AFTER_ELEMENT:
+                    self.__expect(char, ",")
+                    self.state = ELEMENT
+                else:
+                    value = self.__value(final)
+                    if value is None:
+                        return events
+                    events.append((self.key, value[0]))
+                    self.state = AFTER_ELEMENT
+            else:
+                raise ValueError(f"Unexpected {char!r} after the end of the JSON document")
+
+    def __next(self):
+        """
+        The next character that isn't whitespace, None if the buffer is exhausted.
+        """
+        buffer, position = self.buffer, self.position
+        while position < len(buffer) and buffer[position] in _whitespace:
+            position += 1
+        self.position = position
+        return buffer[position] if position < len(buffer) else None
+
+    def __expect(self, char: str, expected: str):
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at {self.position} of the JSON document, got {char!r}")
+        self.position += 1
+
+    def __value(self, final: bool):
+        """
+        Decodes the value at the current position, None if it isn't complete yet. A value running up to the end of
+        the buffer might continue in the next chunk, e.g. a number, so it is only complete once more text follows.
+        """
+        try:
+            value, end = _decoder.raw_decode(self.buffer, self.position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+
+        if end == len(self.buffer) and not final:
+            return None
+
+        self.position = end
+        return (value,)
+
+
+def iter_json_members(chunks: Iterable[bytes], stream_keys: Iterable[str] = ("data",)) -> Iterator[Tuple[str, object]]:
+    """
+    Parses the JSON object whose text is split into chunks, yielding its members, or the elements of the arrays
+    named in stream_keys, as they are complete. See JsonStreamParser.
+    """
+    parser = JsonStreamParser(stream_keys)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -0,0 +1,51 @@
+import importlib
+import threading
+from typing import Dict, Callable
+
+
+class LazyResource(object):
+    """
+    Resource attribute of a client, e.g. payments = LazyResource("unit.api.payment_resource", "PaymentResource").
+    The resource's module is imported and the resource built with the client's api_url, token, retries and transport
+    the first time the attribute is read. It is then kept in the client's __dict__, which takes precedence over
+    the descriptor, so later reads are plain attribute lookups.
+    """
+    __slots__ = ("module", "name", "attribute", "lock")
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.attribute = None
+        self.lock = threading.Lock()
+
+    def __set_name__(self, owner, attribute: str):
+        self.attribute = attribute
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+
+        with self.lock:
+            resource = client.__dict__.get(self.attribute)
+            if resource is None:
+                cls = getattr(importlib.import_module(self.module), self.name)
+                resource = client.__dict__[self.attribute] = cls(client.api_url, client.token, client.retries,
+                                                                 client.transport)
+
+        return resource
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str]) -> Callable[[str], object]:
+    """
+    Module __getattr__ of package importing the module of an attribute, as given by attributes, on first access.
+    """
+    def __getattr__(name: str):
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module), name)
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    return __getattr__